@@ -1,16 +1,28 @@
 import decky
 import asyncio
+import bisect
+import concurrent.futures
+import ctypes
+import errno
+import functools
 import glob
+import grp
 import json
 import os
+import pwd
+import random
 import re
+import select
 import sys
-import traceback
+import urllib.error
+import urllib.request
 import psutil
 import subprocess
 import shutil
+import ssl
 import time
-from typing import Dict, Any, Optional, List, Tuple
+from types import MappingProxyType
+from typing import Awaitable, Dict, Any, FrozenSet, Optional, List, Set, Tuple
 
 # SteamOS Manager (steamos-manager) DBus integration
 # Available on SteamFork 3.8+ and SteamOS 3.5+
@@ -24,6 +36,20 @@ EXTERNAL_MANAGER_DBUS_IFACE = "com.steampowered.SteamOSManager1.ExternalManager1
 EXTERNAL_MANAGER_SUBSYSTEM_POWER = "power"
 EXTERNAL_MANAGER_SUBSYSTEM_FAN = "fan"
 
+# logind announces suspend (true) and resume (false) with PrepareForSleep
+LOGIND_PREPARE_FOR_SLEEP_MATCH = ("type='signal',sender='org.freedesktop.login1',"
+                                  "interface='org.freedesktop.login1.Manager',member='PrepareForSleep'")
+
+# A suspending write to /sys/power/state only returns after resume, and
+# the IN_MODIFY it raises (<sys/inotify.h>) comes with that return
+SYS_POWER_STATE = "/sys/power/state"
+IN_MODIFY = 0x2
+
+# Fallback wake polling: tick period, and how much suspended time between
+# ticks counts as a suspend/resume cycle rather than clock noise
+WAKE_POLL_INTERVAL = 5.0  # seconds
+WAKE_SUSPEND_THRESHOLD = 1.0  # seconds
+
 # Add plugin root and py_modules directory to Python path
 # The installed plugin flattens py_modules/ to the plugin root,
 # so we need BOTH paths for repo dev and installed environments.
@@ -34,34 +60,602 @@ py_modules_path = os.path.join(os.path.dirname(__file__), 'py_modules')
 if py_modules_path not in sys.path:
     sys.path.insert(0, py_modules_path)
 
+# amdgpu pp_dpm_sclk marks the active level with '*' (e.g. "1: 800Mhz *")
+GPU_SCLK_ACTIVE_RE = re.compile(rb'(\d+)\s*mhz\s*\*', re.IGNORECASE)
+GPU_SCLK_PATHS = (
+    "/sys/class/drm/card0/device/pp_dpm_sclk",
+    "/sys/class/drm/card1/device/pp_dpm_sclk",
+)
+
+# One /proc/bus/input/devices block: "I: Bus=.. Vendor=.. Product=.. Version=..",
+# then "N: Name=...", then P/S/U lines up to "H: Handlers=...". Lines inside a
+# block are never empty, so a match can't run into the next device.
+INPUT_DEVICE_RE = re.compile(
+    rb'^I:[^\n]*?\bVendor=([0-9a-fA-F]+)[^\n]*?\bProduct=([0-9a-fA-F]+)[^\n]*\n'
+    rb'N: Name=([^\n]*)\n'
+    rb'(?:[^\n]+\n)*?'
+    rb'H: Handlers=([^\n]*)',
+    re.MULTILINE,
+)
+
+# pcie_aspm policy lists every policy and brackets the active one
+# (e.g. "default performance [powersave] powersupersave")
+ASPM_POLICY_RE = re.compile(r'\[(\w+)\]')
+
+# Deep C-states reported in the get_cpu_cstate_info summary, by depth
+CSTATE_DEPTH = MappingProxyType({
+    "C3": 3, "C6": 6, "C7": 7, "C8": 8, "C9": 9, "C10": 10,
+})
+CSTATE_SUMMARY_UNAVAILABLE = MappingProxyType({
+    'supports_cstates': False,
+    'deepest_cstate': 'Unknown',
+    'total_online_cpus': 0,
+})
+
+# Safe TDP maximums (watts) by device family for calculate_safe_tdp_limits,
+# checked in order; anything unmatched gets SAFE_TDP_FALLBACK_MAX
+SAFE_TDP_FAMILIES = (
+    (('steam deck', 'jupiter', 'galileo'), 15),
+    (('rog ally', 'rc71l', 'rc72l'), 30),
+    (('legion go', 'lenovo'), 30),
+    (('ayaneo', 'aya neo'), 33),
+    (('onex', 'gpd'), 28),
+)
+SAFE_TDP_FALLBACK_MAX = 25  # Conservative fallback
+
+# Gaming handhelds have specific identifiers in their DMI name
+# (see get_device_classification)
+HANDHELD_NAME_RE = re.compile("|".join(map(re.escape, (
+    "ayaneo", "rog ally", "steam deck", "legion go",
+    "onexplayer", "oxp", "gpd", "win max", "aya neo", "ally",
+))))
+
+# Fan cooling profiles exposed by steamfork_fan_controller
+FAN_PROFILES = ("auto", "quiet", "moderate", "aggressive")
+
+# USB devices whose name/manufacturer contains any of these are never
+# autosuspended (shared by get_usb_autosuspend_status/set_usb_autosuspend)
+CRITICAL_DEVICE_EXCLUSIONS = (
+    # Gaming controllers - held open by driver, can't suspend
+    "gamepad", "controller", "joystick", "xbox", "playstation", "nintendo",
+    "game", "joy", "pad", "stick",
+    # Keyboards - must never suspend, even with wakeup capability
+    "keyboard",
+    # Pointing devices - many don't auto-resume from suspend
+    "mouse", "touchpad", "trackpad", "touchscreen",
+    # Generic HID/input patterns - too broad, may match critical devices
+    "hid", "input", "builtin", "internal", "integrated",
+    # Handheld-specific controllers
+    "ayaneo", "rog", "ally", "steam", "deck", "onexplayer", "gpd",
+)
+# One alternation instead of a substring test per pattern. Alternatives are
+# tried longest first, so the match logged as the exclusion reason is the
+# most specific pattern at that position ("gamepad", not "game").
+CRITICAL_DEVICE_EXCLUSION_RE = re.compile("|".join(
+    re.escape(pattern)
+    for pattern in sorted(CRITICAL_DEVICE_EXCLUSIONS, key=len, reverse=True)
+))
+
+# Interfaces read per USB device when looking for a HID class. Controllers
+# and keyboards expose HID in their first interfaces; anything that registers
+# an input device is also caught by the VID/PID match.
+USB_HID_SCAN_MAX_INTERFACES = 4
+
+# Threads inspecting USB devices concurrently; a dedicated pool so a scan of
+# dozens of devices doesn't fan out across the whole default executor
+USB_SCAN_MAX_WORKERS = 8
+
+# get_usb_autosuspend_status and set_usb_autosuspend usually run back to
+# back; share one /proc/bus/input/devices parse between them. The input
+# core makes that file pollable (readable once the device list changes),
+# so the cache is invalidated by poll(); the TTL only applies when the
+# file can't be polled.
+INPUT_DEVICES_PATH = "/proc/bus/input/devices"
+INPUT_VID_PID_CACHE_TTL = 5.0  # seconds
+
+# Static fields for auto-created AC/battery default profiles.
+# schedutil is the balanced default: it unlocks the full EPP set on
+# amd-pstate-epp (governor=performance only exposes EPP=performance) and
+# is responsive enough for handheld use. tdp, cpuCores and epp depend on
+# the device and power state and are filled in at creation time.
+AUTO_PROFILE_DEFAULTS = MappingProxyType({
+    "cpuBoost": True,
+    "smt": True,
+    "governor": "schedutil",
+    "gpuMode": "auto",
+})
+
+# get_cpu_system_info fallbacks: without a CPU manager (core counts are
+# filled in per call) and after an error
+CPU_SYSTEM_INFO_DEFAULT = MappingProxyType({
+    'scaling_driver': 'unknown',
+    'available_governors': ('performance', 'powersave', 'schedutil'),
+    'current_governor': 'unknown',
+    'available_epp_options': ('performance', 'balance_performance', 'balance_power', 'power'),
+    'current_epp': 'unknown',
+    'supports_cpu_boost': False,
+    'cpu_boost_enabled': False,
+    'supports_smt': False,
+    'smt_enabled': False,
+    'supports_epp': False,
+    'pstate_status': None,
+})
+CPU_SYSTEM_INFO_ERROR = MappingProxyType({
+    **CPU_SYSTEM_INFO_DEFAULT,
+    'scaling_driver': 'error',
+    'available_governors': ('performance', 'powersave'),
+    'available_epp_options': ('performance', 'power'),
+    'online_cpus': 2,
+    'total_cpus': 4,
+    'max_cpu_cores': 4,
+})
+
 # Debug configuration
 DEBUG_ENABLED = os.environ.get('POWERDECK_DEBUG', 'false').lower() == 'true'
 DISK_LOGGING_ENABLED = os.environ.get('POWERDECK_DISK_LOGGING', 'false').lower() == 'true'
 
+# Per-profile JSON files live in the decky plugin settings dir rather than
+# ~/.config (which is /root/.config and read-only on SteamFork). Fall back
+# to /tmp if the settings dir is unavailable. Resolved once at import.
+def _resolve_profiles_dir() -> str:
+    try:
+        import decky_plugin
+        return os.path.join(decky_plugin.DECKY_PLUGIN_SETTINGS_DIR, "profiles")
+    except (ImportError, AttributeError):
+        # Fallback: use /tmp which is always writable
+        return "/tmp/powerdeck/profiles"
+
+PROFILES_DIR = _resolve_profiles_dir()
+
+def read_sysfs_attr(path: str, size: int = 4096) -> Optional[str]:
+    """Read and strip a sysfs attribute with a single read(); None if it doesn't exist
+
+    Other errors propagate so callers can tell "absent" from "unreadable".
+    sysfs attributes are at most one page, so one read returns everything.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        return os.read(fd, size).decode().strip()
+    finally:
+        os.close(fd)
+
+def write_sysfs_attr(path: str, value: str) -> None:
+    """Write value to a sysfs/procfs attribute with a single os.write()
+
+    No O_CREAT/O_TRUNC and no text buffer: the kernel takes the whole value
+    in one write. Raises OSError like open() does.
+    """
+    fd = os.open(path, os.O_WRONLY)
+    try:
+        os.write(fd, value.encode())
+    finally:
+        os.close(fd)
+
+def read_sysfs_file(path: str) -> Optional[str]:
+    """Read and strip a small sysfs/procfs file; None if it can't be read"""
+    try:
+        return read_sysfs_attr(path)
+    except (OSError, UnicodeDecodeError):
+        return None
+
+def write_sysfs_batch(writes: List[Tuple[str, str]]) -> List[Optional[OSError]]:
+    """Write each (path, value) pair in order; one error (or None) per write
+
+    Lets callers push a whole batch of sysfs writes through a single
+    executor job instead of blocking the event loop once per file.
+    """
+    errors: List[Optional[OSError]] = []
+    for path, value in writes:
+        try:
+            write_sysfs_attr(path, value)
+            errors.append(None)
+        except OSError as e:
+            errors.append(e)
+    return errors
+
+def list_usb_control_files() -> List[str]:
+    """power/control paths of every USB device under /sys/bus/usb/devices"""
+    control_files = []
+    try:
+        with os.scandir("/sys/bus/usb/devices") as entries:
+            for entry in entries:
+                control_file = os.path.join(entry.path, "power", "control")
+                if os.path.exists(control_file):
+                    control_files.append(control_file)
+    except FileNotFoundError:
+        pass
+    return control_files
+
+def usb_interface_sort_key(name: str) -> Tuple[int, ...]:
+    """Numeric sort key for a "<bus>-<port>:<config>.<iface>" interface name
+
+    Plain string order would put "1-1:1.10" before "1-1:1.2".
+    """
+    try:
+        return tuple(int(part) for part in name.rpartition(":")[2].split("."))
+    except ValueError:
+        return (sys.maxsize,)
+
+def inspect_usb_device(device_path: str,
+                       input_device_vid_pids: FrozenSet[Tuple[str, str]]) -> Tuple[bool, str, str]:
+    """Decide whether a USB device must be kept out of autosuspend
+
+    Returns (should_exclude, exclusion_reason, device_info). Blocking sysfs
+    reads; run it in an executor. Read errors propagate so the caller can
+    exclude the device for safety.
+    """
+    should_exclude = False
+    exclusion_reason = ""
+    device_info = ""
+    device_name = os.path.basename(device_path)
+
+    # First, check if this USB device matches any input device VID/PID
+    # (missing attributes read as None; other read errors propagate)
+    device_vendor = read_sysfs_attr(os.path.join(device_path, "idVendor"))
+    device_product = read_sysfs_attr(os.path.join(device_path, "idProduct"))
+
+    if device_vendor is not None and device_product is not None:
+        if (device_vendor, device_product) in input_device_vid_pids:
+            should_exclude = True
+            exclusion_reason = f"matches input device VID/PID {device_vendor}:{device_product}"
+
+    # Get device product name and manufacturer if available
+    product_name = read_sysfs_attr(os.path.join(device_path, "product"))
+    if product_name is not None:
+        device_info = product_name.lower()
+
+    manufacturer = read_sysfs_attr(os.path.join(device_path, "manufacturer"))
+    if manufacturer is not None:
+        device_info += " " + manufacturer.lower()
+
+    # Check interface class (HID devices are often controllers/keyboards).
+    # Interfaces are the "<bus>-<port>:<config>.<iface>" children of the device
+    # dir; only the lowest-numbered few are read (see USB_HID_SCAN_MAX_INTERFACES).
+    with os.scandir(device_path) as entries:
+        interface_names = sorted((entry.name for entry in entries if ":" in entry.name),
+                                 key=usb_interface_sort_key)
+    interface_paths = [os.path.join(device_path, name) for name in interface_names]
+    for interface_path in interface_paths[:USB_HID_SCAN_MAX_INTERFACES]:
+        interface_class = read_sysfs_attr(os.path.join(interface_path, "bInterfaceClass"))
+        # Class 03 = HID (Human Interface Device) - often controllers/keyboards
+        if interface_class == "03":
+            device_info += " hid"
+            break
+
+    # If not already excluded by VID/PID, check name-based exclusion patterns
+    if not should_exclude:
+        device_check_string = f"{device_name} {device_info}".lower()
+        match = CRITICAL_DEVICE_EXCLUSION_RE.search(device_check_string)
+        if match:
+            should_exclude = True
+            exclusion_reason = f"matches pattern '{match.group(0)}'"
+
+    return should_exclude, exclusion_reason, device_info
+
 # Version management
+# Version of the running code; installing an update restarts the plugin
+# loader, so it can't change within one process
+_plugin_version: Optional[str] = None
+
 def get_plugin_version() -> str:
-    """Get plugin version from VERSION file or plugin.json fallback"""
+    """Get plugin version from VERSION file or plugin.json fallback (read once)"""
+    global _plugin_version
+    if _plugin_version is not None:
+        return _plugin_version
     try:
         # First try to read from VERSION file (single source of truth)
-        version_file_path = os.path.join(os.path.dirname(__file__), "VERSION")
+        version_file_path = os.path.join(plugin_root, "VERSION")
         if os.path.exists(version_file_path):
             with open(version_file_path, 'r') as f:
                 version = f.read().strip()
                 if version:
+                    _plugin_version = version
                     return version
         
         # Fallback to plugin.json
-        plugin_json_path = os.path.join(os.path.dirname(__file__), "plugin.json")
+        plugin_json_path = os.path.join(plugin_root, "plugin.json")
         if os.path.exists(plugin_json_path):
-            with open(plugin_json_path, 'r') as f:
-                plugin_data = json.load(f)
-                return plugin_data.get("version", "unknown")
+            with open(plugin_json_path, 'rb') as f:
+                plugin_data = json_loads(f.read())
+            version = plugin_data.get("version")
+            if version:
+                _plugin_version = version
+                return version
         
         return "unknown"  # Fallback when VERSION file and plugin.json both fail
     except Exception as e:
         decky.logger.error(f"Failed to get plugin version: {e}")
         return "unknown"  # Ultimate fallback version 
 
+# CA bundles to fall back on when OpenSSL's compiled-in default location is
+# missing (stripped-down or non-standard distros); checked in order
+CA_BUNDLE_PATHS = (
+    "/etc/ssl/certs/ca-certificates.crt",
+    "/etc/pki/tls/certs/ca-bundle.crt",
+    "/etc/ssl/cert.pem",
+)
+
+# Verified SSL context for GitHub requests. Building one parses the system
+# CA bundle, so it's created on first use and then reused.
+_ssl_context: Optional[ssl.SSLContext] = None
+
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the shared certificate-verifying SSL context
+
+    Update downloads are installed as root, so verification is never
+    turned off; a system without OpenSSL's default CA paths gets the
+    first bundle found in CA_BUNDLE_PATHS instead.
+    """
+    global _ssl_context
+    if _ssl_context is None:
+        ctx = ssl.create_default_context()
+        default_paths = ssl.get_default_verify_paths()
+        if not (default_paths.cafile or default_paths.capath):
+            for path in CA_BUNDLE_PATHS:
+                if os.path.isfile(path):
+                    ctx.load_verify_locations(cafile=path)
+                    break
+        _ssl_context = ctx
+    return _ssl_context
+
+# urllib opener shared by every GitHub request for the plugin's lifetime,
+# so the handler chain and headers are set up only once
+_url_opener: Optional[urllib.request.OpenerDirector] = None
+
+def get_url_opener() -> urllib.request.OpenerDirector:
+    """Return the shared opener for GitHub requests"""
+    global _url_opener
+    if _url_opener is None:
+        opener = urllib.request.build_opener(urllib.request.HTTPSHandler(context=get_ssl_context()))
+        opener.addheaders = [('User-Agent', 'PowerDeck')]
+        _url_opener = opener
+    return _url_opener
+
+# Release tags are "v1.2.3" or "1.2.3"
+RELEASE_TAG_RE = re.compile(r'v?(.+)')
+
+GITHUB_RELEASE_API_URL = "https://api.github.com/repos/fewtarius/PowerDeck/releases/latest"
+
+# Release info is shared by get_latest_version/check_for_updates, which
+# the UI tends to call back to back
+GITHUB_RELEASE_CACHE_TTL = 300.0  # seconds
+
+# First retry delay after a failed background update check; doubles per
+# failure up to the regular check interval
+UPDATE_RETRY_INITIAL_DELAY = 30.0  # seconds
+
+# Quiet period before a burst of update_and_apply_settings calls (slider
+# drags, profile switches) is merged and applied once
+SETTINGS_APPLY_DEBOUNCE = 0.15  # seconds
+
+# Optional device controller methods behind the get_rog_ally_*/set_rog_ally_*
+# RPCs, resolved once per controller; see _set_device_controller
+DEVICE_CONTROLLER_METHODS = (
+    'get_device_info', 'get_power_limits', 'get_platform_profile',
+    'get_thermal_throttle_policy', 'get_fan_status', 'get_battery_charge_limit',
+    'get_mcu_powersave', 'set_mcu_powersave',
+)
+
+def fetch_latest_release(etag: Optional[str] = None,
+                         cached: Optional[Dict[str, Any]] = None) -> Optional[Tuple[Dict[str, Any], Optional[str]]]:
+    """Fetch latest release data from GitHub API (blocking; run in an executor)
+
+    With etag and the matching cached data, sends If-None-Match so an
+    unchanged release comes back as a bodyless 304 (which also doesn't count
+    against the API rate limit). Returns (data, etag) or None on failure.
+    """
+    headers = {"Accept": "application/vnd.github+json"}
+    if etag and cached is not None:
+        headers["If-None-Match"] = etag
+    request = urllib.request.Request(GITHUB_RELEASE_API_URL, headers=headers)
+
+    try:
+        with get_url_opener().open(request, timeout=10) as response:
+            return json_loads(response.read()), response.headers.get("ETag")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached is not None:
+            return cached, etag
+        if e.code == 404:
+            decky.logger.info("No releases found in GitHub repository")
+        else:
+            decky.logger.error(f"HTTP error fetching release: {e}")
+    except Exception as e:
+        decky.logger.error(f"Error fetching release: {e}")
+    return None
+
+def find_release_download_url(assets: List[Dict[str, Any]], tag_name: str) -> str:
+    """Return the first release asset that looks like the plugin zip, else the tag's source archive"""
+    for asset in assets:
+        asset_name = asset.get('name', '').lower()
+        if asset_name.endswith('.zip') or 'powerdeck' in asset_name:
+            download_url = asset.get('browser_download_url')
+            if download_url:
+                return download_url
+            break
+    return f"https://github.com/fewtarius/PowerDeck/archive/refs/tags/{tag_name}.zip"
+
+DOWNLOAD_CHUNK_SIZE = 256 * 1024  # bytes
+
+def download_file(url: str, dest_path: str, timeout: int = 30) -> None:
+    """Download url to dest_path (blocking; run in an executor); raises on failure"""
+    with get_url_opener().open(url, timeout=timeout) as response:
+        with open(dest_path, 'wb') as f:
+            # Stream in chunks rather than holding the whole archive in memory
+            shutil.copyfileobj(response, f, DOWNLOAD_CHUNK_SIZE)
+
+# Directories in a release archive that the installed plugin never uses
+# (matched at any depth, so source-archive layouts are covered too)
+RELEASE_ARCHIVE_SKIP_DIRS: FrozenSet[str] = frozenset((
+    '.git', '.github', 'docs', 'screenshots', 'node_modules',
+))
+
+# Files that mark the plugin root inside a release archive
+PLUGIN_ROOT_MARKERS: FrozenSet[str] = frozenset(('main.py', 'plugin.json'))
+
+def extract_release_archive(archive_path: str, extract_dir: str) -> Optional[str]:
+    """Extract a release zip into extract_dir, skipping RELEASE_ARCHIVE_SKIP_DIRS
+
+    Returns the shallowest extracted directory holding PLUGIN_ROOT_MARKERS
+    (None if there isn't one), noted while extracting so the tree doesn't
+    have to be walked afterwards. zipfile checks each member's CRC as it is
+    read, so a corrupt archive raises here without a separate testzip() pass.
+    """
+    import zipfile
+
+    markers_by_dir: Dict[str, set] = {}
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            parts = info.filename.split('/')
+            if not RELEASE_ARCHIVE_SKIP_DIRS.isdisjoint(parts[:-1]):
+                continue
+            extracted_path = zip_ref.extract(info, extract_dir)
+            if parts[-1] in PLUGIN_ROOT_MARKERS and not info.is_dir():
+                markers_by_dir.setdefault(os.path.dirname(extracted_path), set()).add(parts[-1])
+
+    plugin_dirs = [directory for directory, markers in markers_by_dir.items()
+                   if markers == PLUGIN_ROOT_MARKERS]
+    if not plugin_dirs:
+        return None
+    return min(plugin_dirs, key=lambda directory: (directory.count(os.sep), directory))
+
+# Top-level directory of the plugin inside a release archive
+PLUGIN_ARCHIVE_DIR = "PowerDeck/"
+
+def extract_plugin_release(archive_path: str, plugin_dir: str, extract_dir: str) -> None:
+    """Extract a release zip: PLUGIN_ARCHIVE_DIR into plugin_dir, the rest into extract_dir (blocking)
+
+    Plugin files are streamed straight to their final tree, so installing
+    doesn't need another copy. RELEASE_ARCHIVE_SKIP_DIRS are skipped.
+    """
+    import zipfile
+
+    os.makedirs(plugin_dir)
+    with zipfile.ZipFile(archive_path, 'r') as zip_ref:
+        for info in zip_ref.infolist():
+            parts = info.filename.split('/')
+            if not RELEASE_ARCHIVE_SKIP_DIRS.isdisjoint(parts[:-1]):
+                continue
+            if not info.filename.startswith(PLUGIN_ARCHIVE_DIR):
+                zip_ref.extract(info, extract_dir)
+                continue
+            relative = info.filename[len(PLUGIN_ARCHIVE_DIR):]
+            # zip_ref.extract sanitizes member paths; do the same here
+            if not relative or '..' in parts or relative.startswith('/'):
+                continue
+            dest_path = os.path.join(plugin_dir, relative)
+            if info.is_dir():
+                os.makedirs(dest_path, exist_ok=True)
+                continue
+            os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+            with zip_ref.open(info) as src, open(dest_path, 'wb') as dest:
+                shutil.copyfileobj(src, dest, DOWNLOAD_CHUNK_SIZE)
+
+def move_directory(source_dir: str, target_dir: str) -> None:
+    """Move a directory tree with a rename, copying only across filesystems (blocking)"""
+    try:
+        os.rename(source_dir, target_dir)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        try:
+            shutil.copytree(source_dir, target_dir, symlinks=True, copy_function=shutil.copy2)
+        except Exception:
+            shutil.rmtree(target_dir, ignore_errors=True)
+            raise
+        shutil.rmtree(source_dir)
+
+# Owner of installed plugin files, resolved once; None off-device
+try:
+    DECK_UID = pwd.getpwnam('deck').pw_uid
+    DECK_GID = grp.getgrnam('deck').gr_gid
+except KeyError:
+    DECK_UID = DECK_GID = None
+
+def chown_tree(path: str, uid: int, gid: int) -> None:
+    """chown -R in-process, only touching entries whose owner differs (blocking)"""
+    for root, dirs, files in os.walk(path):
+        for name in [root] + [os.path.join(root, entry) for entry in dirs + files]:
+            st = os.lstat(name)
+            if st.st_uid != uid or st.st_gid != gid:
+                os.lchown(name, uid, gid)
+
+def fsync_tree(path: str) -> None:
+    """fsync every file and directory under path, then path's parent (blocking)
+
+    Files before the directories holding them, and the parent last so the
+    rename that put path in place is durable too.
+    """
+    def fsync_path(name: str, flags: int) -> None:
+        fd = os.open(name, flags)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    for root, dirs, files in os.walk(path, topdown=False):
+        for name in files:
+            file_path = os.path.join(root, name)
+            if not os.path.islink(file_path):
+                fsync_path(file_path, os.O_RDONLY)
+        fsync_path(root, os.O_RDONLY | os.O_DIRECTORY)
+    fsync_path(os.path.dirname(os.path.abspath(path)), os.O_RDONLY | os.O_DIRECTORY)
+
+def is_root_read_only() -> bool:
+    """Check whether / is mounted read-only, from /proc/self/mountinfo"""
+    read_only = False
+    with open('/proc/self/mountinfo', 'r') as f:
+        for line in f:
+            # Fields: mount ID, parent ID, major:minor, root, mount point, mount options, ...
+            fields = line.split()
+            if len(fields) > 5 and fields[4] == '/':
+                # The last entry for / is the one on top of any overmounts
+                read_only = 'ro' in fields[5].split(',')
+    return read_only
+
+async def run_blocking(func, *args, **kwargs):
+    """Run a blocking call in the default executor so the event loop keeps serving RPCs"""
+    return await asyncio.get_running_loop().run_in_executor(
+        None, functools.partial(func, *args, **kwargs)
+    )
+
+def suspended_time() -> float:
+    """Seconds the system has spent suspended since boot"""
+    return time.clock_gettime(time.CLOCK_BOOTTIME) - time.clock_gettime(time.CLOCK_MONOTONIC)
+
+def inotify_watch(path: str, mask: int) -> int:
+    """Return a non-blocking inotify fd watching path for mask; raises OSError"""
+    libc = ctypes.CDLL(None, use_errno=True)
+    fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+        err = ctypes.get_errno()
+        raise OSError(err, os.strerror(err))
+    if libc.inotify_add_watch(fd, os.fsencode(path), mask) < 0:
+        err = ctypes.get_errno()
+        os.close(fd)
+        raise OSError(err, os.strerror(err), path)
+    return fd
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Write data to path via a temp file and os.replace
+
+    Readers (and a crash mid-write) see either the old or the new file,
+    never a truncated one.
+    """
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 # Standardized logging functions
 def debug_log(message: str, *args, **kwargs):
     """Log debug messages only when debug mode is enabled"""
@@ -83,6 +677,67 @@ def error_log(message: str, *args, **kwargs):
     if DISK_LOGGING_ENABLED:
         decky.logger.error(f"[PowerDeck] {message}", *args, **kwargs)
 
+def rpc_safe(action: str, default: Any = None):
+    """Catch and log exceptions from an async Plugin RPC handler.
+
+    On failure logs "Failed to <action>: <error>" and returns default, or
+    default(error) when it is callable (for results that report the error).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            try:
+                return await func(self, *args, **kwargs)
+            except Exception as e:
+                decky.logger.error(f"Failed to {action}: {e}")
+                return default(e) if callable(default) else default
+        return wrapper
+    return decorator
+
+# Capability getters (supported features, governor lists, TDP limits)
+# only change on pstate/processor refresh, so the frontend settings
+# panels can reuse results for a short while instead of re-reading sysfs.
+CAPABILITY_CACHE_TTL = 30.0  # seconds
+
+def cached_capability(func):
+    """Memoize an async Plugin getter for CAPABILITY_CACHE_TTL seconds.
+
+    Entries live in Plugin._capability_cache and are dropped by
+    Plugin._invalidate_capability_cache() when the underlying state changes.
+    """
+    @functools.wraps(func)
+    async def wrapper(self, *args):
+        key = (func.__name__,) + args
+        now = time.monotonic()
+        entry = self._capability_cache.get(key)
+        if entry is not None and now - entry[0] < CAPABILITY_CACHE_TTL:
+            return entry[1]
+        result = await func(self, *args)
+        self._capability_cache[key] = (now, result)
+        return result
+    return wrapper
+
+def cached_reading(ttl: float):
+    """Memoize a polled async Plugin getter (fan, power limit, AC readings) for ttl seconds.
+
+    Bounds how often UI polling reaches sysfs/the EC however fast the
+    frontend asks. Entries live in Plugin._reading_cache; setters drop
+    them with Plugin._invalidate_reading_cache().
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args):
+            key = (func.__name__,) + args
+            now = time.monotonic()
+            entry = self._reading_cache.get(key)
+            if entry is not None and now < entry[0]:
+                return entry[1]
+            result = await func(self, *args)
+            self._reading_cache[key] = (now + ttl, result)
+            return result
+        return wrapper
+    return decorator
+
 # Import device-specific controllers
 try:
     from devices.rog_ally import get_rog_ally_controller
@@ -110,16 +765,55 @@ try:
     from device_manager import DeviceManager
     from power_core import PowerManager
     from profile_manager import ProfileManager
-    from cpu_manager import CPUManager
+    from cpu_manager import CPUManager, get_cpu_manager, parse_cpu_list
     from plugin_settings import PowerDeckSettings
     from steamfork_fan_control import steamfork_fan_controller
-    from sleep_wake_manager import get_sleep_wake_manager
+    from sleep_wake_manager import get_sleep_wake_manager, SLEEP_WAKE_EVENTS_FILE
     from inputplumber_manager import get_inputplumber_manager, ControllerMode
     device_support_available = True
 except ImportError as e:
     error_log(f"Device support modules not available: {e}")
     device_support_available = False
 
+# Import hardware-level AC power detection
+try:
+    from ac_power_manager import get_hardware_ac_status, supports_hardware_ac_detection
+    ac_detection_available = True
+except ImportError as e:
+    error_log(f"AC power detection module not available: {e}")
+    ac_detection_available = False
+
+# Import nl80211 WiFi power save control (avoids forking iw/iwconfig)
+try:
+    import wifi_power
+    nl80211_available = True
+except ImportError as e:
+    error_log(f"nl80211 WiFi power save module not available: {e}")
+    nl80211_available = False
+
+# packaging is only needed to compare release versions for update checks
+try:
+    from packaging import version as packaging_version
+except ImportError as e:
+    debug_log(f"packaging not available, update checking disabled: {e}")
+    packaging_version = None
+
+# orjson parses/serializes JSON (release info, plugin.json, profile files)
+# straight from/to bytes and noticeably faster; it isn't bundled, so fall
+# back to the stdlib module
+try:
+    from orjson import loads as json_loads, dumps as orjson_dumps, OPT_INDENT_2
+
+    def json_dumps_indented(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented JSON bytes"""
+        return orjson_dumps(obj, option=OPT_INDENT_2)
+except ImportError:
+    json_loads = json.loads
+
+    def json_dumps_indented(obj: Any) -> bytes:
+        """Serialize obj as 2-space indented JSON bytes"""
+        return json.dumps(obj, indent=2).encode()
+
 # Import processor detection modules
 try:
     from processor_detection import (
@@ -154,6 +848,11 @@ except ImportError as e:
     error_log(f"Sysfs power management not available: {e}")
     sysfs_support_available = False
 
+def read_processor_database_tdp() -> Tuple[int, Dict[str, Any]]:
+    """Return (database max TDP, processor info) for get_hybrid_tdp_limits (blocking)"""
+    _, proc_tdp_max = get_processor_tdp_limits()
+    return proc_tdp_max, get_current_processor_info()
+
 class Plugin:
     def __init__(self):
         self.device_manager = None
@@ -162,6 +861,8 @@ class Plugin:
         self.cpu_manager = None
         self.settings = None
         self.device_controller = None  # Device-specific controller
+        # DEVICE_CONTROLLER_METHODS the controller provides, bound once
+        self._device_controller_methods: Dict[str, Any] = {}
         self.device_type = "generic"  # Device type identifier
         self.processor_info = None  # Processor specifications and capabilities
         self.power_mode = "hybrid"  # Power management mode: sysfs, database, or hybrid
@@ -209,7 +910,27 @@ class Plugin:
             "min_gpu_freq": 400,
             "max_gpu_freq": 1600
         }
+        self._is_rog_ally = False  # Resolved from the DMI name in detect_hardware
+        self._device_classification: Optional[str] = None  # See get_device_classification
+        # Version written by an update install that hasn't been reloaded yet
+        self._installed_version: Optional[str] = None
+        # Whether / is mounted read-only (SteamOS); see _install_ryzenadj_update
+        self._rootfs_readonly: Optional[bool] = None
+        # (device name, limits) from calculate_safe_tdp_limits
+        self._safe_tdp_limits: Tuple[Optional[str], Optional[Dict[str, int]]] = (None, None)
+        # Detected hybrid TDP limits; see get_hybrid_tdp_limits
+        self._hybrid_tdp_limits: Optional[Dict[str, Any]] = None
+        # (st_mtime_ns, event timestamps, events sorted by timestamp) of the
+        # sleep/wake events file; see get_recent_sleep_wake_events
+        self._sleep_wake_events_cache: Tuple[int, List[float], List[Dict[str, Any]]] = (0, [], [])
+        # (monotonic timestamp, ETag, release JSON); see _fetch_github_release
+        self._github_release_cache: Tuple[float, Optional[str], Optional[Dict[str, Any]]] = (0.0, None, None)
         self.ryzenadj_path = None
+        self._gpu_sclk_fd: Optional[int] = None  # Cached fd for pp_dpm_sclk reads
+        self._capability_cache: Dict[Tuple, Tuple[float, Any]] = {}  # See cached_capability
+        self._reading_cache: Dict[Tuple, Tuple[float, Any]] = {}  # See cached_reading
+        # game_id -> (st_mtime_ns, parsed profile); see _read_profile_file
+        self._profile_file_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
         self.warning_cache = set()  # Track warnings to prevent duplicates
         
         # SteamOS Manager integration (SteamFork 3.8+ / SteamOS 3.5+)
@@ -231,7 +952,11 @@ class Plugin:
         self.background_update_task = None
         self.staged_update_info = None
         self.staged_update_path = None
-        self.update_staging_dir = "/tmp/powerdeck_staged_update"
+        # Whether staged_update_path holds a validated update; kept in step
+        # with staging/cleanup so status polls don't stat the directory
+        self._staged_ready = False
+        # Next to the plugins directory (same filesystem) so installing is a rename
+        self.update_staging_dir = "/home/deck/homebrew/powerdeck_staged_update"
         # Backend game detection / profile auto-apply
         self.game_monitor_task = None
         self._last_detected_game_id: Optional[str] = None
@@ -255,6 +980,38 @@ class Plugin:
         self._self_heal_last_check: float = 0.0
         self._self_heal_last_reapply: float = 0.0
         self._self_heal_recent_discrepancies: List[str] = []
+        # Last profile apply_profile applied in full; lets identical
+        # re-applies (idle frontend refreshes, repeated game events) skip
+        # the hardware writes. See _profile_already_applied.
+        self._last_applied_profile: Optional[Dict[str, Any]] = None
+        # Settings coalescing; see update_and_apply_settings. The lock also
+        # keeps full applies (wake restore, game switches) from interleaving
+        # with it and is created on first use, inside the running loop.
+        self._pending_patch: Dict[str, Any] = {}
+        self._pending_apply: Optional[asyncio.Future] = None
+        self._pending_apply_timer: Optional[asyncio.TimerHandle] = None
+        # The loop only keeps weak references to tasks; hold in-flight applies
+        self._settings_apply_tasks: Set[asyncio.Task] = set()
+        self._apply_lock: Optional[asyncio.Lock] = None
+        # Created on first USB scan; see _get_usb_scan_executor
+        self._usb_scan_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        # Serializes hotplug work handed to the executor; see _run_cpu_hotplug
+        self._cpu_hotplug_lock: Optional[asyncio.Lock] = None
+        # (monotonic timestamp, VID/PID set); see _get_input_device_vid_pids_cached
+        self._input_vid_pid_cache: Tuple[float, Optional[FrozenSet[Tuple[str, str]]]] = (0.0, None)
+        self._wifi_iface: Optional[str] = None  # See _find_wifi_interface
+        # fd + poller watching /proc/bus/input/devices for hotplug
+        self._input_devices_fd: Optional[int] = None
+        self._input_devices_poller: Optional[Any] = None
+
+    def _invalidate_capability_cache(self) -> None:
+        """Drop memoized capability getters after pstate/processor/limit changes"""
+        self._capability_cache.clear()
+        self._hybrid_tdp_limits = None
+
+    def _invalidate_reading_cache(self) -> None:
+        """Drop memoized device readings after a setter changed the hardware"""
+        self._reading_cache.clear()
 
     def log_warning_once(self, message: str):
         """Log a warning message only once to prevent spam"""
@@ -1069,6 +1826,8 @@ class Plugin:
                 self.game_monitor_task = asyncio.create_task(self.game_monitor())
                 decky.logger.info("Backend game detection loop started")
                 
+                # Capabilities may have been cached by early frontend calls
+                self._invalidate_capability_cache()
                 decky.logger.info(f"PowerDeck initialized for device: {self.device_info['device_name']}")
             except Exception as e:
                 decky.logger.error(f"Failed to initialize device managers: {e}")
@@ -1121,6 +1880,13 @@ class Plugin:
                 decky.logger.info("Game monitor task cancelled")
             except Exception as e:
                 decky.logger.error(f"Error cancelling game monitor task: {e}")
+
+        self._close_gpu_sclk_fd()
+        self._close_input_devices_fd()
+        if self.cpu_manager:
+            self.cpu_manager.close_cpufreq_fds()
+        if self._usb_scan_executor is not None:
+            self._usb_scan_executor.shutdown(wait=False)
         
     async def _uninstall(self):
         decky.logger.info("PowerDeck uninstalling...")
@@ -1343,6 +2109,10 @@ class Plugin:
             if device_name:
                 self.device_info["device_name"] = f"{sys_vendor} {device_name}".strip()
             
+            # The DMI name never changes at runtime; classify it once
+            name = self.device_info["device_name"].lower()
+            self._is_rog_ally = "rog ally" in name or "rc71" in name or "rc72" in name
+            
             # Detect CPU vendor
             cpu_vendor = await self.get_cpu_vendor()
             if cpu_vendor:
@@ -1465,6 +2235,20 @@ class Plugin:
         decky.logger.warning("RyzenAdj binary not found - TDP control may be limited")
         return None
 
+    @property
+    def _cpu(self) -> "CPUManager":
+        """The plugin's CPUManager, or the shared one before _main has created it"""
+        return self.cpu_manager or get_cpu_manager()
+
+    def _set_device_controller(self, controller) -> None:
+        """Install the device controller and bind its DEVICE_CONTROLLER_METHODS once"""
+        self.device_controller = controller
+        self._device_controller_methods = {
+            name: getattr(controller, name)
+            for name in DEVICE_CONTROLLER_METHODS
+            if hasattr(controller, name)
+        }
+
     async def _initialize_device_controller(self):
         """Initialize device-specific controller based on detected hardware"""
         try:
@@ -1472,7 +2256,7 @@ class Plugin:
             
             # ROG Ally detection - only determines control method, not capabilities
             if ("rog ally" in device_name or "rc71" in device_name or "rc72" in device_name) and ROG_ALLY_AVAILABLE:
-                self.device_controller = get_rog_ally_controller()
+                self._set_device_controller(get_rog_ally_controller())
                 self.device_type = "rog_ally"
                 decky.logger.info("Initialized ROG Ally controller")
                 
@@ -1485,7 +2269,7 @@ class Plugin:
                 
             # Legion Go detection - only determines control method, not capabilities
             elif ("legion" in device_name or "83e1" in device_name or "83l3" in device_name) and LEGION_AVAILABLE:
-                self.device_controller = get_legion_controller()
+                self._set_device_controller(get_legion_controller())
                 self.device_type = "legion"
                 decky.logger.info("Initialized Legion controller")
                 
@@ -1498,7 +2282,7 @@ class Plugin:
                 
             # Steam Deck detection - only determines control method, not capabilities
             elif ("steam deck" in device_name or "jupiter" in device_name) and STEAM_DECK_AVAILABLE:
-                self.device_controller = get_steam_deck_controller()
+                self._set_device_controller(get_steam_deck_controller())
                 self.device_type = "steam_deck"
                 decky.logger.info("Initialized Steam Deck controller")
                 
@@ -1595,12 +2379,12 @@ class Plugin:
             self.device_type = "generic"
 
     async def read_file_safe(self, path: str) -> Optional[str]:
-        """Safely read a file and return its content"""
-        try:
-            with open(path, 'r') as f:
-                return f.read().strip()
-        except OSError:
-            return None
+        """Safely read a file and return its content.
+
+        The read runs on the default executor so a slow sysfs attribute
+        doesn't stall the event loop serving other frontend calls.
+        """
+        return await asyncio.get_running_loop().run_in_executor(None, read_sysfs_file, path)
 
     async def get_cpu_vendor(self) -> Optional[str]:
         """Get CPU vendor from /proc/cpuinfo"""
@@ -2156,11 +2940,9 @@ class Plugin:
     async def get_scaling_driver(self) -> str:
         """Get current CPU scaling driver"""
         try:
-            driver_path = "/sys/devices/system/cpu/cpufreq/policy0/scaling_driver"
-            if os.path.exists(driver_path):
-                with open(driver_path, 'r') as f:
-                    driver_name = f.read().strip()
-                    return driver_name
+            driver_name = await self.read_file_safe("/sys/devices/system/cpu/cpufreq/policy0/scaling_driver")
+            if driver_name is not None:
+                return driver_name
             else:
                 # Fallback: check CPU vendor and make educated guess
                 cpu_vendor = self.device_info.get("cpu_vendor", "unknown")
@@ -2367,15 +3149,8 @@ class Plugin:
             debug_log(f"Profile TDP: {profile_copy.get('tdp', 'UNKNOWN')}")
             debug_log(f"Full profile: {profile_copy}")
             
-            # Create profiles directory structure
-            # Use decky plugin settings dir instead of ~/.config (which is /root/.config
-            # and read-only on SteamFork).  Fall back to /tmp if settings dir unavailable.
-            try:
-                import decky_plugin
-                profiles_dir = os.path.join(decky_plugin.DECKY_PLUGIN_SETTINGS_DIR, "profiles")
-            except (ImportError, AttributeError):
-                # Fallback: use /tmp which is always writable
-                profiles_dir = "/tmp/powerdeck/profiles"
+            # Create profiles directory structure (see PROFILES_DIR)
+            profiles_dir = PROFILES_DIR
             os.makedirs(profiles_dir, exist_ok=True)
             debug_log(f"Created profiles directory: {profiles_dir}")
             
@@ -2384,8 +3159,7 @@ class Plugin:
             profile_filepath = os.path.join(profiles_dir, profile_filename)
             
             # Save profile as individual JSON file
-            with open(profile_filepath, 'w') as f:
-                json.dump(profile_copy, f, indent=2)
+            write_file_atomic(profile_filepath, json_dumps_indented(profile_copy))
             
             debug_log(f"Saving profile {game_id} to {profile_filepath}")
             debug_log(f"Profile file created: {profile_filepath}")
@@ -2401,33 +3175,52 @@ class Plugin:
             
             debug_log(f"SAVE_PROFILE completed for {game_id}")
             return True
-        except Exception as e:
-            error_log(f"Failed to save profile: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("Failed to save profile for %s", profile_data.get("gameId"))
             return False
 
+    def _read_profile_file(self, game_id: str) -> Optional[Dict[str, Any]]:
+        """Parsed per-game profile JSON, re-read only when the file changed
+
+        Unlike load_profile this has no side effects on current_profile.
+        Returns None if there is no profile file.
+        """
+        profile_filepath = os.path.join(PROFILES_DIR, f"{game_id}.json")
+        try:
+            mtime_ns = os.stat(profile_filepath).st_mtime_ns
+        except FileNotFoundError:
+            return None
+        cached = self._profile_file_cache.get(game_id)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        with open(profile_filepath, 'rb') as f:
+            profile_dict = json_loads(f.read())
+        self._profile_file_cache[game_id] = (mtime_ns, profile_dict)
+        return profile_dict
+
+    def _patch_profile_file(self, game_id: str, patch: Dict[str, Any]) -> None:
+        """Merge patch into a per-game profile file and write it back atomically"""
+        profile_dict = dict(self._read_profile_file(game_id) or {})
+        profile_dict.update(patch)
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        write_file_atomic(os.path.join(PROFILES_DIR, f"{game_id}.json"), json_dumps_indented(profile_dict))
+        self._profile_file_cache.pop(game_id, None)
+
     async def load_profile(self, game_id: str) -> Optional[Dict[str, Any]]:
         """Load a power profile from individual JSON file per profile ID"""
         try:
-            import os
             decky.logger.info(f"PowerDeck Backend: Loading profile for {game_id}")
             
             # Try to load from individual JSON file first (unified schema)
-            # Use decky plugin settings dir instead of ~/.config (which is /root/.config
-            # and read-only on SteamFork).  Fall back to /tmp if settings dir unavailable.
-            try:
-                import decky_plugin
-                profiles_dir = os.path.join(decky_plugin.DECKY_PLUGIN_SETTINGS_DIR, "profiles")
-            except (ImportError, AttributeError):
-                profiles_dir = "/tmp/powerdeck/profiles"
+            profiles_dir = PROFILES_DIR
             profile_filename = f"{game_id}.json"
             profile_filepath = os.path.join(profiles_dir, profile_filename)
             
             decky.logger.info(f"PowerDeck Backend: Looking for profile file: {profile_filepath}")
             
             if os.path.exists(profile_filepath):
-                with open(profile_filepath, 'r') as f:
-                    profile_dict = json.load(f)
+                with open(profile_filepath, 'rb') as f:
+                    profile_dict = json_loads(f.read())
                 decky.logger.info(f"PowerDeck Backend: Loading profile {game_id} from {profile_filepath}")
                 decky.logger.info(f"PowerDeck Backend: Profile data loaded: {profile_dict}")
                 self.current_profile.update(profile_dict)
@@ -2445,8 +3238,7 @@ class Plugin:
                     # Save to new format for future use
                     try:
                         os.makedirs(profiles_dir, exist_ok=True)
-                        with open(profile_filepath, 'w') as f:
-                            json.dump(profile_dict, f, indent=2)
+                        write_file_atomic(profile_filepath, json_dumps_indented(profile_dict))
                         decky.logger.info(f"PowerDeck Backend: Migrated profile {game_id} to unified schema: {profile_filepath}")
                     except Exception as e:
                         decky.logger.warning(f"Failed to migrate profile to new format: {e}")
@@ -2464,9 +3256,8 @@ class Plugin:
             # 00000000_ac/_battery, not silently re-apply the active profile).
             return None
             
-        except Exception as e:
-            decky.logger.error(f"PowerDeck Backend: Failed to load profile for {game_id}: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("PowerDeck Backend: Failed to load profile for %s", game_id)
             return None
 
     async def set_tdp(self, tdp: int, save_to_profile: bool = False) -> bool:
@@ -2513,6 +3304,7 @@ class Plugin:
                         ok = self.device_controller.set_platform_profile(profile)
                     else:
                         ok = self._write_platform_profile_sysfs(profile)
+                self._invalidate_reading_cache()
                 if ok:
                     self.current_profile["tdp"] = tdp
                     if "platformProfile" not in self.current_profile:
@@ -2554,6 +3346,7 @@ class Plugin:
                         # results in unstable power delivery.
                         # Pin all limits to user's TDP value for consistent behavior.
                         native_success = self.device_controller.set_power_limits(tdp, tdp, tdp)
+                        self._invalidate_reading_cache()
                         if native_success:
                             decky.logger.info(f"TDP set to {tdp}W (all limits pinned) via ROG Ally native controller (amd_pmf)")
                         else:
@@ -2572,6 +3365,7 @@ class Plugin:
                 elif self.device_type == "legion":
                     # Legion WMI control
                     success = self.device_controller.set_power_limits_wmi(tdp, tdp, tdp)
+                    self._invalidate_reading_cache()
                     if success:
                         decky.logger.info(f"TDP set to {tdp}W (all limits pinned) via {self.device_type} controller")
                     else:
@@ -2861,17 +3655,9 @@ class Plugin:
                 self.power_control_native_active()
             )
             # Use CPU manager for boost control to avoid conflicts
-            if hasattr(self, 'cpu_manager') and self.cpu_manager:
-                success = self.cpu_manager.set_cpu_boost(
-                    enabled, respect_pstate_lock=respect_pstate_lock
-                )
-            else:
-                # Fallback if CPU manager not available
-                from cpu_manager import get_cpu_manager
-                cpu_manager = get_cpu_manager()
-                success = cpu_manager.set_cpu_boost(
-                    enabled, respect_pstate_lock=respect_pstate_lock
-                )
+            success = self._cpu.set_cpu_boost(
+                enabled, respect_pstate_lock=respect_pstate_lock
+            )
 
             if success:
                 # Only update current_profile for hardware state tracking
@@ -2923,25 +3709,12 @@ class Plugin:
         decky.logger.warning("Using fallback CPU core count")
         return 8
 
-    async def get_online_cpus(self):
-        """Get list of online CPU numbers"""
-        try:
-            with open('/sys/devices/system/cpu/online', 'r') as f:
-                online_range = f.read().strip()
-                # Parse ranges like "0-15" or "0-7,9-15"
-                cpus = []
-                for part in online_range.split(','):
-                    if '-' in part:
-                        start, end = map(int, part.split('-'))
-                        cpus.extend(range(start, end + 1))
-                    else:
-                        cpus.append(int(part))
-                return cpus
-        except (OSError, ValueError):
-            return [0]
+    async def set_smt(self, enabled: bool, restore_cores: bool = True) -> bool:
+        """Set SMT (Simultaneous Multithreading) enable/disable
 
-    async def set_smt(self, enabled: bool) -> bool:
-        """Set SMT (Simultaneous Multithreading) enable/disable"""
+        restore_cores=False skips re-applying the previous core count and
+        CPU settings; set_cpu_topology uses it to do that once itself.
+        """
         try:
             smt_path = "/sys/devices/system/cpu/smt/control"
             if os.path.exists(smt_path):
@@ -2952,15 +3725,14 @@ class Plugin:
                     current_governor = self.current_profile.get("governor", "powersave")
                     current_epp = self.current_profile.get("epp", "balance_performance")
                     
-                    with open(smt_path, 'w') as f:
-                        f.write('on' if enabled else 'off')
+                    await self._run_cpu_hotplug(write_sysfs_attr, smt_path, 'on' if enabled else 'off')
                     # Only update current_profile for hardware state tracking
                     # DO NOT save settings here as it overwrites user customizations
                     self.current_profile["smt"] = enabled
                     decky.logger.info(f"SET_SMT: Hardware SMT {'enabled' if enabled else 'disabled'} (no settings save to preserve user profile)")
                     
                     # After SMT change, reinitialize CPU topology to update sibling mappings
-                    if hasattr(self, 'cpu_manager') and self.cpu_manager:
+                    if restore_cores and hasattr(self, 'cpu_manager') and self.cpu_manager:
                         # SMT change calls reapply_cpu_settings which
                         # calls set_cpu_boost. When the active method
                         # owns the CPU performance path (platform_profile
@@ -2969,7 +3741,7 @@ class Plugin:
                         respect_pstate_lock = self.power_control_native_active()
                         info_log("Reinitializing CPU topology after SMT change...")
                         self.cpu_manager._topology_initialized = False
-                        self.cpu_manager.initialize_cpu_topology()
+                        await self._run_cpu_hotplug(self.cpu_manager.initialize_cpu_topology)
 
                         # Reconfigure CPU cores to maintain the same physical core count
                         info_log(f"Reconfiguring CPU cores to {current_cores} after SMT change...")
@@ -2977,7 +3749,8 @@ class Plugin:
 
                         # Reapply CPU settings to new topology
                         info_log("Reapplying CPU settings after SMT topology change...")
-                        self.cpu_manager.reapply_cpu_settings(
+                        await self._run_cpu_hotplug(
+                            self.cpu_manager.reapply_cpu_settings,
                             current_boost, current_governor, current_epp,
                             respect_pstate_lock=respect_pstate_lock,
                         )
@@ -2994,6 +3767,58 @@ class Plugin:
             decky.logger.error(f"Failed to set SMT: {e}")
             return False
 
+    async def _run_cpu_hotplug(self, func, *args, **kwargs):
+        """Run a blocking CPU hotplug step in the executor, one at a time
+
+        Onlining/offlining CPUs (and initialize_cpu_topology's settle sleep)
+        can take hundreds of ms; on the loop thread that stalled every other
+        RPC while a profile was reapplied after wake.
+        """
+        if self._cpu_hotplug_lock is None:
+            self._cpu_hotplug_lock = asyncio.Lock()
+        async with self._cpu_hotplug_lock:
+            return await run_blocking(func, *args, **kwargs)
+
+    async def set_cpu_topology(self, smt: bool, cores: int) -> bool:
+        """Apply SMT and core count together in a single CPU hotplug pass.
+
+        set_smt() on its own restores the previous core count after the
+        topology change, so applying SMT and then cpuCores walked every
+        CPU twice. Here SMT is only written when it actually changes and
+        the online mask is set once, for the requested core count.
+        """
+        try:
+            smt_success = True
+            smt_changed = smt != await self.get_current_smt_status()
+            if smt_changed:
+                smt_success = await self.set_smt(smt, restore_cores=False)
+                smt_changed = smt_success
+
+            if smt_changed and self.cpu_manager:
+                info_log("Reinitializing CPU topology after SMT change...")
+                self.cpu_manager._topology_initialized = False
+                await self._run_cpu_hotplug(self.cpu_manager.initialize_cpu_topology)
+
+            cores_success = await self.set_cpu_cores(cores)
+
+            if smt_changed and self.cpu_manager:
+                # Same lock handling as set_smt: reapply_cpu_settings calls
+                # set_cpu_boost, which must not flip amd_pstate when the
+                # active method owns the CPU performance path.
+                info_log("Reapplying CPU settings after SMT topology change...")
+                await self._run_cpu_hotplug(
+                    self.cpu_manager.reapply_cpu_settings,
+                    self.current_profile.get("cpuBoost", True),
+                    self.current_profile.get("governor", "powersave"),
+                    self.current_profile.get("epp", "balance_performance"),
+                    respect_pstate_lock=self.power_control_native_active(),
+                )
+
+            return smt_success and cores_success
+        except Exception as e:
+            decky.logger.error(f"Failed to set CPU topology: {e}")
+            return False
+
     async def set_cpu_cores(self, cores: int) -> bool:
         """Set number of active CPU cores with C-state optimization for better power efficiency"""
         try:
@@ -3043,10 +3868,9 @@ class Plugin:
             current_boost = self.current_profile.get("cpuBoost", True)
             
             # Use enhanced CPU manager with C-state optimization
-            from cpu_manager import get_cpu_manager
             cpu_manager = get_cpu_manager()
             
-            success = cpu_manager.set_cpu_cores_with_cstate_optimization(target_cores)
+            success = await self._run_cpu_hotplug(cpu_manager.set_cpu_cores_with_cstate_optimization, target_cores)
             
             if success:
                 # CPU manager handles boost reapplication internally via reapply_cpu_settings()
@@ -3116,11 +3940,9 @@ class Plugin:
     async def get_current_smt_status(self) -> bool:
         """Get current SMT status"""
         try:
-            smt_path = "/sys/devices/system/cpu/smt/control"
-            if os.path.exists(smt_path):
-                with open(smt_path, 'r') as f:
-                    status = f.read().strip()
-                    return status == "on"
+            status = await self.read_file_safe("/sys/devices/system/cpu/smt/control")
+            if status is not None:
+                return status == "on"
             return True  # Assume SMT is on if we can't detect
         except Exception as e:
             decky.logger.error(f"Failed to get SMT status: {e}")
@@ -3360,12 +4182,11 @@ class Plugin:
     async def get_pstate_mode(self) -> str:
         """Get current amd-pstate operation mode (active, passive, guided)"""
         try:
-            if os.path.exists(self.PSTATE_STATUS_PATH):
-                with open(self.PSTATE_STATUS_PATH, 'r') as f:
-                    current_mode = f.read().strip()
-                    # Cache the mode for quick access
-                    self.pstate_mode = current_mode
-                    return current_mode
+            current_mode = await self.read_file_safe(self.PSTATE_STATUS_PATH)
+            if current_mode is not None:
+                # Cache the mode for quick access
+                self.pstate_mode = current_mode
+                return current_mode
             # Fallback: try to infer from scaling driver
             scaling_driver = await self.get_scaling_driver()
             if scaling_driver == "amd-pstate-epp":
@@ -3435,6 +4256,8 @@ class Plugin:
                 return False
             
             self.pstate_mode = mode
+            # Available governors depend on the pstate mode
+            self._invalidate_capability_cache()
             decky.logger.info(f"Pstate mode set to: {mode}")
 
             # Mirror into current_profile so the per-state saved JSON
@@ -3747,6 +4570,7 @@ class Plugin:
             self.tdp_limits = {"min": min_tdp, "max": max_tdp}
             self.device_info["min_tdp"] = min_tdp
             self.device_info["max_tdp"] = max_tdp
+            self._invalidate_capability_cache()
             # TDP limits are part of device configuration, so save is appropriate here
             await self.save_settings()
             decky.logger.info(f"TDP limits set to {min_tdp}-{max_tdp}W")
@@ -3920,12 +4744,11 @@ class Plugin:
             # Default fallback that should work on most gaming devices
             return {"id": "handheld", "name": "Handheld"}
 
+    @cached_reading(0.5)
     async def get_ac_power_status(self) -> bool:
         """Get AC power connection status using hardware-level detection"""
         try:
-            from ac_power_manager import get_hardware_ac_status, supports_hardware_ac_detection
-            
-            if supports_hardware_ac_detection():
+            if ac_detection_available and supports_hardware_ac_detection():
                 hardware_status = get_hardware_ac_status()
                 if hardware_status is not None:
                     decky.logger.debug(f"AC_POWER: hardware_status={hardware_status}")
@@ -3949,11 +4772,8 @@ class Plugin:
             bool: True if custom AC power management is supported
         """
         decky.logger.debug("Checking AC power management support")
-        # Import device manager to check capabilities
-        from device_manager import DeviceManager
-        
         try:
-            device_manager = DeviceManager()
+            device_manager = self.device_manager or DeviceManager()
             device_name = device_manager.get_device_name()
             decky.logger.info(f"Device detected: {device_name}")
             
@@ -3984,8 +4804,7 @@ class Plugin:
     async def supports_hardware_ac_detection(self) -> bool:
         """Check if hardware-level AC power detection is available"""
         try:
-            from ac_power_manager import supports_hardware_ac_detection
-            return supports_hardware_ac_detection()
+            return ac_detection_available and supports_hardware_ac_detection()
         except Exception as e:
             decky.logger.error(f"Failed to check AC detection support: {e}")
             return False
@@ -3994,11 +4813,12 @@ class Plugin:
 
         """Switch active profile on AC/battery transitions using user's saved profiles."""
         try:
-            decky.logger.info("=== AUTO POWER PROFILE SWITCHING ===")
+            if DEBUG_ENABLED:
+                decky.logger.debug("=== AUTO POWER PROFILE SWITCHING ===")
             
             # Get current AC power status
             is_ac_power = await self.get_ac_power_status()
-            decky.logger.info(f"Current power state: {'AC' if is_ac_power else 'Battery'}")
+            decky.logger.debug("Current power state: %s", 'AC' if is_ac_power else 'Battery')
             
             # Determine the profile suffix based on power state
             suffix = "_ac" if is_ac_power else "_battery"
@@ -4009,7 +4829,7 @@ class Plugin:
             profile_data = await self.load_profile(default_profile_id)
             
             if profile_data:
-                decky.logger.info(f"Auto-switch: Loaded user profile {default_profile_id}: {profile_data}")
+                decky.logger.debug("Auto-switch: Loaded user profile %s: %s", default_profile_id, profile_data)
             else:
                 decky.logger.warning(f"Auto-switch: No user profile found for {default_profile_id}, creating from current profile")
                 # Create a profile from current settings rather than using hardcoded conservative values
@@ -4023,29 +4843,20 @@ class Plugin:
                             profile_data["tdp"] = self.tdp_limits.get("max", 25)
                     else:
                         profile_data["tdp"] = self.tdp_limits.get("max", 25)
-                if "cpuBoost" not in profile_data or profile_data["cpuBoost"] is None:
-                    profile_data["cpuBoost"] = True
-                if "smt" not in profile_data or profile_data["smt"] is None:
-                    profile_data["smt"] = True
-                if "cpuCores" not in profile_data or profile_data["cpuCores"] is None:
-                    profile_data["cpuCores"] = self.device_info.get("max_cpu_cores", 8)
-                if "governor" not in profile_data or profile_data["governor"] is None:
-                    # schedutil is the balanced default: it unlocks the full
-                    # EPP set on amd-pstate-epp (governor=performance only
-                    # exposes EPP=performance) and is responsive enough for
-                    # handheld use. AC and battery defaults are kept similar
-                    # because the per-power-mode tdp/epp split is what
-                    # actually shifts behavior; the governor is a fallback.
-                    profile_data["governor"] = "schedutil"
-                if "epp" not in profile_data or profile_data["epp"] is None:
-                    # Power-biased by default. balance_power on battery, a
-                    # notch warmer on AC. Previously this used
-                    # performance/balance_performance which silently pinned
-                    # EPP to performance on amd-pstate-epp (see v1.0.42
-                    # changelog - AYANEO Air Pro / Cezanne writeup).
-                    profile_data["epp"] = "balance_performance" if is_ac_power else "balance_power"
-                if "gpuMode" not in profile_data or profile_data["gpuMode"] is None:
-                    profile_data["gpuMode"] = "auto"
+                # Static fields come from AUTO_PROFILE_DEFAULTS; EPP is
+                # power-biased by default - balance_power on battery, a
+                # notch warmer on AC. Previously this used
+                # performance/balance_performance which silently pinned
+                # EPP to performance on amd-pstate-epp (see v1.0.42
+                # changelog - AYANEO Air Pro / Cezanne writeup).
+                fallbacks = {
+                    **AUTO_PROFILE_DEFAULTS,
+                    "cpuCores": self.device_info.get("max_cpu_cores", 8),
+                    "epp": "balance_performance" if is_ac_power else "balance_power",
+                }
+                for key, value in fallbacks.items():
+                    if profile_data.get(key) is None:
+                        profile_data[key] = value
                 # Save it so it exists next time
                 await self.save_profile({"gameId": default_profile_id, **profile_data})
                 decky.logger.info(f"Auto-switch: Created default profile {default_profile_id} from current settings")
@@ -4070,11 +4881,133 @@ class Plugin:
             decky.logger.error(f"Failed to auto-switch power profile: {e}")
             return False
     
-    async def apply_profile(self, profile_data: Dict[str, Any]) -> bool:
-        """Apply a complete power profile to hardware"""
+    async def _apply_profile_op(self, label: str, value: Any, setter: Awaitable[Any]) -> bool:
+        """Await one apply_profile setter and log the outcome. Never raises."""
+        try:
+            if await setter:
+                decky.logger.debug("Applied %s: %s", label, value)
+                return True
+            decky.logger.warning(f"Failed to apply {label}: {value}")
+        except Exception as e:
+            decky.logger.error(f"Error applying {label}: {e}")
+        return False
+
+    async def _apply_cpu_boost_setting(self, enabled: bool) -> bool:
+        """CPU boost setter used by apply_profile"""
+        # Prefer SteamOS Manager for CPU boost on supported systems,
+        # but skip it when we hold the power claim (all DBus Set*
+        # methods are no-ops while claimed - go directly to hardware).
+        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
+            return await self.set_cpu_boost_via_steamos_manager(enabled)
+        return await self.set_cpu_boost(enabled)
+
+    async def _apply_governor_setting(self, governor: str) -> bool:
+        """Governor setter used by apply_profile"""
+        # Prefer SteamOS Manager for governor on supported systems,
+        # but skip it when we hold the power claim (no-ops while claimed).
+        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
+            if await self.set_governor_via_steamos_manager(governor):
+                return True
+        return await self.set_power_governor(governor)
+
+    async def _apply_fan_profile_setting(self, fan_profile: str) -> bool:
+        """Fan profile setter used by apply_profile (restarts the fan service)"""
+        result = await self.set_fan_cooling_profile(fan_profile)
+        return result.get("success", False)
+
+    async def _apply_gpu_mode_setting(self, gpu_mode: str) -> bool:
+        """GPU mode setter used by apply_profile"""
+        # Prefer SteamOS Manager for GPU performance level on
+        # supported systems, but skip it when we hold the
+        # power claim (no-ops while claimed).
+        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
+            # Map PowerDeck GPU modes to steamos-manager performance levels
+            # "performance" maps to "high" for SteamOS Manager (DPM "high").
+            # Only safe on JELOS due to the AMD power_dpm_force_performance_level
+            # kernel hang fixed by JELOS's custom kernel.
+            gpu_level_map = {
+                "auto": "auto",
+                "balanced": "auto",
+                "low": "low",
+                "performance": "high",
+                "high": "high",
+                "manual": "high",
+                "range": "high"
+            }
+            gpu_level = gpu_level_map.get(gpu_mode, "auto")
+            if await self.set_gpu_performance_via_steamos_manager(gpu_level):
+                return True
+            return await self.set_gpu_mode(gpu_mode)
+        # Refuse "performance" on non-JELOS systems - it would write DPM "high"
+        # and trigger the AMD GPU hang on SteamFork/SteamOS stock kernels.
+        if gpu_mode == "performance" and not self.is_jelos:
+            decky.logger.warning(
+                f"Refusing to apply GPU mode 'performance' (DPM 'high') on non-JELOS "
+                f"system - AMD power_dpm_force_performance_level=high is known to hang."
+            )
+            return False
+        return await self.set_gpu_mode(gpu_mode)
+
+    async def _apply_pstate_setting(self, requested: str) -> bool:
+        """amd-pstate mode setter used by apply_profile; no-op when already set"""
+        if requested != await self.get_pstate_mode():
+            return await self.set_pstate_mode(requested)
+        return True
+
+    async def _apply_platform_profile_setting(self, profile: str) -> bool:
+        """Platform profile setter used by apply_profile"""
+        # Prefer SteamOS Manager when available (it
+        # coordinates with amd_pmf cleanly); fall back to
+        # the ROG Ally controller or generic ACPI sysfs
+        # write depending on what the device exposes.
+        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
+            return await self.set_performance_profile_via_steamos_manager(profile)
+        if self.device_controller and hasattr(self.device_controller, "set_platform_profile"):
+            return self.device_controller.set_platform_profile(profile)
+        return self._write_platform_profile_sysfs(profile)
+
+    def _profile_already_applied(self, profile_data: Dict[str, Any]) -> bool:
+        """True when profile_data was the last fully-applied profile and
+        nothing has moved the hardware away from it since.
+
+        Direct setters (set_tdp, set_smt, ...) mirror into current_profile,
+        so a field that no longer matches means the user changed it
+        outside apply_profile. _verify_state covers out-of-band drift.
+        """
+        if self._last_applied_profile != profile_data:
+            return False
+        for key, value in profile_data.items():
+            if key in self.current_profile and self.current_profile[key] != value:
+                return False
+        return not self._verify_state()
+
+    def _get_apply_lock(self) -> asyncio.Lock:
+        """Lock serializing hardware applies (created inside the running loop)"""
+        if self._apply_lock is None:
+            self._apply_lock = asyncio.Lock()
+        return self._apply_lock
+
+    async def apply_profile(self, profile_data: Dict[str, Any], force: bool = False) -> bool:
+        """Apply a complete power profile to hardware.
+
+        Re-applying the profile that is already in place is skipped (SMT
+        and core toggles are hotplug events); pass force=True when the
+        hardware may have been reset behind our back, e.g. after wake.
+        """
+        async with self._get_apply_lock():
+            return await self._apply_profile(profile_data, force)
+
+    async def _apply_profile(self, profile_data: Dict[str, Any], force: bool = False) -> bool:
+        """apply_profile body; callers hold the apply lock"""
         try:
-            decky.logger.info(f"=== APPLYING POWER PROFILE ===")
-            decky.logger.info(f"Profile data: {profile_data}")
+            if not force and self._profile_already_applied(profile_data):
+                decky.logger.debug("apply_profile: profile unchanged, skipping")
+                return True
+            requested_profile = dict(profile_data)
+
+            if DEBUG_ENABLED:
+                decky.logger.debug("=== APPLYING POWER PROFILE ===")
+            decky.logger.debug("Profile data: %s", profile_data)
 
             # ROG Ally native TDP mode owns the CPU performance path.
             # Sanitise the profile here so EVERY branch below (TDP, boost,
@@ -4091,7 +5024,7 @@ class Plugin:
             # refresh loop doesn't fight PowerDeck's writes.
             if self.power_control_native_active():
                 profile_data = self._sanitize_profile_for_native_mode(dict(profile_data))
-                decky.logger.info(f"Native TDP active: sanitised profile for apply: {profile_data}")
+                decky.logger.debug("Native TDP active: sanitised profile for apply: %s", profile_data)
                 try:
                     if await self.get_pstate_mode() != "passive":
                         decky.logger.info("Native TDP active: forcing pstate -> passive")
@@ -4118,66 +5051,40 @@ class Plugin:
                 except Exception as e:
                     decky.logger.warning(f"Native TDP governor pre-check failed (non-fatal): {e}")
 
-            success_count = 0
-            total_operations = 0
+            # Each setter's outcome is appended in order; the success
+            # rate is computed from the list at the end. Setters still run
+            # sequentially - several depend on earlier ones (SMT before
+            # cores, governor before EPP, thermal policy before platform
+            # profile).
+            results: List[bool] = []
 
             # Apply TDP setting
             if "tdp" in profile_data:
-                total_operations += 1
-                try:
-                    tdp_success = await self.set_tdp(profile_data["tdp"])
-                    if tdp_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied TDP: {profile_data['tdp']}W")
-                    else:
-                        decky.logger.warning(f"Failed to apply TDP: {profile_data['tdp']}W")
-                except Exception as e:
-                    decky.logger.error(f"Error applying TDP: {e}")
+                results.append(await self._apply_profile_op(
+                    "TDP", profile_data["tdp"], self.set_tdp(profile_data["tdp"])))
             
             # Apply CPU boost setting
             if "cpuBoost" in profile_data:
-                total_operations += 1
-                try:
-                    # Prefer SteamOS Manager for CPU boost on supported systems,
-                    # but skip it when we hold the power claim (all DBus Set*
-                    # methods are no-ops while claimed - go directly to hardware).
-                    if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
-                        boost_success = await self.set_cpu_boost_via_steamos_manager(profile_data["cpuBoost"])
-                    else:
-                        boost_success = await self.set_cpu_boost(profile_data["cpuBoost"])
-                    if boost_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied CPU boost: {profile_data['cpuBoost']}")
-                    else:
-                        decky.logger.warning(f"Failed to apply CPU boost: {profile_data['cpuBoost']}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying CPU boost: {e}")
+                results.append(await self._apply_profile_op(
+                    "CPU boost", profile_data["cpuBoost"], self._apply_cpu_boost_setting(profile_data["cpuBoost"])))
             
+            # Apply SMT and CPU cores in one topology pass when both are
+            # present; set_smt alone would first restore the old core count
+            if "smt" in profile_data and "cpuCores" in profile_data:
+                topology_success = await self._apply_profile_op(
+                    "SMT/CPU cores", f"{profile_data['smt']}/{profile_data['cpuCores']}",
+                    self.set_cpu_topology(profile_data["smt"], profile_data["cpuCores"]))
+                results.extend((topology_success, topology_success))
+
             # Apply SMT setting (before CPU cores for proper management)
-            if "smt" in profile_data:
-                total_operations += 1
-                try:
-                    smt_success = await self.set_smt(profile_data["smt"])
-                    if smt_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied SMT: {profile_data['smt']}")
-                    else:
-                        decky.logger.warning(f"Failed to apply SMT: {profile_data['smt']}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying SMT: {e}")
+            elif "smt" in profile_data:
+                results.append(await self._apply_profile_op(
+                    "SMT", profile_data["smt"], self.set_smt(profile_data["smt"])))
             
             # Apply CPU cores setting
-            if "cpuCores" in profile_data:
-                total_operations += 1
-                try:
-                    cores_success = await self.set_cpu_cores(profile_data["cpuCores"])
-                    if cores_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied CPU cores: {profile_data['cpuCores']}")
-                    else:
-                        decky.logger.warning(f"Failed to apply CPU cores: {profile_data['cpuCores']}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying CPU cores: {e}")
+            elif "cpuCores" in profile_data:
+                results.append(await self._apply_profile_op(
+                    "CPU cores", profile_data["cpuCores"], self.set_cpu_cores(profile_data["cpuCores"])))
             
             # Apply CPU governor and EPP settings
             if "governor" in profile_data or "powerGovernor" in profile_data or "epp" in profile_data:
@@ -4242,154 +5149,47 @@ class Plugin:
                     current_governor = self.cpu_manager.get_current_governor()
                     if current_governor == "performance" and epp_governor != "performance":
                         decky.logger.info(f"Active mode: temporarily setting governor to powersave to allow EPP change")
-                        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
-                            sm_ok = await self.set_governor_via_steamos_manager("powersave")
-                            if not sm_ok:
-                                await self.set_power_governor("powersave")
-                        else:
-                            await self.set_power_governor("powersave")
+                        await self._apply_governor_setting("powersave")
                 
                 # Set governor if present
                 if "governor" in profile_data or "powerGovernor" in profile_data:
-                    total_operations += 1
-                    try:
-                        # Prefer SteamOS Manager for governor on supported systems,
-                        # but skip it when we hold the power claim (no-ops while claimed).
-                        if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
-                            governor_success = await self.set_governor_via_steamos_manager(governor)
-                            if not governor_success:
-                                governor_success = await self.set_power_governor(governor)
-                        else:
-                            governor_success = await self.set_power_governor(governor)
-                        if governor_success:
-                            success_count += 1
-                            decky.logger.info(f"Applied CPU governor: {governor}")
-                        else:
-                            decky.logger.warning(f"Failed to apply CPU governor: {governor}")
-                    except Exception as e:
-                        decky.logger.error(f"Error applying CPU governor: {e}")
+                    results.append(await self._apply_profile_op(
+                        "CPU governor", governor, self._apply_governor_setting(governor)))
                 
                 # Set EPP if present (skipped in guided mode - set_epp handles the mapping)
                 if "epp" in profile_data:
-                    total_operations += 1
-                    try:
-                        epp_success = await self.set_epp(epp)
-                        if epp_success:
-                            success_count += 1
-                            decky.logger.info(f"Applied EPP: {epp}")
-                        else:
-                            decky.logger.warning(f"Failed to apply EPP: {epp}")
-                    except Exception as e:
-                        decky.logger.error(f"Error applying EPP: {epp}")
+                    results.append(await self._apply_profile_op("EPP", epp, self.set_epp(epp)))
             
             # Apply fan control profile (critical for proper cooling management)
             if "fanProfile" in profile_data:
-                total_operations += 1
-                try:
-                    fan_profile = profile_data["fanProfile"]
-                    fan_success = await self.set_fan_cooling_profile(fan_profile)
-                    if fan_success.get("success", False):
-                        success_count += 1
-                        decky.logger.info(f"Applied fan profile: {fan_profile} (service restarted)")
-                    else:
-                        decky.logger.warning(f"Failed to apply fan profile: {fan_profile}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying fan profile: {e}")
+                results.append(await self._apply_profile_op(
+                    "fan profile", profile_data["fanProfile"], self._apply_fan_profile_setting(profile_data["fanProfile"])))
             
             # Apply GPU mode and frequency settings
             if "gpuMode" in profile_data:
-                total_operations += 1
-                try:
-                    gpu_mode = profile_data["gpuMode"]
-                    # Prefer SteamOS Manager for GPU performance level on
-                    # supported systems, but skip it when we hold the
-                    # power claim (no-ops while claimed).
-                    if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
-                        # Map PowerDeck GPU modes to steamos-manager performance levels
-                        # "performance" maps to "high" for SteamOS Manager (DPM "high").
-                        # Only safe on JELOS due to the AMD power_dpm_force_performance_level
-                        # kernel hang fixed by JELOS's custom kernel.
-                        gpu_level_map = {
-                            "auto": "auto",
-                            "balanced": "auto",
-                            "low": "low",
-                            "performance": "high",
-                            "high": "high",
-                            "manual": "high",
-                            "range": "high"
-                        }
-                        gpu_level = gpu_level_map.get(gpu_mode, "auto")
-                        gpu_success = await self.set_gpu_performance_via_steamos_manager(gpu_level)
-                        if not gpu_success:
-                            gpu_success = await self.set_gpu_mode(gpu_mode)
-                    else:
-                        # Refuse "performance" on non-JELOS systems - it would write DPM "high"
-                        # and trigger the AMD GPU hang on SteamFork/SteamOS stock kernels.
-                        if gpu_mode == "performance" and not self.is_jelos:
-                            decky.logger.warning(
-                                f"Refusing to apply GPU mode 'performance' (DPM 'high') on non-JELOS "
-                                f"system - AMD power_dpm_force_performance_level=high is known to hang."
-                            )
-                            gpu_success = False
-                        else:
-                            gpu_success = await self.set_gpu_mode(gpu_mode)
-                    if gpu_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied GPU mode: {gpu_mode}")
-                    else:
-                        decky.logger.warning(f"Failed to apply GPU mode: {gpu_mode}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying GPU mode: {e}")
+                results.append(await self._apply_profile_op(
+                    "GPU mode", profile_data["gpuMode"], self._apply_gpu_mode_setting(profile_data["gpuMode"])))
             
             # Apply GPU frequency settings (for manual/range modes)
             if "gpuFreqMin" in profile_data and "gpuFreqMax" in profile_data:
-                total_operations += 1
-                try:
-                    min_freq = profile_data["gpuFreqMin"]
-                    max_freq = profile_data["gpuFreqMax"]
-                    freq_success = await self.set_gpu_frequency(min_freq, max_freq)
-                    if freq_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied GPU frequency range: {min_freq}-{max_freq} MHz")
-                    else:
-                        decky.logger.warning(f"Failed to apply GPU frequency range: {min_freq}-{max_freq} MHz")
-                except Exception as e:
-                    decky.logger.error(f"Error applying GPU frequency: {e}")
+                min_freq = profile_data["gpuFreqMin"]
+                max_freq = profile_data["gpuFreqMax"]
+                results.append(await self._apply_profile_op(
+                    "GPU frequency range", f"{min_freq}-{max_freq} MHz", self.set_gpu_frequency(min_freq, max_freq)))
 
             # Apply amd-pstate mode (active/passive/guided) when present.
             # The frontend has its own slider callable, but loading a
             # profile from disk (game change, AC toggle) needs to honor
             # the field or it silently reverts to the kernel default.
             if "pstateMode" in profile_data:
-                total_operations += 1
-                try:
-                    requested = profile_data["pstateMode"]
-                    current = await self.get_pstate_mode()
-                    if requested != current:
-                        pstate_success = await self.set_pstate_mode(requested)
-                    else:
-                        pstate_success = True
-                    if pstate_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied pstate mode: {requested}")
-                    else:
-                        decky.logger.warning(f"Failed to apply pstate mode: {requested}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying pstate mode: {e}")
+                results.append(await self._apply_profile_op(
+                    "pstate mode", profile_data["pstateMode"], self._apply_pstate_setting(profile_data["pstateMode"])))
 
             # Apply USB autosuspend setting
             if "usbAutosuspend" in profile_data:
-                total_operations += 1
-                try:
-                    usb_enabled = profile_data.get("usbAutosuspend", False)
-                    usb_success = await self.set_usb_autosuspend(usb_enabled)
-                    if usb_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied USB autosuspend: {'enabled' if usb_enabled else 'disabled'}")
-                    else:
-                        decky.logger.warning(f"Failed to apply USB autosuspend: {'enabled' if usb_enabled else 'disabled'}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying USB autosuspend: {e}")
+                usb_enabled = profile_data.get("usbAutosuspend", False)
+                results.append(await self._apply_profile_op(
+                    "USB autosuspend", "enabled" if usb_enabled else "disabled", self.set_usb_autosuspend(usb_enabled)))
             
             # Apply PCIe ASPM setting
             if "pcieAspm" in profile_data:
@@ -4401,62 +5201,30 @@ class Plugin:
                 # counting it as a per-apply failure or spamming the
                 # log with no-op warnings on every game launch.
                 if self.device_info.get("supports_pcie_aspm"):
-                    total_operations += 1
-                    try:
-                        pcie_enabled = profile_data.get("pcieAspm", False)
-                        pcie_policy = "powersave" if pcie_enabled else "default"
-                        pcie_success = await self.set_pcie_aspm_policy(pcie_policy)
-                        if pcie_success:
-                            success_count += 1
-                            decky.logger.info(f"Applied PCIe ASPM: {pcie_policy} policy")
-                        else:
-                            decky.logger.warning(f"Failed to apply PCIe ASPM: {pcie_policy}")
-                    except Exception as e:
-                        decky.logger.error(f"Error applying PCIe ASPM: {e}")
+                    pcie_policy = "powersave" if profile_data.get("pcieAspm", False) else "default"
+                    results.append(await self._apply_profile_op(
+                        "PCIe ASPM policy", pcie_policy, self.set_pcie_aspm_policy(pcie_policy)))
 
             # Apply PCI runtime PM setting
             if "pciRuntimePm" in profile_data:
-                total_operations += 1
-                try:
-                    pci_pm_enabled = profile_data.get("pciRuntimePm", False)
-                    pci_pm_success = await self.set_pci_runtime_pm(pci_pm_enabled)
-                    if pci_pm_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied PCI runtime PM: {'enabled' if pci_pm_enabled else 'disabled'}")
-                    else:
-                        decky.logger.warning(f"Failed to apply PCI runtime PM: {'enabled' if pci_pm_enabled else 'disabled'}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying PCI runtime PM: {e}")
+                pci_pm_enabled = profile_data.get("pciRuntimePm", False)
+                results.append(await self._apply_profile_op(
+                    "PCI runtime PM", "enabled" if pci_pm_enabled else "disabled", self.set_pci_runtime_pm(pci_pm_enabled)))
 
             # Apply WiFi power save setting
             if "wifiPowerSave" in profile_data:
-                total_operations += 1
-                try:
-                    wifi_enabled = profile_data.get("wifiPowerSave", False)
-                    wifi_success = await self.set_wifi_power_save(wifi_enabled)
-                    if wifi_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied WiFi power save: {'enabled' if wifi_enabled else 'disabled'}")
-                    else:
-                        decky.logger.warning(f"Failed to apply WiFi power save: {'enabled' if wifi_enabled else 'disabled'}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying WiFi power save: {e}")
+                wifi_enabled = profile_data.get("wifiPowerSave", False)
+                results.append(await self._apply_profile_op(
+                    "WiFi power save", "enabled" if wifi_enabled else "disabled", self.set_wifi_power_save(wifi_enabled)))
 
             # Apply ROG Ally thermal throttle policy FIRST
             # IMPORTANT: This must be applied BEFORE platform profile, because thermal policy 2
             # causes the ASUS firmware to revert platform profile to "low-power". Setting platform
             # profile LAST overrides this revert behavior.
             if "thermalPolicy" in profile_data and getattr(self, 'device_type', None) == "rog_ally":
-                total_operations += 1
-                try:
-                    tp_success = await self.set_rog_ally_thermal_throttle_policy(profile_data["thermalPolicy"])
-                    if tp_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied ROG Ally thermal policy: {profile_data['thermalPolicy']}")
-                    else:
-                        decky.logger.warning(f"Failed to apply ROG Ally thermal policy: {profile_data['thermalPolicy']}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying ROG Ally thermal policy: {e}")
+                results.append(await self._apply_profile_op(
+                    "ROG Ally thermal policy", profile_data["thermalPolicy"],
+                    self.set_rog_ally_thermal_throttle_policy(profile_data["thermalPolicy"])))
             
             # Apply ROG Ally platform profile LAST
             # Setting platform profile AFTER thermal policy overrides any reverts caused by thermal policy
@@ -4476,25 +5244,9 @@ class Plugin:
                 "platformProfile" in profile_data
                 and self.power_control_capabilities.get("active_method") == "platform_profile"
             ):
-                total_operations += 1
-                try:
-                    # Prefer SteamOS Manager when available (it
-                    # coordinates with amd_pmf cleanly); fall back to
-                    # the ROG Ally controller or generic ACPI sysfs
-                    # write depending on what the device exposes.
-                    if self.steamos_manager_available and not hasattr(self, '_external_manager_token'):
-                        pp_success = await self.set_performance_profile_via_steamos_manager(profile_data["platformProfile"])
-                    elif self.device_controller and hasattr(self.device_controller, "set_platform_profile"):
-                        pp_success = self.device_controller.set_platform_profile(profile_data["platformProfile"])
-                    else:
-                        pp_success = self._write_platform_profile_sysfs(profile_data["platformProfile"])
-                    if pp_success:
-                        success_count += 1
-                        decky.logger.info(f"Applied platform profile: {profile_data['platformProfile']}")
-                    else:
-                        decky.logger.warning(f"Failed to apply platform profile: {profile_data['platformProfile']}")
-                except Exception as e:
-                    decky.logger.error(f"Error applying platform profile: {e}")
+                results.append(await self._apply_profile_op(
+                    "platform profile", profile_data["platformProfile"],
+                    self._apply_platform_profile_setting(profile_data["platformProfile"])))
 
             # Re-apply TDP after platform profile change (active_method
             # is platform_profile only). The earlier code read TDP from
@@ -4522,13 +5274,15 @@ class Plugin:
                         )
                         tdp_reapply = await self.set_tdp(current_tdp)
                         if tdp_reapply:
-                            decky.logger.info(f"TDP re-applied: {current_tdp}W (after platform profile change)")
+                            decky.logger.debug("TDP re-applied: %sW (after platform profile change)", current_tdp)
                         else:
                             decky.logger.warning(f"TDP re-apply failed: {current_tdp}W")
                     except Exception as e:
                         decky.logger.error(f"Error re-applying TDP after platform profile: {e}")
 
             # Calculate success rate
+            success_count = sum(results)
+            total_operations = len(results)
             if total_operations > 0:
                 success_rate = success_count / total_operations
                 decky.logger.info(f"Profile application completed: {success_count}/{total_operations} operations successful ({success_rate:.1%})")
@@ -4563,6 +5317,7 @@ class Plugin:
                             f"apply_profile: drift not fully resolved: "
                             f"{self._verify_state()}"
                         )
+                self._last_applied_profile = requested_profile if all_ok else None
                 return all_ok
             else:
                 decky.logger.warning("No profile operations to apply")
@@ -4867,7 +5622,7 @@ class Plugin:
                 "(first reapply since plugin start)"
             )
         try:
-            await self.apply_profile(cp)
+            await self.apply_profile(cp, force=True)
             self._self_heal_last_reapply = now
         except Exception as e:
             decky.logger.error(f"self_heal: re-apply raised: {e}")
@@ -4876,6 +5631,51 @@ class Plugin:
         """Single UI control entry point. Merges partial into current_profile,
         persists to disk, and applies only the changed fields to hardware.
 
+        Calls arriving within SETTINGS_APPLY_DEBOUNCE of each other (a
+        slider drag, several toggles from one profile switch) are merged
+        into one partial, applied once, and all get that apply's result.
+        """
+        if not isinstance(partial, dict):
+            decky.logger.error(f"update_and_apply_settings: expected dict, got {type(partial).__name__}")
+            return False
+
+        for key, value in partial.items():
+            if value is not None:
+                self._pending_patch[key] = value
+
+        loop = asyncio.get_running_loop()
+        if self._pending_apply is None:
+            self._pending_apply = loop.create_future()
+        if self._pending_apply_timer is not None:
+            self._pending_apply_timer.cancel()
+        self._pending_apply_timer = loop.call_later(SETTINGS_APPLY_DEBOUNCE, self._flush_pending_settings)
+        return await asyncio.shield(self._pending_apply)
+
+    def _flush_pending_settings(self) -> None:
+        """Debounce timer callback: hand the merged partial to _apply_pending_settings"""
+        patch, future = self._pending_patch, self._pending_apply
+        self._pending_patch = {}
+        self._pending_apply = None
+        self._pending_apply_timer = None
+        task = asyncio.create_task(self._apply_pending_settings(patch, future))
+        self._settings_apply_tasks.add(task)
+        task.add_done_callback(self._settings_apply_tasks.discard)
+
+    async def _apply_pending_settings(self, patch: Dict[str, Any], future: asyncio.Future) -> None:
+        """Apply a merged settings partial and resolve its waiting callers"""
+        try:
+            async with self._get_apply_lock():
+                result = await self._apply_settings(patch)
+        except Exception as e:
+            decky.logger.error(f"update_and_apply_settings: apply failed: {e}")
+            result = False
+        if not future.done():
+            future.set_result(result)
+
+    async def _apply_settings(self, partial: Dict[str, Any]) -> bool:
+        """Merge partial into current_profile, persist it and apply only the
+        changed fields to hardware.
+
         Each per-field setter is responsible for its own dependent-state
         coordination (e.g. set_epp temporarily switches governor to powersave
         under amd-pstate-epp active; set_smt calls set_cpu_cores internally
@@ -4885,16 +5685,14 @@ class Plugin:
         enumeration pass. Per-field dispatch keeps single-slider drags
         well under 100ms."""
         try:
-            if not isinstance(partial, dict):
-                decky.logger.error(f"update_and_apply_settings: expected dict, got {type(partial).__name__}")
-                return False
-
             merged = dict(self.current_profile or {})
             for key, value in partial.items():
                 if value is None:
                     continue
                 merged[key] = value
             self.current_profile = merged
+            # Hardware is about to diverge from the last full apply
+            self._last_applied_profile = None
 
             profile_id = (self.current_profile or {}).get("profileId") or "00000000_ac"
             try:
@@ -5029,11 +5827,13 @@ class Plugin:
             
             # Try to read actual limits
             try:
-                with open("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq", "r") as f:
-                    limits["min"] = int(f.read().strip()) // 1000  # Convert to MHz
-                with open("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq", "r") as f:
-                    limits["max"] = int(f.read().strip()) // 1000  # Convert to MHz
-            except Exception as e:
+                min_freq = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_min_freq")
+                if min_freq is not None:
+                    limits["min"] = int(min_freq) // 1000  # Convert to MHz
+                max_freq = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/cpuinfo_max_freq")
+                if max_freq is not None:
+                    limits["max"] = int(max_freq) // 1000  # Convert to MHz
+            except ValueError:
                 pass
                 
             return limits
@@ -5044,20 +5844,11 @@ class Plugin:
     async def get_online_cpus(self) -> List[int]:
         """Get list of online CPU cores"""
         try:
-            online_cpus = []
-            cpu_online_path = "/sys/devices/system/cpu/online"
+            online_range = await self.read_file_safe("/sys/devices/system/cpu/online")
             
-            if os.path.exists(cpu_online_path):
-                with open(cpu_online_path, "r") as f:
-                    online_range = f.read().strip()
-                    
+            if online_range is not None:
                 # Parse range like "0-15" or "0,2-7,9"
-                for part in online_range.split(','):
-                    if '-' in part:
-                        start, end = map(int, part.split('-'))
-                        online_cpus.extend(range(start, end + 1))
-                    else:
-                        online_cpus.append(int(part))
+                online_cpus = parse_cpu_list(online_range)
             else:
                 # Fallback: assume cores 0-15
                 online_cpus = list(range(16))
@@ -5080,6 +5871,7 @@ class Plugin:
         """Check if SMT control is supported"""
         return self.device_info.get("supports_smt", False)
         
+    @cached_capability
     async def supports_core_control(self) -> bool:
         """Check if CPU core control is supported"""
         return os.path.exists("/sys/devices/system/cpu/cpu1/online")
@@ -5097,17 +5889,18 @@ class Plugin:
                 # Try to get actual TDP from ryzenadj
                 try:
                     result = subprocess.run([self.ryzenadj_path, "--info"], 
-                                          capture_output=True, text=True, timeout=5,
+                                          stdout=subprocess.PIPE, text=True, timeout=5,
                                           stderr=subprocess.DEVNULL)  # Suppress stderr to prevent NVMe wake
                     if result.returncode == 0:
                         # Parse ryzenadj output for current TDP
                         for line in result.stdout.split('\n'):
                             if 'PPT LIMIT FAST' in line:
-                                # Extract TDP value
-                                parts = line.split()
-                                for i, part in enumerate(parts):
-                                    if part.replace('.', '', 1).isdigit():
+                                # Extract TDP value (first numeric token)
+                                for part in line.split():
+                                    try:
                                         return int(float(part))
+                                    except ValueError:
+                                        continue
                 except Exception as e:
                     decky.logger.error(f"Ryzenadj info failed: {e}")
             
@@ -5117,6 +5910,26 @@ class Plugin:
             decky.logger.error(f"Failed to get current TDP: {e}")
             return 15
 
+    def _open_gpu_sclk_fd(self) -> Optional[int]:
+        """Open (once) and return the fd for the amdgpu pp_dpm_sclk file"""
+        if self._gpu_sclk_fd is None:
+            for path in GPU_SCLK_PATHS:
+                try:
+                    self._gpu_sclk_fd = os.open(path, os.O_RDONLY)
+                    break
+                except OSError:
+                    continue
+        return self._gpu_sclk_fd
+
+    def _close_gpu_sclk_fd(self) -> None:
+        """Close the cached pp_dpm_sclk fd so the next read reopens it"""
+        if self._gpu_sclk_fd is not None:
+            try:
+                os.close(self._gpu_sclk_fd)
+            except OSError:
+                pass
+            self._gpu_sclk_fd = None
+
     async def get_current_gpu_frequency(self) -> int:
         """Get current GPU frequency - supports both AMD and Intel GPUs"""
         try:
@@ -5124,46 +5937,37 @@ class Plugin:
             intel_gpu_capabilities = sysfs_power_manager.get_capabilities()
             if intel_gpu_capabilities.supports_intel_gpu:
                 return sysfs_power_manager.get_intel_gpu_current_frequency()
-            else:
-                # AMD GPU frequency detection
-                gpu_freq_path = "/sys/class/drm/card0/device/pp_dpm_sclk"
-                if not os.path.exists(gpu_freq_path):
-                    gpu_freq_path = "/sys/class/drm/card1/device/pp_dpm_sclk"
-                    
-                if os.path.exists(gpu_freq_path):
-                    with open(gpu_freq_path, "r") as f:
-                        lines = f.read().strip().split('\n')
-                        # Find the line with * (current frequency)
-                        for line in lines:
-                            if '*' in line:
-                                # Extract frequency (format: "1: 800Mhz *")
-                                parts = line.split()
-                                for part in parts:
-                                    if 'Mhz' in part or 'MHz' in part:
-                                        return int(part.replace('Mhz', '').replace('MHz', ''))
-                
-                # Fallback
-                return self.current_profile.get("gpuFreq", 1600)
-                
-        except Exception as e:
-            decky.logger.error(f"Failed to get GPU frequency: {e}")
+
+            # AMD GPU frequency detection: sysfs regenerates the file on
+            # every read at offset 0, so a pread on the cached fd is enough
+            fd = self._open_gpu_sclk_fd()
+            if fd is not None:
+                try:
+                    match = GPU_SCLK_ACTIVE_RE.search(os.pread(fd, 512, 0))
+                except OSError:
+                    # Device went away (e.g. GPU reset) - reopen next call
+                    self._close_gpu_sclk_fd()
+                    match = None
+                if match:
+                    return int(match.group(1))
+
+            # Fallback
             return self.current_profile.get("gpuFreq", 1600)
+
         except Exception as e:
             decky.logger.error(f"Failed to get GPU frequency: {e}")
-            return 1600
+            return self.current_profile.get("gpuFreq", 1600)
 
     async def get_current_cpu_boost(self) -> bool:
         """Get current CPU boost status (supports AMD and Intel)."""
         try:
-            boost_path = "/sys/devices/system/cpu/cpufreq/boost"
-            if os.path.exists(boost_path):
-                with open(boost_path, "r") as f:
-                    return f.read().strip() == "1"
+            boost = await self.read_file_safe("/sys/devices/system/cpu/cpufreq/boost")
+            if boost is not None:
+                return boost == "1"
             # Intel: /sys/devices/system/cpu/intel_pstate/no_turbo (1 = turbo disabled)
-            intel_path = "/sys/devices/system/cpu/intel_pstate/no_turbo"
-            if os.path.exists(intel_path):
-                with open(intel_path, "r") as f:
-                    return f.read().strip() == "0"
+            no_turbo = await self.read_file_safe("/sys/devices/system/cpu/intel_pstate/no_turbo")
+            if no_turbo is not None:
+                return no_turbo == "0"
             return self.current_profile.get("cpuBoost", True)
         except Exception as e:
             decky.logger.error(f"Failed to get CPU boost status: {e}")
@@ -5172,10 +5976,9 @@ class Plugin:
     async def get_current_power_governor(self) -> str:
         """Get current power governor"""
         try:
-            gov_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
-            if os.path.exists(gov_path):
-                with open(gov_path, "r") as f:
-                    return f.read().strip()
+            governor = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor")
+            if governor is not None:
+                return governor
             return self.current_profile.get("governor", "powersave")
         except Exception as e:
             decky.logger.error(f"Failed to get power governor: {e}")
@@ -5184,10 +5987,9 @@ class Plugin:
     async def get_current_epp(self) -> str:
         """Get current EPP setting"""
         try:
-            epp_path = "/sys/devices/system/cpu/cpu0/cpufreq/energy_performance_preference"
-            if os.path.exists(epp_path):
-                with open(epp_path, "r") as f:
-                    return f.read().strip()
+            epp = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/energy_performance_preference")
+            if epp is not None:
+                return epp
             return self.current_profile.get("epp", "balance_power")
         except Exception as e:
             decky.logger.error(f"Failed to get EPP: {e}")
@@ -5196,38 +5998,36 @@ class Plugin:
     async def get_current_gpu_mode(self) -> str:
         """Get current GPU mode"""
         try:
-            gpu_path = "/sys/class/drm/card0/device/power_dpm_force_performance_level"
-            if not os.path.exists(gpu_path):
-                gpu_path = "/sys/class/drm/card1/device/power_dpm_force_performance_level"
-                
-            if os.path.exists(gpu_path):
-                with open(gpu_path, "r") as f:
-                    dpm_mode = f.read().strip()
-                    # Map DPM modes back to our modes
-                    mode_mapping = {
-                        "low": "battery",
-                        "auto": "balanced", 
-                        "manual": "range",
-                        "high": "performance"
-                    }
-                    return mode_mapping.get(dpm_mode, "balanced")
+            dpm_mode = await self.read_file_safe("/sys/class/drm/card0/device/power_dpm_force_performance_level")
+            if dpm_mode is None:
+                dpm_mode = await self.read_file_safe("/sys/class/drm/card1/device/power_dpm_force_performance_level")
+                
+            if dpm_mode is not None:
+                # Map DPM modes back to our modes
+                mode_mapping = {
+                    "low": "battery",
+                    "auto": "balanced", 
+                    "manual": "range",
+                    "high": "performance"
+                }
+                return mode_mapping.get(dpm_mode, "balanced")
             return self.current_profile.get("gpuMode", "balanced")
         except Exception as e:
             decky.logger.error(f"Failed to get GPU mode: {e}")
             return "balanced"
 
+    @cached_capability
     async def get_available_governors(self) -> List[str]:
 
         """Returns the subset of governors valid for the current pstate mode."""
         try:
             # Read available governors directly from sysfs - this is the
             # authoritative source and reflects the current pstate mode
-            gov_path = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors"
-            if os.path.exists(gov_path):
-                with open(gov_path, "r") as f:
-                    governors = f.read().strip().split()
-                    decky.logger.info(f"GET_AVAILABLE_GOVERNORS: Read from sysfs: {governors}")
-                    return governors
+            available = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/scaling_available_governors")
+            if available is not None:
+                governors = available.split()
+                decky.logger.info(f"GET_AVAILABLE_GOVERNORS: Read from sysfs: {governors}")
+                return governors
             
             # Fallback: determine from scaling driver
             scaling_driver = await self.get_scaling_driver()
@@ -5250,23 +6050,19 @@ class Plugin:
     async def get_available_epp_options(self) -> List[str]:
         """Get list of available EPP options"""
         try:
-            epp_path = "/sys/devices/system/cpu/cpu0/cpufreq/energy_performance_available_preferences"
-            if os.path.exists(epp_path):
-                with open(epp_path, "r") as f:
-                    return f.read().strip().split()
+            available = await self.read_file_safe("/sys/devices/system/cpu/cpu0/cpufreq/energy_performance_available_preferences")
+            if available is not None:
+                return available.split()
             return ["performance", "balance_performance", "balance_power", "power"]
         except Exception as e:
             decky.logger.error(f"Failed to get available EPP options: {e}")
             return ["performance", "balance_performance", "balance_power", "power"]
 
     async def get_available_fan_profiles(self) -> List[str]:
-        """Get list of available fan profiles"""
-        if device_support_available:
-            # Return profiles that match steamfork_fan_controller
-            return ["auto", "quiet", "moderate", "aggressive"]
-        else:
-            return ["auto", "quiet", "moderate", "aggressive"]
+        """Get list of available fan profiles (match steamfork_fan_controller)"""
+        return list(FAN_PROFILES)
 
+    @cached_capability
     async def get_tdp_limits(self) -> Dict[str, int]:
         """Get TDP limits for this device using processor database"""
         device_info = await self.get_device_info()
@@ -5275,6 +6071,7 @@ class Plugin:
             "max": device_info.get("tdp_max", 25)      # Database maximum (ctdp_max)
         }
 
+    @cached_capability
     async def get_default_tdp(self) -> int:
         """Get default TDP from processor database (ctdp_min) - Plugin class method"""
         device_info = await self.get_device_info()
@@ -5283,7 +6080,6 @@ class Plugin:
     async def get_cpu_cstate_info(self) -> Dict[str, Any]:
         """Get C-state information for frontend display"""
         try:
-            from cpu_manager import get_cpu_manager
             cpu_manager = get_cpu_manager()
             
             cstate_info = cpu_manager.get_cpu_cstate_info()
@@ -5295,13 +6091,15 @@ class Plugin:
                 'total_online_cpus': len(cstate_info)
             }
             
-            # Find deepest available C-state
-            for cpu_key, cpu_info in cstate_info.items():
-                for cstate in cpu_info.get('available_cstates', []):
-                    state_name = cstate.get('name', '')
-                    if state_name in ['C3', 'C6', 'C7', 'C8', 'C9', 'C10']:
-                        if state_name > summary['deepest_cstate']:
-                            summary['deepest_cstate'] = state_name
+            # Find deepest available C-state (by depth, not by name: "C10" < "C3" as strings)
+            summary['deepest_cstate'] = max(
+                (cstate.get('name', '')
+                 for cpu_info in cstate_info.values()
+                 for cstate in cpu_info.get('available_cstates', ())
+                 if cstate.get('name', '') in CSTATE_DEPTH),
+                key=CSTATE_DEPTH.__getitem__,
+                default='C0',
+            )
             
             return {
                 'summary': summary,
@@ -5311,36 +6109,20 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Failed to get C-state info: {e}")
             return {
-                'summary': {
-                    'supports_cstates': False,
-                    'deepest_cstate': 'Unknown',
-                    'total_online_cpus': 0
-                },
+                'summary': dict(CSTATE_SUMMARY_UNAVAILABLE),
                 'detailed_info': {}
             }
-        """Get current effective CPU cores considering SMT status"""
-        try:
-            smt_enabled = await self.get_current_smt_status()
-            physical_cores = psutil.cpu_count(logical=False)
-            
-            # Count actually online cores
-            online_cpus = await self.get_online_cpus()
-            online_count = len([cpu for cpu in online_cpus if await self.is_cpu_online(cpu)])
-            
-            return online_count
-        except Exception as e:
-            decky.logger.error(f"Failed to get effective CPU cores: {e}")
-            return 8
 
     async def is_cpu_online(self, cpu_id: int) -> bool:
         """Check if a specific CPU core is online"""
         try:
             if cpu_id == 0:
                 return True  # CPU 0 is always online
-            cpu_path = f"/sys/devices/system/cpu/cpu{cpu_id}/online"
-            if os.path.exists(cpu_path):
-                with open(cpu_path, "r") as f:
-                    return f.read().strip() == "1"
+            # The kernel's online list covers every CPU, including ones
+            # without a per-CPU online file (not hot-pluggable)
+            online_range = await self.read_file_safe("/sys/devices/system/cpu/online")
+            if online_range is not None:
+                return cpu_id in parse_cpu_list(online_range)
             return True
         except Exception as e:
             return True
@@ -5348,9 +6130,8 @@ class Plugin:
     async def get_current_cpu_core_count(self) -> int:
         """Get current number of online CPU cores"""
         try:
-            # Use the same method as get_online_cpus for consistency
-            online_cpus = await self.get_online_cpus()
-            return len(online_cpus)
+            # One read of /sys/devices/system/cpu/online, no per-CPU files
+            return len(await self.get_online_cpus())
         except Exception as e:
             decky.logger.error(f"Failed to get current CPU core count: {e}")
             return 8
@@ -5360,12 +6141,11 @@ class Plugin:
         """Get current PCIe ASPM policy"""
         try:
             if self.device_info.get("supports_pcie_aspm"):
-                with open("/sys/module/pcie_aspm/parameters/policy", "r") as f:
-                    policy_line = f.read().strip()
-                    # Extract current policy (marked with brackets)
-                    for policy in policy_line.split():
-                        if policy.startswith("[") and policy.endswith("]"):
-                            return policy[1:-1]
+                policy_line = read_sysfs_attr("/sys/module/pcie_aspm/parameters/policy")
+                # Extract current policy (marked with brackets)
+                match = ASPM_POLICY_RE.search(policy_line or "")
+                if match:
+                    return match.group(1)
             return "default"
         except Exception as e:
             decky.logger.error(f"Failed to get PCIe ASPM policy: {e}")
@@ -5393,8 +6173,7 @@ class Plugin:
                 return True
 
             try:
-                with open("/sys/module/pcie_aspm/parameters/policy", "w") as f:
-                    f.write(policy)
+                write_sysfs_attr("/sys/module/pcie_aspm/parameters/policy", policy)
             except PermissionError:
                 # ACPI FADT reports ASPM as unsupported on this BIOS
                 # (verified on ROG Ally X / JELOS: dmesg shows
@@ -5525,8 +6304,7 @@ class Plugin:
         """Get current memory swappiness value"""
         try:
             if self.device_info.get("supports_memory_tuning"):
-                with open("/proc/sys/vm/swappiness", "r") as f:
-                    return int(f.read().strip())
+                return int(read_sysfs_attr("/proc/sys/vm/swappiness"))
             return 60
         except Exception as e:
             decky.logger.error(f"Failed to get swappiness: {e}")
@@ -5541,8 +6319,7 @@ class Plugin:
             if not 0 <= value <= 100:
                 return False
                 
-            with open("/proc/sys/vm/swappiness", "w") as f:
-                f.write(str(value))
+            write_sysfs_attr("/proc/sys/vm/swappiness", str(value))
             decky.logger.info(f"Set swappiness to: {value}")
             return True
         except Exception as e:
@@ -5556,141 +6333,127 @@ class Plugin:
                 return {}
                 
             usb_devices = {}
+            manageable, _excluded = await self._scan_usb_devices()
             
-            # Get VID/PID pairs of all input devices from /proc/bus/input/devices
-            input_device_vid_pids = self.get_input_device_vid_pids()
-            
-            # Exclusion logic matches set_usb_autosuspend
-            CRITICAL_DEVICE_EXCLUSIONS = [
-                # Gaming controllers - held open by driver, can't suspend
-                "gamepad", "controller", "joystick", "xbox", "playstation", "nintendo",
-                "game", "joy", "pad", "stick",
-                # Keyboards - must never suspend, even with wakeup capability
-                "keyboard",
-                # Pointing devices - many don't auto-resume from suspend
-                "mouse", "touchpad", "trackpad", "touchscreen",
-                # Generic HID/input patterns - too broad, may match critical devices
-                "hid", "input", "builtin", "internal", "integrated",
-                # Handheld-specific controllers
-                "ayaneo", "rog", "ally", "steam", "deck", "onexplayer", "gpd"
-            ]
-            
-            for control_file in glob.glob("/sys/bus/usb/devices/*/power/control"):
-                device_path = os.path.dirname(os.path.dirname(control_file))
-                device_name = os.path.basename(device_path)
-                
-                # Check if this device should be excluded (same logic as set function)
-                should_exclude = False
-                device_info = ""
-                
+            # Only include non-excluded devices in the status
+            for device_name, control_file in manageable:
                 try:
-                    # First, check if this USB device matches any input device VID/PID
-                    vendor_file = os.path.join(device_path, "idVendor")
-                    product_file = os.path.join(device_path, "idProduct")
-                    
-                    if os.path.exists(vendor_file) and os.path.exists(product_file):
-                        with open(vendor_file, "r") as f:
-                            device_vendor = f.read().strip()
-                        with open(product_file, "r") as f:
-                            device_product = f.read().strip()
-                        
-                        # Check if this VID/PID matches any input device
-                        for input_vid, input_pid in input_device_vid_pids:
-                            if device_vendor == input_vid and device_product == input_pid:
-                                should_exclude = True
-                                break
-                    
-                    # Get device information for exclusion check
-                    product_name_file = os.path.join(device_path, "product")
-                    if os.path.exists(product_name_file):
-                        with open(product_name_file, "r") as f:
-                            device_info = f.read().strip().lower()
-                    
-                    manufacturer_file = os.path.join(device_path, "manufacturer")
-                    if os.path.exists(manufacturer_file):
-                        with open(manufacturer_file, "r") as f:
-                            manufacturer = f.read().strip().lower()
-                            device_info += " " + manufacturer
-                    
-                    # Check interface class for HID devices
-                    interface_dirs = glob.glob(f"{device_path}/*:*")
-                    for interface_dir in interface_dirs:
-                        class_file = os.path.join(interface_dir, "bInterfaceClass")
-                        if os.path.exists(class_file):
-                            with open(class_file, "r") as f:
-                                interface_class = f.read().strip()
-                                if interface_class == "03":  # HID class
-                                    device_info += " hid"
-                                    break
-                    
-                    # If not already excluded by VID/PID, check name-based exclusion patterns
-                    if not should_exclude:
-                        device_check_string = f"{device_name} {device_info}".lower()
-                        for exclusion in CRITICAL_DEVICE_EXCLUSIONS:
-                            if exclusion in device_check_string:
-                                should_exclude = True
-                                break
-                    
+                    control = read_sysfs_attr(control_file)
+                    usb_devices[device_name] = (control == "auto")
                 except Exception as e:
-                    should_exclude = True  # Exclude if we can't read device info
-                
-                # Only include non-excluded devices in the status
-                if not should_exclude:
-                    try:
-                        with open(control_file, "r") as f:
-                            control = f.read().strip()
-                            usb_devices[device_name] = (control == "auto")
-                    except Exception as e:
-                        continue
+                    continue
                     
             return usb_devices
         except Exception as e:
             decky.logger.error(f"Failed to get USB autosuspend status: {e}")
             return {}
 
+    def _get_usb_scan_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Thread pool for _scan_usb_devices, created on first use and reused"""
+        if self._usb_scan_executor is None:
+            self._usb_scan_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=USB_SCAN_MAX_WORKERS, thread_name_prefix="powerdeck-usb-scan")
+        return self._usb_scan_executor
+
+    async def _scan_usb_devices(self) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str, str]]]:
+        """Split USB devices into ones safe to power manage and critical ones
+
+        Shared by get_usb_autosuspend_status and set_usb_autosuspend so both
+        apply the same exclusion rules. Devices are inspected concurrently on
+        a pool of USB_SCAN_MAX_WORKERS threads. Returns ([(device_name, control_file)],
+        [(device_name, exclusion_reason, device_info)]).
+        """
+        # Get VID/PID pairs of all input devices from /proc/bus/input/devices
+        input_device_vid_pids = self._get_input_device_vid_pids_cached()
+        
+        control_files = list_usb_control_files()
+        loop = asyncio.get_running_loop()
+        executor = self._get_usb_scan_executor()
+        inspections = await asyncio.gather(
+            *(loop.run_in_executor(executor, inspect_usb_device,
+                                   os.path.dirname(os.path.dirname(control_file)),
+                                   input_device_vid_pids)
+              for control_file in control_files),
+            return_exceptions=True,
+        )
+        
+        manageable = []
+        excluded = []
+        for control_file, inspection in zip(control_files, inspections):
+            device_name = os.path.basename(os.path.dirname(os.path.dirname(control_file)))
+            if isinstance(inspection, Exception):
+                # If we can't read device info, err on the side of caution and exclude it
+                excluded.append((device_name, f"safety exclusion due to read error: {inspection}", ""))
+                continue
+            should_exclude, exclusion_reason, device_info = inspection
+            if should_exclude:
+                excluded.append((device_name, exclusion_reason, device_info))
+            else:
+                manageable.append((device_name, control_file))
+        return manageable, excluded
+
+    def _input_devices_changed(self) -> Optional[bool]:
+        """Poll /proc/bus/input/devices for hotplug; None if it can't be polled
+
+        The input core reports the file readable once per change to the
+        device list (each poll consumes the event), so a fresh watcher
+        always reports a change first.
+        """
+        if self._input_devices_poller is None:
+            try:
+                self._input_devices_fd = os.open(INPUT_DEVICES_PATH, os.O_RDONLY)
+                poller = select.poll()
+                poller.register(self._input_devices_fd, select.POLLIN)
+                self._input_devices_poller = poller
+            except OSError as e:
+                self._close_input_devices_fd()
+                debug_log(f"Cannot watch {INPUT_DEVICES_PATH}: {e}")
+                return None
+        try:
+            return bool(self._input_devices_poller.poll(0))
+        except OSError:
+            self._close_input_devices_fd()
+            return None
+
+    def _close_input_devices_fd(self) -> None:
+        """Stop watching /proc/bus/input/devices"""
+        self._input_devices_poller = None
+        if self._input_devices_fd is not None:
+            try:
+                os.close(self._input_devices_fd)
+            except OSError:
+                pass
+            self._input_devices_fd = None
+
+    def _get_input_device_vid_pids_cached(self) -> FrozenSet[Tuple[str, str]]:
+        """Input device VID/PID pairs, reparsed only when the input device list changes"""
+        cached_at, vid_pids = self._input_vid_pid_cache
+        now = time.monotonic()
+        changed = self._input_devices_changed()
+        if changed is None:
+            # Not pollable: fall back to a short TTL
+            changed = now - cached_at >= INPUT_VID_PID_CACHE_TTL
+        if vid_pids is None or changed:
+            vid_pids = frozenset(self.get_input_device_vid_pids())
+            self._input_vid_pid_cache = (now, vid_pids)
+        return vid_pids
+
     def get_input_device_vid_pids(self) -> List[Tuple[str, str]]:
         """Parse /proc/bus/input/devices to find all input device VID/PID pairs (excluding fingerprint readers)"""
         try:
             vid_pids = []
             
-            with open("/proc/bus/input/devices", "r") as f:
+            # One bytes read of the whole file; INPUT_DEVICE_RE pulls the
+            # vendor, product, name and handlers out of each device block
+            with open(INPUT_DEVICES_PATH, "rb") as f:
                 content = f.read()
             
-            # Split into device blocks
-            device_blocks = content.split("\n\n")
-            
-            for block in device_blocks:
-                if not block.strip():
-                    continue
-                    
-                lines = block.strip().split("\n")
-                vendor = None
-                product = None
-                name = ""
-                handlers = ""
-                
-                # Parse device information
-                for line in lines:
-                    line = line.strip()
-                    if line.startswith("I: Bus="):
-                        # Extract vendor and product from I: line
-                        # Format: I: Bus=0003 Vendor=045e Product=0b00 Version=0001
-                        parts = line.split()
-                        for part in parts:
-                            if part.startswith("Vendor="):
-                                vendor = part.split("=")[1]
-                            elif part.startswith("Product="):
-                                product = part.split("=")[1]
-                    elif line.startswith("N: Name="):
-                        # Extract device name
-                        name = line.split("Name=", 1)[1].strip('"').lower()
-                    elif line.startswith("H: Handlers="):
-                        # Extract handlers to see what type of device this is
-                        handlers = line.split("Handlers=", 1)[1].lower()
-                
-                # Skip devices without VID/PID or that are clearly not controllers/input devices
-                if not vendor or not product:
-                    continue
+            for match in INPUT_DEVICE_RE.finditer(content):
+                vendor, product, name, handlers = (
+                    field.decode(errors="replace") for field in match.groups()
+                )
+                name = name.strip('"').lower()
+                handlers = handlers.strip().lower()
                 
                 # Exclude fingerprint readers specifically
                 if "fingerprint" in name or "finger" in name:
@@ -5722,109 +6485,24 @@ class Plugin:
                 
             setting = "auto" if enable else "on"
             count = 0
-            excluded_count = 0
-            
-            # Get VID/PID pairs of all input devices from /proc/bus/input/devices
-            input_device_vid_pids = self.get_input_device_vid_pids()
-            
-            # Device types that should NOT be power managed
-            CRITICAL_DEVICE_EXCLUSIONS = [
-                # Gaming controllers - held open by driver, can't suspend
-                "gamepad", "controller", "joystick", "xbox", "playstation", "nintendo",
-                "game", "joy", "pad", "stick",
-                # Keyboards - must never suspend, even with wakeup capability
-                "keyboard",
-                # Pointing devices - many don't auto-resume from suspend
-                "mouse", "touchpad", "trackpad", "touchscreen",
-                # Generic HID/input patterns - too broad, may match critical devices
-                "hid", "input", "builtin", "internal", "integrated",
-                # Handheld-specific controllers
-                "ayaneo", "rog", "ally", "steam", "deck", "onexplayer", "gpd"
-            ]
             
-            for control_file in glob.glob("/sys/bus/usb/devices/*/power/control"):
-                device_path = os.path.dirname(os.path.dirname(control_file))
-                device_name = os.path.basename(device_path)
-                
-                # Check if this device should be excluded from power management
-                should_exclude = False
-                device_info = ""
-                exclusion_reason = ""
-                
-                try:
-                    # First, check if this USB device matches any input device VID/PID
-                    vendor_file = os.path.join(device_path, "idVendor")
-                    product_file = os.path.join(device_path, "idProduct")
-                    
-                    if os.path.exists(vendor_file) and os.path.exists(product_file):
-                        with open(vendor_file, "r") as f:
-                            device_vendor = f.read().strip()
-                        with open(product_file, "r") as f:
-                            device_product = f.read().strip()
-                        
-                        # Check if this VID/PID matches any input device
-                        for input_vid, input_pid in input_device_vid_pids:
-                            if device_vendor == input_vid and device_product == input_pid:
-                                should_exclude = True
-                                exclusion_reason = f"matches input device VID/PID {input_vid}:{input_pid}"
-                                break
-                    
-                    # Get device product name if available
-                    product_name_file = os.path.join(device_path, "product")
-                    if os.path.exists(product_name_file):
-                        with open(product_name_file, "r") as f:
-                            device_info = f.read().strip().lower()
-                    
-                    # Get device manufacturer if available
-                    manufacturer_file = os.path.join(device_path, "manufacturer")
-                    if os.path.exists(manufacturer_file):
-                        with open(manufacturer_file, "r") as f:
-                            manufacturer = f.read().strip().lower()
-                            device_info += " " + manufacturer
-                    
-                    # Check interface class (HID devices are often controllers/keyboards)
-                    interface_dirs = glob.glob(f"{device_path}/*:*")
-                    for interface_dir in interface_dirs:
-                        class_file = os.path.join(interface_dir, "bInterfaceClass")
-                        if os.path.exists(class_file):
-                            with open(class_file, "r") as f:
-                                interface_class = f.read().strip()
-                                # Class 03 = HID (Human Interface Device) - often controllers/keyboards
-                                if interface_class == "03":
-                                    device_info += " hid"
-                                    break
-                    
-                    # If not already excluded by VID/PID, check name-based exclusion patterns
-                    if not should_exclude:
-                        device_check_string = f"{device_name} {device_info}".lower()
-                        for exclusion in CRITICAL_DEVICE_EXCLUSIONS:
-                            if exclusion in device_check_string:
-                                should_exclude = True
-                                exclusion_reason = f"matches pattern '{exclusion}'"
-                                break
-                    
-                    # Log exclusion details
-                    if should_exclude:
-                        decky.logger.info(f"USB Power Management: Excluding critical device '{device_name}' ({exclusion_reason}) - device info: {device_info}")
-                    
-                except Exception as e:
-                    # If we can't read device info, err on the side of caution and exclude it
-                    decky.logger.warning(f"Could not read USB device info for {device_name}, excluding for safety: {e}")
-                    should_exclude = True
-                    exclusion_reason = "safety exclusion due to read error"
-                
-                if should_exclude:
-                    excluded_count += 1
-                    continue
-                
-                try:
-                    with open(control_file, "w") as f:
-                        f.write(setting)
-                    count += 1
-                    decky.logger.debug(f"Set USB autosuspend to {setting} for device {device_name}")
-                except Exception as e:
-                    decky.logger.warning(f"Failed to set USB autosuspend for {device_name}: {e}")
+            manageable, excluded = await self._scan_usb_devices()
+            excluded_count = len(excluded)
+            
+            # Log exclusion details
+            for device_name, exclusion_reason, device_info in excluded:
+                decky.logger.info(f"USB Power Management: Excluding critical device '{device_name}' ({exclusion_reason}) - device info: {device_info}")
+            
+            # All control writes go out in one executor job
+            errors = await asyncio.get_running_loop().run_in_executor(
+                None, write_sysfs_batch, [(control_file, setting) for _, control_file in manageable]
+            )
+            for (device_name, _control_file), error in zip(manageable, errors):
+                if error is not None:
+                    decky.logger.warning(f"Failed to set USB autosuspend for {device_name}: {error}")
                     continue
+                count += 1
+                decky.logger.debug(f"Set USB autosuspend to {setting} for device {device_name}")
                     
             decky.logger.info(f"USB Power Management: Set autosuspend to {setting} for {count} devices, excluded {excluded_count} critical devices")
             return count > 0
@@ -5832,6 +6510,48 @@ class Plugin:
             decky.logger.error(f"Failed to set USB autosuspend: {e}")
             return False
 
+    def _find_wifi_interface(self) -> Optional[str]:
+        """WiFi interface name; cached for as long as the interface exists"""
+        if self._wifi_iface and os.path.exists(f"/sys/class/net/{self._wifi_iface}"):
+            return self._wifi_iface
+        
+        interface = None
+        
+        # cfg80211 interfaces from /sys/class/net (no fork)
+        if nl80211_available:
+            interfaces = wifi_power.find_wifi_interfaces()
+            if interfaces:
+                interface = interfaces[0]
+        
+        # Fallback: try to find interface from /proc/net/wireless
+        if not interface:
+            try:
+                with open("/proc/net/wireless", "r") as f:
+                    lines = f.readlines()
+                    for line in lines[2:]:  # Skip header lines
+                        if ':' in line:
+                            interface = line.split(':')[0].strip()
+                            break
+            except Exception as e:
+                self.log_warning_once(f"Failed to read /proc/net/wireless: {e}")
+        
+        # Last resort: ask iw
+        if not interface:
+            try:
+                result = subprocess.run(["iw", "dev"], capture_output=True, text=True, timeout=5)
+                if result.returncode == 0:
+                    for line in result.stdout.split('\n'):
+                        if 'Interface' in line:
+                            interface = line.split()[-1]
+                            break
+                else:
+                    self.log_warning_once(f"iw dev command failed: {result.stderr}")
+            except Exception as e:
+                self.log_warning_once(f"iw command not available: {e}")
+        
+        self._wifi_iface = interface
+        return interface
+
     async def get_wifi_power_save(self) -> bool:
         """Get WiFi power save status"""
         try:
@@ -5842,6 +6562,14 @@ class Plugin:
             if not self.device_info.get("supports_wifi_power_save"):
                 return False
                 
+            # Ask nl80211 directly; fall back to iwconfig if netlink fails
+            interface = self._find_wifi_interface()
+            if nl80211_available and interface:
+                try:
+                    return wifi_power.get_power_save(interface)
+                except OSError as e:
+                    debug_log(f"nl80211 power save query failed for {interface}: {e}")
+                
             # Use iwconfig to check power management
             result = subprocess.run(["iwconfig"], capture_output=True, text=True, timeout=5)
             if result.returncode == 0:
@@ -5862,43 +6590,25 @@ class Plugin:
                 self.log_warning_once("WiFi power save not supported on this device")
                 return False
                 
-            # Get WiFi interface name using both methods
-            interface = None
-            
-            # Try iw command first
-            try:
-                result = subprocess.run(["iw", "dev"], capture_output=True, text=True, timeout=5)
-                if result.returncode == 0:
-                    for line in result.stdout.split('\n'):
-                        if 'Interface' in line:
-                            interface = line.split()[-1]
-                            break
-                else:
-                    self.log_warning_once(f"iw dev command failed: {result.stderr}")
-            except Exception as e:
-                self.log_warning_once(f"iw command not available: {e}")
-            
-            # Fallback: try to find interface from /proc/net/wireless
-            if not interface:
-                try:
-                    with open("/proc/net/wireless", "r") as f:
-                        lines = f.readlines()
-                        for line in lines[2:]:  # Skip header lines
-                            if ':' in line:
-                                interface = line.split(':')[0].strip()
-                                break
-                except Exception as e:
-                    self.log_warning_once(f"Failed to read /proc/net/wireless: {e}")
-                    
+            interface = self._find_wifi_interface()
             if not interface:
                 decky.logger.error("No WiFi interface found")
                 return False
                 
             decky.logger.info(f"Using WiFi interface: {interface}")
             
-            # Set power save mode - try both iw and iwconfig methods
+            # Set power save mode - try nl80211, then iw and iwconfig methods
             power_mode = "on" if enable else "off"
             
+            # Method 0: Talk to nl80211 directly (no fork/exec)
+            if nl80211_available:
+                try:
+                    wifi_power.set_power_save(interface, enable)
+                    decky.logger.info(f"Set WiFi power save to: {power_mode} using nl80211")
+                    return True
+                except OSError as e:
+                    self.log_warning_once(f"nl80211 power save failed: {e}")
+            
             # Method 1: Try iw command (newer systems) - requires root
             try:
                 result = subprocess.run(["sudo", "iw", interface, "set", "power_save", power_mode], 
@@ -5938,40 +6648,16 @@ class Plugin:
                 return self.cpu_manager.get_system_info()
             else:
                 decky.logger.warning("CPU manager not initialized")
+                max_cores = await self.detect_max_cpu_cores()
                 return {
-                    'scaling_driver': 'unknown',
-                    'available_governors': ['performance', 'powersave', 'schedutil'],
-                    'current_governor': 'unknown',
-                    'available_epp_options': ['performance', 'balance_performance', 'balance_power', 'power'],
-                    'current_epp': 'unknown',
-                    'supports_cpu_boost': False,
-                    'cpu_boost_enabled': False,
-                    'supports_smt': False,
-                    'smt_enabled': False,
-                    'supports_epp': False,
-                    'pstate_status': None,
-                    'online_cpus': await self.detect_max_cpu_cores(),
-                    'total_cpus': await self.detect_max_cpu_cores(),
-                    'max_cpu_cores': await self.detect_max_cpu_cores()
+                    **CPU_SYSTEM_INFO_DEFAULT,
+                    'online_cpus': max_cores,
+                    'total_cpus': max_cores,
+                    'max_cpu_cores': max_cores
                 }
         except Exception as e:
             decky.logger.error(f"Failed to get CPU system info: {e}")
-            return {
-                'scaling_driver': 'error',
-                'available_governors': ['performance', 'powersave'],
-                'current_governor': 'unknown',
-                'available_epp_options': ['performance', 'power'],
-                'current_epp': 'unknown',
-                'supports_cpu_boost': False,
-                'cpu_boost_enabled': False,
-                'supports_smt': False,
-                'smt_enabled': False,
-                'supports_epp': False,
-                'pstate_status': None,
-                'online_cpus': 2,
-                'total_cpus': 4,
-                'max_cpu_cores': 4
-            }
+            return dict(CPU_SYSTEM_INFO_ERROR)
 
     async def get_per_game_profiles_enabled(self) -> bool:
         """Get per-game profiles setting"""
@@ -6017,12 +6703,7 @@ class Plugin:
 
     async def is_rog_ally_device(self) -> bool:
         """Check if current device is a ROG Ally or ROG Ally X"""
-        try:
-            device_name = self.device_info.get("device_name", "").lower()
-            return ("rog ally" in device_name or "rc71" in device_name or "rc72" in device_name)
-        except Exception as e:
-            decky.logger.error(f"Failed to check ROG Ally device: {e}")
-            return False
+        return self._is_rog_ally
 
     async def get_tdp_control_mode(self) -> str:
         """Get current TDP control mode.
@@ -6048,7 +6729,7 @@ class Plugin:
                 return "steamos_manager"
             if self.device_type == "rog_ally" and self.rog_ally_native_tdp_enabled:
                 return "rog_ally_native"
-            if self.device_type in ["legion", "steam_deck"]:
+            if self.device_type in ("legion", "steam_deck"):
                 return f"{self.device_type}_native"
             return "powerdeck"
         except Exception as e:
@@ -6056,98 +6737,82 @@ class Plugin:
             return "powerdeck"
 
     # Processor Database API Methods
+    @rpc_safe("get processor info", lambda e: {"detected": False, "error": str(e)})
     async def get_processor_info(self) -> Dict[str, Any]:
         """Get comprehensive processor information and specifications"""
-        try:
-            if processor_support_available and self.processor_info:
-                return self.processor_info
-            else:
-                return {
-                    "detected": False,
-                    "processor_name": "Unknown Processor",
-                    "cpu_info": "Detection not available",
-                    "message": "Processor database not loaded"
-                }
-        except Exception as e:
-            decky.logger.error(f"Failed to get processor info: {e}")
-            return {"detected": False, "error": str(e)}
+        if processor_support_available and self.processor_info:
+            return self.processor_info
+        else:
+            return {
+                "detected": False,
+                "processor_name": "Unknown Processor",
+                "cpu_info": "Detection not available",
+                "message": "Processor database not loaded"
+            }
 
+    # rpc_safe outermost so a failed detection's error result isn't cached
+    @rpc_safe("get processor capabilities", lambda e: {"available": False, "error": str(e)})
+    @cached_capability
     async def get_processor_capabilities(self) -> Dict[str, Any]:
         """Get processor capabilities and recommendations for PowerDeck"""
-        try:
-            if not processor_support_available:
-                return {"available": False, "message": "Processor detection not available"}
-                
-            capabilities = get_current_processor_info()
+        if not processor_support_available:
+            return {"available": False, "message": "Processor detection not available"}
             
-            # Add current system state
-            capabilities["current_tdp_limits"] = self.tdp_limits
-            capabilities["is_handheld"] = is_handheld_device()
-            capabilities["detection_available"] = True
-            
-            return capabilities
-            
-        except Exception as e:
-            decky.logger.error(f"Failed to get processor capabilities: {e}")
-            return {"available": False, "error": str(e)}
+        capabilities = get_current_processor_info()
+        
+        # Add current system state
+        capabilities["current_tdp_limits"] = self.tdp_limits
+        capabilities["is_handheld"] = is_handheld_device()
+        capabilities["detection_available"] = True
+        
+        return capabilities
 
+    @rpc_safe("refresh processor detection", False)
     async def refresh_processor_detection(self) -> bool:
         """Refresh processor detection (clear cache and re-detect)"""
-        try:
-            if not processor_support_available:
-                return False
-                
-            refresh_processor_detection()
-            self.processor_info = get_current_processor_info()
-            
-            # Update TDP limits based on refreshed detection
-            if self.processor_info.get("detected", False):
-                proc_tdp_min, proc_tdp_max = get_processor_tdp_limits()
-                self.tdp_limits = {"min": proc_tdp_min, "max": proc_tdp_max}
-                self.device_info["min_tdp"] = proc_tdp_min
-                self.device_info["max_tdp"] = proc_tdp_max
-                
-            decky.logger.info("Processor detection refreshed")
-            return True
-            
-        except Exception as e:
-            decky.logger.error(f"Failed to refresh processor detection: {e}")
+        if not processor_support_available:
             return False
+            
+        refresh_processor_detection()
+        self.processor_info = get_current_processor_info()
+        
+        # Update TDP limits based on refreshed detection
+        if self.processor_info.get("detected", False):
+            proc_tdp_min, proc_tdp_max = get_processor_tdp_limits()
+            self.tdp_limits = {"min": proc_tdp_min, "max": proc_tdp_max}
+            self.device_info["min_tdp"] = proc_tdp_min
+            self.device_info["max_tdp"] = proc_tdp_max
+
+        self._invalidate_capability_cache()
+        decky.logger.info("Processor detection refreshed")
+        return True
 
+    @rpc_safe("get processor database info", lambda e: {"available": False, "error": str(e)})
     async def get_processor_database_info(self) -> Dict[str, Any]:
         """Get information about the processor database"""
-        try:
-            if not processor_support_available:
-                return {"available": False, "message": "Processor database not loaded"}
-                
-            # Use unified processor database instead of deprecated amd_processor_db
-            db_stats = get_database_stats()
-            
-            return {
-                "available": True,
-                "total_processors": db_stats.get("total_processors", 0),
-                "handheld_processors": db_stats.get("amd_processors", 0),  # AMD processors typically used in handhelds
-                "processor_list": [f"Unified DB: {db_stats.get('total_processors', 0)} processors"],  # Summary instead of full list
-                "amd_processors": db_stats.get("amd_processors", 0),
-                "intel_processors": db_stats.get("intel_processors", 0),
-                "database_version": get_plugin_version()
-            }
+        if not processor_support_available:
+            return {"available": False, "message": "Processor database not loaded"}
             
-        except Exception as e:
-            decky.logger.error(f"Failed to get processor database info: {e}")
-            return {"available": False, "error": str(e)}
+        # Use unified processor database instead of deprecated amd_processor_db
+        db_stats = get_database_stats()
+        
+        return {
+            "available": True,
+            "total_processors": db_stats.get("total_processors", 0),
+            "handheld_processors": db_stats.get("amd_processors", 0),  # AMD processors typically used in handhelds
+            "processor_list": [f"Unified DB: {db_stats.get('total_processors', 0)} processors"],  # Summary instead of full list
+            "amd_processors": db_stats.get("amd_processors", 0),
+            "intel_processors": db_stats.get("intel_processors", 0),
+            "database_version": get_plugin_version()
+        }
 
+    @rpc_safe("get recommended profiles", lambda e: [])
     async def get_recommended_profiles_for_processor(self) -> List[Dict[str, Any]]:
         """Get recommended power profiles for the current processor"""
-        try:
-            if not processor_support_available or not self.processor_info:
-                return []
-                
-            return self.processor_info.get("recommended_profiles", [])
-            
-        except Exception as e:
-            decky.logger.error(f"Failed to get recommended profiles: {e}")
+        if not processor_support_available or not self.processor_info:
             return []
+            
+        return self.processor_info.get("recommended_profiles", [])
 
     # SteamFork Fan Control Integration
     async def get_fan_control_info(self) -> Dict[str, Any]:
@@ -6186,12 +6851,43 @@ class Plugin:
 
     # Proper priority cascade: sysfs -> database -> fallback
     async def get_hybrid_tdp_limits(self) -> Dict[str, Any]:
-        """Get TDP limits using proper priority: sysfs -> database -> fallback"""
-        try:
+        """Get TDP limits using proper priority: sysfs -> database -> fallback
+
+        The detected limits don't change while the plugin runs, so they are
+        kept until _invalidate_capability_cache(); only the sysfs "current"
+        value is re-read on each call.
+        """
+        if self._hybrid_tdp_limits is None:
+            limits = await self._detect_hybrid_tdp_limits()
+            if limits["method"] == "emergency_fallback":
+                return limits  # Don't pin an error result
+            self._hybrid_tdp_limits = limits
+        
+        limits = self._hybrid_tdp_limits
+        if limits["method"] == "sysfs":
+            try:
+                return {**limits, "current": sysfs_power_manager.get_current_tdp_watts()}
+            except Exception as e:
+                debug_error(f"Failed to read current sysfs TDP: {e}")
+        return limits
+
+    async def _detect_hybrid_tdp_limits(self) -> Dict[str, Any]:
+        """Probe TDP limits: sysfs -> database -> device fallback"""
+        try:
+            # Both probes block on sysfs/database reads and don't depend on each
+            # other, so run them side by side and then pick by priority
+            loop = asyncio.get_running_loop()
+            sysfs_future = (loop.run_in_executor(None, get_sysfs_power_capabilities)
+                            if sysfs_support_available else None)
+            database_future = (loop.run_in_executor(None, read_processor_database_tdp)
+                               if processor_support_available else None)
+            await asyncio.gather(*(future for future in (sysfs_future, database_future) if future),
+                                 return_exceptions=True)
+            
             # 1. Try sysfs approach first
-            if sysfs_support_available:
+            if sysfs_future:
                 try:
-                    sysfs_caps = get_sysfs_power_capabilities()
+                    sysfs_caps = sysfs_future.result()
                     if sysfs_caps["detected"] and sysfs_caps.get("tdp_info", {}).get("supports_tdp_control"):
                         info_log(f"Using sysfs power management for {sysfs_caps['processor_name']}")
                         return {
@@ -6207,10 +6903,9 @@ class Plugin:
                     debug_error(f"Sysfs power detection failed: {e}")
             
             # 2. Fall back to processor database if sysfs missing data
-            if processor_support_available:
+            if database_future:
                 try:
-                    proc_tdp_min, proc_tdp_max = get_processor_tdp_limits()
-                    processor_info = get_current_processor_info()
+                    proc_tdp_max, processor_info = database_future.result()
                     info_log(f"Using processor database for {processor_info.get('processor_name', 'Unknown')}")
                     return {
                         "method": "database",
@@ -6243,6 +6938,7 @@ class Plugin:
             }
 
     # CPU database integration for proper TDP limits
+    @cached_capability
     async def get_processor_tdp_limits(self) -> Dict[str, Any]:
         """Get processor-based TDP limits with CPU detection - CORRECTED: 4W min, database max"""
         try:
@@ -6271,22 +6967,23 @@ class Plugin:
 
     # Enhanced device classification for proper profile naming
     def calculate_safe_tdp_limits(self, device_name: str) -> Dict[str, int]:
-        """Calculate safe TDP limits based on device name for fallback scenarios"""
+        """Calculate safe TDP limits based on device name for fallback scenarios
+
+        The device name doesn't change, so the result is kept for repeat calls.
+        """
+        cached_name, cached_limits = self._safe_tdp_limits
+        if cached_limits is not None and cached_name == device_name:
+            return cached_limits
+        
         device_lower = device_name.lower() if device_name else ""
         
         # Known device families with safe maximums
-        if any(k in device_lower for k in ['steam deck', 'jupiter', 'galileo']):
-            return {"min": 4, "max": 15}
-        elif any(k in device_lower for k in ['rog ally', 'rc71l', 'rc72l']):
-            return {"min": 4, "max": 30}
-        elif any(k in device_lower for k in ['legion go', 'lenovo']):
-            return {"min": 4, "max": 30}
-        elif any(k in device_lower for k in ['ayaneo', 'aya neo']):
-            return {"min": 4, "max": 33}
-        elif any(k in device_lower for k in ['onex', 'gpd']):
-            return {"min": 4, "max": 28}
-        else:
-            return {"min": 4, "max": 25}  # Conservative fallback
+        max_tdp = next((family_max for keywords, family_max in SAFE_TDP_FAMILIES
+                        if any(k in device_lower for k in keywords)),
+                       SAFE_TDP_FALLBACK_MAX)
+        limits = {"min": 4, "max": max_tdp}
+        self._safe_tdp_limits = (device_name, limits)
+        return limits
 
     async def get_tdp_control_available(self) -> Dict[str, Any]:
         """Check if hardware TDP control is available on this device.
@@ -6422,6 +7119,13 @@ class Plugin:
 
     async def get_device_classification(self) -> str:
         """Get device classification (Handheld, Portable, Desktop) for profile naming"""
+        # The hardware can't change under a running plugin; classify once
+        if self._device_classification is None:
+            self._device_classification = await self._classify_device()
+        return self._device_classification or "Device"  # Fallback
+
+    async def _classify_device(self) -> Optional[str]:
+        """Classify the device; None on failure so the next call retries"""
         try:
             decky.logger.info("=== DEVICE CLASSIFICATION CHECK ===")
             # Get device name first for robust detection
@@ -6429,17 +7133,11 @@ class Plugin:
             device_lower = device_name.lower()
             decky.logger.info(f"Device classification: checking '{device_name}' (lower: '{device_lower}')")
             
-            # Gaming handhelds have specific identifiers - CHECK FIRST
-            gaming_identifiers = [
-                "ayaneo", "rog ally", "steam deck", "legion go", 
-                "onexplayer", "oxp", "gpd", "win max", "aya neo", "ally"
-            ]
-            
-            # PRIORITY: Direct device name matching (most reliable)
-            for identifier in gaming_identifiers:
-                if identifier in device_lower:
-                    decky.logger.info(f"Device classified as Handheld via device name match: '{identifier}' found in '{device_name}'")
-                    return "Handheld"
+            # PRIORITY: Direct device name matching (most reliable) - CHECK FIRST
+            match = HANDHELD_NAME_RE.search(device_lower)
+            if match:
+                decky.logger.info(f"Device classified as Handheld via device name match: '{match.group(0)}' found in '{device_name}'")
+                return "Handheld"
             
             decky.logger.info("No gaming identifier match found in device name")
             
@@ -6463,70 +7161,55 @@ class Plugin:
                 
         except Exception as e:
             decky.logger.error(f"Failed to classify device: {e}")
-            return "Device"  # Fallback
+            return None
 
     # Version and update functionality 
     async def get_current_version(self) -> str:
-        """Get current plugin version"""
-        return get_plugin_version()
+        """Get current plugin version
 
-    async def _fetch_github_release(self) -> Optional[Dict[str, Any]]:
-        """Fetch latest release data from GitHub API"""
-        import urllib.request
-        import urllib.error
-        import ssl
+        The running code's version is read once (see get_plugin_version); once an
+        update has been installed, report that version until the loader restarts.
+        """
+        return self._installed_version or get_plugin_version()
 
-        github_api_url = "https://api.github.com/repos/fewtarius/PowerDeck/releases/latest"
+    async def _fetch_github_release(self) -> Optional[Dict[str, Any]]:
+        """Fetch latest release data from GitHub API without blocking the event loop
 
-        # Try with proper SSL first, fallback to unverified for stripped-down environments
-        for ctx in (None, ssl._create_unverified_context()):
-            try:
-                kwargs = {"timeout": 10}
-                if ctx:
-                    kwargs["context"] = ctx
-                with urllib.request.urlopen(github_api_url, **kwargs) as response:
-                    return json.loads(response.read().decode())
-            except ssl.SSLError as e:
-                decky.logger.debug(f"SSL error with context {ctx}, trying fallback: {e}")
-                continue
-            except urllib.error.URLError as e:
-                # urllib wraps SSL errors in URLError - check if it's an SSL issue
-                if isinstance(e.reason, ssl.SSLError):
-                    decky.logger.debug(f"URLError with SSL reason, trying fallback: {e.reason}")
-                    continue
-            except urllib.error.HTTPError as e:
-                if e.code == 404:
-                    decky.logger.info("No releases found in GitHub repository")
-                else:
-                    decky.logger.error(f"HTTP error fetching release: {e}")
-                return None
-            except Exception as e:
-                if ctx is not None:
-                    decky.logger.error(f"Error fetching release: {e}")
-                continue
-        return None
+        Reuses the last response for GITHUB_RELEASE_CACHE_TTL seconds, then
+        revalidates it with its ETag.
+        """
+        cached_at, etag, cached = self._github_release_cache
+        now = time.monotonic()
+        if cached is not None and now - cached_at < GITHUB_RELEASE_CACHE_TTL:
+            return cached
+        
+        result = await asyncio.get_running_loop().run_in_executor(
+            None, fetch_latest_release, etag, cached
+        )
+        if result is None:
+            return None
+        data, etag = result
+        self._github_release_cache = (now, etag, data)
+        return data
 
+    @rpc_safe("get latest version", lambda e: get_plugin_version())
     async def get_latest_version(self) -> str:
         """Get latest available version from GitHub API"""
-        try:
-
-            data = await self._fetch_github_release()
-            if data:
-                tag_name = data.get('tag_name', '')
-                if tag_name:
-                    version_match = re.match(r'v?(.+)', tag_name)
-                    if version_match:
-                        return version_match.group(1)
+        data = await self._fetch_github_release()
+        if data:
+            tag_name = data.get('tag_name', '')
+            if tag_name:
+                version_match = RELEASE_TAG_RE.match(tag_name)
+                if version_match:
+                    return version_match.group(1)
 
-            return await self.get_current_version()
-        except Exception as e:
-            decky.logger.error(f"Failed to get latest version: {e}")
-            return get_plugin_version()
+        return await self.get_current_version()
 
     async def check_for_updates(self) -> dict:
         """Check for available updates without downloading"""
         try:
-            from packaging import version
+            if packaging_version is None:
+                raise ImportError("No module named 'packaging'")
 
             current_version = await self.get_current_version()
 
@@ -6550,7 +7233,7 @@ class Plugin:
                     'error': 'No valid version information found'
                 }
 
-            version_match = re.match(r'v?(.+)', tag_name)
+            version_match = RELEASE_TAG_RE.match(tag_name)
             if not version_match:
                 return {
                     'update_available': False,
@@ -6561,7 +7244,7 @@ class Plugin:
             latest_version = version_match.group(1)
 
             try:
-                is_newer = version.parse(latest_version) > version.parse(current_version)
+                is_newer = packaging_version.parse(latest_version) > packaging_version.parse(current_version)
             except Exception as e:
                 is_newer = latest_version != current_version
 
@@ -6573,15 +7256,7 @@ class Plugin:
                     'message': 'You have the latest version'
                 }
 
-            # Find downloadable asset
-            download_url = None
-            for asset in assets:
-                asset_name = asset.get('name', '').lower()
-                if asset_name.endswith('.zip') or 'powerdeck' in asset_name:
-                    download_url = asset.get('browser_download_url')
-                    break
-            if not download_url:
-                download_url = f"https://github.com/fewtarius/PowerDeck/archive/refs/tags/{tag_name}.zip"
+            download_url = find_release_download_url(assets, tag_name)
 
             self.update_available = True
             self.latest_available_version = latest_version
@@ -6616,9 +7291,7 @@ class Plugin:
     async def stage_update(self, download_url: str, version: str) -> dict:
         """Download and stage an update without installing - Plugin class method"""
         try:
-            import urllib.request
             import tempfile
-            import zipfile
             import shutil
             import os
             
@@ -6635,31 +7308,8 @@ class Plugin:
             update_file = os.path.join(self.update_staging_dir, f"powerdeck-{version}.zip")
             
             try:
-                import ssl
-                import urllib.request
-                # Try proper SSL first, fallback to unverified for embedded systems
-                downloaded = False
-                for ctx in (None, ssl._create_unverified_context()):
-                    try:
-                        kwargs = {"timeout": 30}
-                        if ctx:
-                            kwargs["context"] = ctx
-                        with urllib.request.urlopen(download_url, **kwargs) as response:
-                            with open(update_file, 'wb') as f:
-                                f.write(response.read())
-                        downloaded = True
-                        break
-                    except ssl.SSLError as e:
-                        decky.logger.debug(f"SSL error in stage_update, trying fallback: {e}")
-                        continue
-                    except Exception as e:
-                        # Check if this is a URLError wrapping an SSL error
-                        if hasattr(e, 'reason') and isinstance(e.reason, ssl.SSLError):
-                            decky.logger.debug(f"URLError with SSL reason in stage_update, trying fallback: {e.reason}")
-                            continue
-                    
-                    if not downloaded:
-                        raise Exception("All SSL methods failed for download")
+                # Network I/O runs on the executor so other RPCs keep being served
+                await run_blocking(download_file, download_url, update_file)
                 
                 decky.logger.info(f"Downloaded update to {update_file}")
             except Exception as e:
@@ -6673,8 +7323,8 @@ class Plugin:
             extract_dir = os.path.join(self.update_staging_dir, "extracted")
             
             try:
-                with zipfile.ZipFile(update_file, 'r') as zip_ref:
-                    zip_ref.extractall(extract_dir)
+                # Also locates the PowerDeck source directory among the extracted files
+                plugin_source_dir = await run_blocking(extract_release_archive, update_file, extract_dir)
                 decky.logger.info(f"Extracted update to {extract_dir}")
             except Exception as e:
                 decky.logger.error(f"Failed to extract update: {e}")
@@ -6683,13 +7333,6 @@ class Plugin:
                     'error': f'Extraction failed: {str(e)}'
                 }
             
-            # Find the PowerDeck source directory in extracted files
-            plugin_source_dir = None
-            for root, dirs, files in os.walk(extract_dir):
-                if 'main.py' in files and 'plugin.json' in files:
-                    plugin_source_dir = root
-                    break
-            
             if not plugin_source_dir:
                 decky.logger.error("Could not find PowerDeck/ directory in downloaded update")
                 return {
@@ -6716,6 +7359,7 @@ class Plugin:
                 'validation': validation_result
             }
             self.staged_update_path = plugin_source_dir
+            self._staged_ready = True
             
             decky.logger.info(f"Update v{version} staged successfully and validated")
             
@@ -6737,14 +7381,13 @@ class Plugin:
     async def _validate_staged_update(self, source_dir: str, expected_version: str) -> dict:
         """Validate a staged update package"""
         try:
-            # Check required files exist
-            required_files = ['main.py', 'plugin.json']
-            missing_files = []
-            
-            for file in required_files:
-                file_path = os.path.join(source_dir, file)
-                if not os.path.exists(file_path):
-                    missing_files.append(file)
+            # One directory pass checks the required files and gives the file
+            # count; main.py only has to be present (plugin.json's name check
+            # below already identifies the package)
+            with os.scandir(source_dir) as it:
+                entries = {entry.name: entry for entry in it}
+            missing_files = [file for file in ('main.py', 'plugin.json')
+                             if file not in entries or not entries[file].is_file()]
             
             if missing_files:
                 return {
@@ -6754,9 +7397,8 @@ class Plugin:
             
             # Validate plugin.json
             try:
-                plugin_json_path = os.path.join(source_dir, 'plugin.json')
-                with open(plugin_json_path, 'r') as f:
-                    plugin_data = json.load(f)
+                with open(entries['plugin.json'].path, 'rb') as f:
+                    plugin_data = json_loads(f.read())
                 
                 # Check version matches
                 file_version = plugin_data.get('version', 'unknown')
@@ -6779,30 +7421,11 @@ class Plugin:
                     'error': f'Invalid plugin.json: {str(e)}'
                 }
             
-            # Check main.py is valid Python
-            try:
-                main_py_path = os.path.join(source_dir, 'main.py')
-                with open(main_py_path, 'r') as f:
-                    content = f.read()
-                
-                # Basic validation - check for PowerDeck class
-                if 'class Plugin' not in content:
-                    return {
-                        'valid': False,
-                        'error': 'main.py does not contain Plugin class'
-                    }
-                
-            except Exception as e:
-                return {
-                    'valid': False,
-                    'error': f'Invalid main.py: {str(e)}'
-                }
-            
             return {
                 'valid': True,
                 'version': expected_version,
                 'plugin_info': plugin_data,
-                'file_count': len(os.listdir(source_dir))
+                'file_count': len(entries)
             }
             
         except Exception as e:
@@ -6813,10 +7436,11 @@ class Plugin:
 
     async def _cleanup_staged_update(self):
         """Clean up any existing staged update"""
+        self._staged_ready = False
         try:
             if os.path.exists(self.update_staging_dir):
                 import shutil
-                shutil.rmtree(self.update_staging_dir)
+                await run_blocking(shutil.rmtree, self.update_staging_dir)
                 decky.logger.info("Cleaned up previous staged update")
         except Exception as e:
             decky.logger.warning(f"Failed to cleanup staged update: {e}")
@@ -6853,7 +7477,9 @@ class Plugin:
             # Ensure backup base directory exists
             os.makedirs(backup_base_dir, exist_ok=True)
             
-            # Create backup before installation
+            # Move the current plugin aside as the backup; on the same
+            # filesystem this is a rename, so no files are copied
+            has_backup = False
             try:
                 if os.path.exists(current_plugin_dir):
                     import shutil
@@ -6861,9 +7487,10 @@ class Plugin:
                     # Remove existing backup if it exists
                     if os.path.exists(backup_dir):
                         decky.logger.info(f"Removing existing backup at {backup_dir}")
-                        shutil.rmtree(backup_dir)
+                        await run_blocking(shutil.rmtree, backup_dir)
                     
-                    shutil.copytree(current_plugin_dir, backup_dir)
+                    await run_blocking(move_directory, current_plugin_dir, backup_dir)
+                    has_backup = True
                     decky.logger.info(f"Created backup at {backup_dir}")
             except Exception as e:
                 decky.logger.error(f"Failed to create backup: {e}")
@@ -6879,27 +7506,26 @@ class Plugin:
             try:
                 import shutil
                 
-                # Remove current plugin directory
-                if os.path.exists(current_plugin_dir):
-                    shutil.rmtree(current_plugin_dir)
-                
-                # Copy staged update to plugin directory
-                shutil.copytree(source_dir, current_plugin_dir)
+                # Move the staged update into place (a rename when staging
+                # shares the plugin directory's filesystem)
+                await run_blocking(move_directory, source_dir, current_plugin_dir)
                 
                 # Set proper permissions
-                subprocess.run(['chown', '-R', 'deck:deck', current_plugin_dir], check=True)
+                if DECK_UID is not None:
+                    await run_blocking(chown_tree, current_plugin_dir, DECK_UID, DECK_GID)
                 
                 decky.logger.info(f"Installed PowerDeck v{version} successfully")
+                self._installed_version = version
                 
             except Exception as e:
                 decky.logger.error(f"Failed to install update: {e}")
                 
                 # Restore backup on failure
                 try:
-                    if os.path.exists(backup_dir):
+                    if has_backup:
                         if os.path.exists(current_plugin_dir):
-                            shutil.rmtree(current_plugin_dir)
-                        shutil.copytree(backup_dir, current_plugin_dir)
+                            await run_blocking(shutil.rmtree, current_plugin_dir)
+                        await run_blocking(move_directory, backup_dir, current_plugin_dir)
                         decky.logger.info("Restored backup after installation failure")
                 except Exception as restore_error:
                     decky.logger.error(f"Failed to restore backup: {restore_error}")
@@ -6946,43 +7572,13 @@ class Plugin:
     async def _restart_plugin_loader(self):
         """Restart plugin loader service (cannot stop/start separately)"""
         try:
-            result = subprocess.run(['sudo', 'systemctl', 'restart', 'plugin_loader'], 
-                                  check=True, capture_output=True, text=True)
+            result = await run_blocking(subprocess.run, ['sudo', 'systemctl', 'restart', 'plugin_loader'],
+                                        check=True, capture_output=True, text=True)
             decky.logger.info("Plugin loader restarted via systemctl")
         except subprocess.CalledProcessError as e:
             decky.logger.error(f"Failed to restart plugin loader: {e}")
             raise
 
-    async def get_update_status(self) -> dict:
-        """Get current update status - Plugin class method"""
-        try:
-            current_version = await self.get_current_version()
-            
-            status = {
-                'current_version': current_version,
-                'update_available': self.update_available,
-                'latest_version': self.latest_available_version,
-                'staged_update': None
-            }
-            
-            if self.staged_update_info:
-                status['staged_update'] = {
-                    'version': self.staged_update_info['version'],
-                    'staged_at': self.staged_update_info['staged_at'],
-                    'ready_to_install': os.path.exists(self.staged_update_path) if self.staged_update_path else False,
-                    'validation': self.staged_update_info.get('validation', {})
-                }
-            
-            return status
-            
-        except Exception as e:
-            decky.logger.error(f"Failed to get update status: {e}")
-            return {
-                'current_version': 'unknown',
-                'update_available': False,
-                'error': str(e)
-            }
-
     async def update_plugin(self) -> bool:
         """Check for updates only (deprecated - use check_for_updates) - Plugin class method"""
         decky.logger.warning("update_plugin() is deprecated, use check_for_updates() instead")
@@ -6992,10 +7588,7 @@ class Plugin:
     async def _download_and_install_update(self, download_url: str, version: str) -> bool:
         """Download and install plugin update"""
         try:
-            import urllib.request
-            import ssl
             import tempfile
-            import zipfile
             import shutil
             
             decky.logger.info(f"Starting download of PowerDeck v{version}")
@@ -7007,115 +7600,96 @@ class Plugin:
                 
                 try:
                     decky.logger.info(f"Downloading from {download_url}...")
-                    downloaded = False
-                    for ctx in (None, ssl._create_unverified_context()):
-                        try:
-                            kwargs = {"timeout": 30}
-                            if ctx:
-                                kwargs["context"] = ctx
-                            with urllib.request.urlopen(download_url, **kwargs) as response:
-                                with open(update_file, 'wb') as f:
-                                    f.write(response.read())
-                            downloaded = True
-                            break
-                        except ssl.SSLError as e:
-                            decky.logger.debug(f"SSL error in download, trying fallback: {e}")
-                            continue
-                        except Exception as e:
-                            # Check if this is a URLError wrapping an SSL error
-                            if hasattr(e, 'reason') and isinstance(e.reason, ssl.SSLError):
-                                decky.logger.debug(f"URLError with SSL reason in download, trying fallback: {e.reason}")
-                                continue
-                            raise  # Re-raise non-SSL exceptions
-                    
-                    if not downloaded:
-                        raise Exception("All SSL methods failed for download")
+                    await run_blocking(download_file, download_url, update_file)
                     
                     decky.logger.info(f"Downloaded update to {update_file}")
                 except Exception as e:
                     decky.logger.error(f"Failed to download update: {e}")
                     return False
                 
-                # Extract the downloaded file
+                # Get current plugin directory
+                current_plugin_dir = os.path.dirname(__file__)
+                decky.logger.info(f"Current plugin directory: {current_plugin_dir}")
+                
+                # Extract PowerDeck/ straight into a sibling of the plugin directory
+                # (everything else, e.g. RyzenAdj/, goes to the temp directory), so
+                # installing is a rename rather than a second copy of every file
+                new_plugin_dir = f"{current_plugin_dir}.new"
                 extract_dir = os.path.join(temp_dir, "extracted")
                 try:
-                    with zipfile.ZipFile(update_file, 'r') as zip_ref:
-                        zip_ref.extractall(extract_dir)
-                    decky.logger.info(f"Extracted update to {extract_dir}")
+                    if os.path.lexists(new_plugin_dir):
+                        await run_blocking(shutil.rmtree, new_plugin_dir)
+                    await run_blocking(extract_plugin_release, update_file, new_plugin_dir, extract_dir)
+                    decky.logger.info(f"Extracted update to {new_plugin_dir}")
                 except Exception as e:
                     decky.logger.error(f"Failed to extract update: {e}")
+                    await run_blocking(shutil.rmtree, new_plugin_dir, ignore_errors=True)
                     return False
                 
-                # Find the PowerDeck plugin directory in the extracted files
-                plugin_source_dir = os.path.join(extract_dir, "PowerDeck")
                 ryzenadj_source_dir = os.path.join(extract_dir, "RyzenAdj")
                 
-                if not os.path.exists(plugin_source_dir):
+                # One directory read covers both the directory and required file checks
+                try:
+                    present_files = set(os.listdir(new_plugin_dir))
+                except FileNotFoundError:
                     decky.logger.error("Could not find PowerDeck/ directory in downloaded update")
                     return False
                 
                 # Verify plugin files exist
-                required_files = ['main.py', 'plugin.json']
-                for required_file in required_files:
-                    if not os.path.exists(os.path.join(plugin_source_dir, required_file)):
-                        decky.logger.error(f"Missing required file {required_file} in PowerDeck directory")
-                        return False
-                
-                decky.logger.info(f"Found plugin source at: {plugin_source_dir}")
+                missing_files = [file for file in ('main.py', 'plugin.json') if file not in present_files]
+                if missing_files:
+                    decky.logger.error(f"Missing required file {missing_files[0]} in PowerDeck directory")
+                    await run_blocking(shutil.rmtree, new_plugin_dir, ignore_errors=True)
+                    return False
                 
-                # Get current plugin directory
-                current_plugin_dir = os.path.dirname(__file__)
-                decky.logger.info(f"Current plugin directory: {current_plugin_dir}")
+                decky.logger.info(f"Found plugin source at: {new_plugin_dir}")
                 
-                # Backup current plugin
+                # Backup current plugin by moving it aside (a rename on the same filesystem)
                 backup_dir = f"{current_plugin_dir}.backup.{version}"
                 try:
                     if os.path.exists(backup_dir):
-                        shutil.rmtree(backup_dir)
-                    shutil.copytree(current_plugin_dir, backup_dir)
+                        await run_blocking(shutil.rmtree, backup_dir)
+                    await run_blocking(move_directory, current_plugin_dir, backup_dir)
                     decky.logger.info(f"Created backup at: {backup_dir}")
                 except Exception as e:
                     decky.logger.error(f"Failed to create backup: {e}")
+                    await run_blocking(shutil.rmtree, new_plugin_dir, ignore_errors=True)
                     return False
                 
                 # Install RyzenAdj if available (before plugin to avoid interruption)
                 await self._install_ryzenadj_update(ryzenadj_source_dir)
                 
-                # Install the PowerDeck plugin update using rsync-like behavior
+                # Install the PowerDeck plugin update, replacing the whole tree like rsync --delete
                 try:
-                    # Use subprocess to run rsync for atomic installation like install.sh
                     decky.logger.info("Installing PowerDeck plugin files...")
-                    result = subprocess.run([
-                        'sudo', 'rsync', '-av', '--delete',
-                        f"{plugin_source_dir}/",  # Source with trailing slash
-                        current_plugin_dir        # Destination
-                    ], capture_output=True, text=True, timeout=60)
-                    
-                    if result.returncode != 0:
-                        decky.logger.error(f"Failed to install plugin files via rsync: {result.stderr}")
-                        # Fallback to manual file copying
-                        await self._manual_file_installation(plugin_source_dir, current_plugin_dir)
-                    else:
-                        decky.logger.info("Plugin files installed successfully via rsync")
+                    await run_blocking(move_directory, new_plugin_dir, current_plugin_dir)
+                    decky.logger.info("Plugin files installed successfully")
                         
                     # Set proper ownership
-                    subprocess.run(['sudo', 'chown', '-R', 'deck:deck', current_plugin_dir], 
-                                 capture_output=True, timeout=30)
+                    if DECK_UID is not None:
+                        try:
+                            await run_blocking(chown_tree, current_plugin_dir, DECK_UID, DECK_GID)
+                        except OSError as e:
+                            decky.logger.warning(f"Failed to set plugin file ownership: {e}")
                     
                     # Update VERSION file
                     version_file = os.path.join(current_plugin_dir, "VERSION")
                     with open(version_file, 'w') as f:
                         f.write(version)
+                        f.flush()
+                        os.fsync(f.fileno())
                     decky.logger.info(f"Updated VERSION to {version}")
+                    self._installed_version = version
                     
-                    # Give a moment for file operations to complete
-                    await asyncio.sleep(2)
+                    # Make the new tree durable before restarting instead of
+                    # sleeping and hoping file operations have completed
+                    await run_blocking(fsync_tree, current_plugin_dir)
                     
                     # Restart plugin loader to load the new version (use restart, not stop/start)
                     decky.logger.info("Restarting plugin loader to load updated plugin...")
                     try:
-                        result = subprocess.run(['sudo', 'systemctl', 'restart', 'plugin_loader'], 
-                                              capture_output=True, text=True, timeout=30)
+                        result = await run_blocking(subprocess.run, ['sudo', 'systemctl', 'restart', 'plugin_loader'],
+                                                    capture_output=True, text=True, timeout=30)
                         if result.returncode == 0:
                             decky.logger.info("Plugin loader restarted successfully")
                         else:
@@ -7133,12 +7707,14 @@ class Plugin:
                     decky.logger.error(f"Failed to install update: {e}")
                     
                     # Attempt to restore backup
+                    await run_blocking(shutil.rmtree, new_plugin_dir, ignore_errors=True)
                     try:
                         if os.path.exists(backup_dir):
                             if os.path.exists(current_plugin_dir):
-                                shutil.rmtree(current_plugin_dir)
-                            shutil.move(backup_dir, current_plugin_dir)
+                                await run_blocking(shutil.rmtree, current_plugin_dir)
+                            await run_blocking(shutil.move, backup_dir, current_plugin_dir)
                             decky.logger.info("Restored backup after failed update")
+                            self._installed_version = None
                     except Exception as restore_error:
                         decky.logger.error(f"Failed to restore backup: {restore_error}")
                     
@@ -7161,12 +7737,14 @@ class Plugin:
         # Check if filesystem needs unlocking (SteamOS)
         filesystem_unlocked = False
         try:
-            # Check if we're on SteamOS with read-only filesystem
-            mount_result = subprocess.run(['mount'], capture_output=True, text=True, timeout=10)
-            if mount_result.returncode == 0 and "on / type" in mount_result.stdout and "ro," in mount_result.stdout:
+            # Check if we're on SteamOS with read-only filesystem; the root
+            # mount doesn't change under us (we re-lock after unlocking)
+            if self._rootfs_readonly is None:
+                self._rootfs_readonly = is_root_read_only()
+            if self._rootfs_readonly:
                 # Try to unlock filesystem for /opt installation
-                unlock_result = subprocess.run(['sudo', 'steamos-readonly', 'disable'], 
-                                             capture_output=True, text=True, timeout=30)
+                unlock_result = await run_blocking(subprocess.run, ['sudo', 'steamos-readonly', 'disable'],
+                                                   capture_output=True, text=True, timeout=30)
                 if unlock_result.returncode == 0:
                     filesystem_unlocked = True
                     decky.logger.info("Unlocked SteamOS filesystem for RyzenAdj installation")
@@ -7174,13 +7752,12 @@ class Plugin:
             decky.logger.warning(f"Could not check/unlock filesystem: {e}")
         
         try:
-            # Create target directory
             target_dir = "/opt/ryzenadj/bin"
             target_path = os.path.join(target_dir, "ryzenadj")
             
-            subprocess.run(['sudo', 'mkdir', '-p', target_dir], check=True, timeout=30)
-            subprocess.run(['sudo', 'cp', ryzenadj_binary, target_path], check=True, timeout=30)
-            subprocess.run(['sudo', 'chmod', '+x', target_path], check=True, timeout=30)
+            # install -D creates the target directory, copies and sets the mode in one call
+            await run_blocking(subprocess.run, ['sudo', 'install', '-D', '-m', '0755', ryzenadj_binary, target_path],
+                               check=True, timeout=30)
             
             decky.logger.info(f"RyzenAdj installed successfully at: {target_path}")
             return True
@@ -7192,37 +7769,71 @@ class Plugin:
             # Re-lock filesystem if we unlocked it
             if filesystem_unlocked:
                 try:
-                    subprocess.run(['sudo', 'steamos-readonly', 'enable'], timeout=30)
+                    await run_blocking(subprocess.run, ['sudo', 'steamos-readonly', 'enable'], timeout=30)
                     decky.logger.info("Re-locked SteamOS filesystem")
                 except Exception as e:
                     decky.logger.warning(f"Could not re-lock filesystem: {e}")
 
-    async def _manual_file_installation(self, plugin_source_dir: str, current_plugin_dir: str) -> None:
-        """Fallback manual file installation if rsync fails"""
-        decky.logger.info("Using manual file installation as rsync fallback...")
-        
-        # Copy essential files
-        essential_files = ['main.py', 'plugin.json']
-        essential_dirs = ['py_modules', 'dist']
-        
-        for file_name in essential_files:
-            src_file = os.path.join(plugin_source_dir, file_name)
-            dst_file = os.path.join(current_plugin_dir, file_name)
-            if os.path.exists(src_file):
-                shutil.copy2(src_file, dst_file)
-                decky.logger.info(f"Updated {file_name}")
-        
-        for dir_name in essential_dirs:
-            src_dir = os.path.join(plugin_source_dir, dir_name)
-            dst_dir = os.path.join(current_plugin_dir, dir_name)
-            if os.path.exists(src_dir):
-                if os.path.exists(dst_dir):
-                    shutil.rmtree(dst_dir)
-                shutil.copytree(src_dir, dst_dir)
-                decky.logger.info(f"Updated {dir_name}/")
-
     async def background_update_checker(self):
         """Background task to periodically check for updates"""
+        # A failed check is retried with exponential backoff (plus jitter)
+        # instead of waiting out the full interval or polling every 5 minutes
+        retry_delay = UPDATE_RETRY_INITIAL_DELAY
+        delay = self.update_check_interval
+        try:
+            while True:
+                try:
+                    await asyncio.sleep(delay)
+                    
+                    # Skip if too soon since last check
+                    if self.last_update_check:
+                        time_since_last = time.time() - self.last_update_check
+                        if time_since_last < self.update_check_interval:
+                            delay = self.update_check_interval - time_since_last
+                            continue
+                    
+                    decky.logger.info("Background update check starting...")
+                    
+                    # Non-blocking version check with timeout
+                    current_version = await asyncio.wait_for(
+                        self.get_current_version(), 
+                        timeout=10.0
+                    )
+                    # get_latest_version falls back to the current version when
+                    # GitHub can't be reached; fetch first so that counts as a
+                    # failure (the release is cached for get_latest_version)
+                    if not await asyncio.wait_for(self._fetch_github_release(), timeout=30.0):
+                        raise RuntimeError("Could not fetch release info")
+                    latest_version = await self.get_latest_version()
+                    
+                    self.last_update_check = time.time()
+                    
+                    # Check if update available
+                    if current_version != latest_version:
+                        self.update_available = True
+                        self.latest_available_version = latest_version
+                        decky.logger.info(f"Background update check: Update available {current_version} -> {latest_version}")
+                    else:
+                        self.update_available = False
+                        self.latest_available_version = None
+                        decky.logger.info(f"Background update check: Up to date ({current_version})")
+                    
+                    retry_delay = UPDATE_RETRY_INITIAL_DELAY
+                    delay = self.update_check_interval
+                    
+                except asyncio.CancelledError:
+                    decky.logger.info("Background update checker cancelled")
+                    break
+                except Exception as e:
+                    if isinstance(e, asyncio.TimeoutError):
+                        decky.logger.warning("Background update check timed out")
+                    else:
+                        decky.logger.error(f"Background update check error: {e}")
+                    delay = min(retry_delay, self.update_check_interval) + random.uniform(0, retry_delay * 0.1)
+                    retry_delay = min(retry_delay * 2, self.update_check_interval)
+                    
+        except Exception as e:
+            decky.logger.error(f"Background update checker failed: {e}")
 
     async def game_monitor(self):
 
@@ -7382,59 +7993,6 @@ class Plugin:
         except asyncio.CancelledError:
             decky.logger.info("Game monitor loop cancelled")
 
-        try:
-            while True:
-                try:
-                    # Wait for update check interval (4 hours)
-                    await asyncio.sleep(self.update_check_interval)
-                    
-                    # Skip if too soon since last check
-                    if self.last_update_check:
-                        time_since_last = time.time() - self.last_update_check
-                        if time_since_last < self.update_check_interval:
-                            continue
-                    
-                    decky.logger.info("Background update check starting...")
-                    
-                    try:
-                        # Non-blocking version check with timeout
-                        current_version = await asyncio.wait_for(
-                            self.get_current_version(), 
-                            timeout=10.0
-                        )
-                        latest_version = await asyncio.wait_for(
-                            self.get_latest_version(), 
-                            timeout=30.0
-                        )
-                        
-                        self.last_update_check = time.time()
-                        
-                        # Check if update available
-                        if current_version != latest_version:
-                            self.update_available = True
-                            self.latest_available_version = latest_version
-                            decky.logger.info(f"Background update check: Update available {current_version} -> {latest_version}")
-                        else:
-                            self.update_available = False
-                            self.latest_available_version = None
-                            decky.logger.info(f"Background update check: Up to date ({current_version})")
-                        
-                    except asyncio.TimeoutError:
-                        decky.logger.warning("Background update check timed out")
-                    except Exception as check_error:
-                        decky.logger.error(f"Background update check error: {check_error}")
-                        
-                except asyncio.CancelledError:
-                    decky.logger.info("Background update checker cancelled")
-                    break
-                except Exception as e:
-                    decky.logger.error(f"Background update checker error: {e}")
-                    # Continue running despite errors
-                    await asyncio.sleep(300)  # Wait 5 minutes before retry
-                    
-        except Exception as e:
-            decky.logger.error(f"Background update checker failed: {e}")
-
     async def get_update_status(self) -> Dict[str, Any]:
         """Get background update check status for frontend"""
         try:
@@ -7451,6 +8009,16 @@ class Plugin:
             else:
                 status["hours_since_last_check"] = None
             
+            if self.staged_update_info:
+                status["staged_update"] = {
+                    "version": self.staged_update_info['version'],
+                    "staged_at": self.staged_update_info['staged_at'],
+                    "ready_to_install": self._staged_ready,
+                    "validation": self.staged_update_info.get('validation', {})
+                }
+            else:
+                status["staged_update"] = None
+            
             return status
         except Exception as e:
             decky.logger.error(f"Failed to get update status: {e}")
@@ -7546,12 +8114,7 @@ class Plugin:
     async def set_cpu_frequency_limits(self, min_freq_khz: Optional[int] = None, max_freq_khz: Optional[int] = None) -> bool:
         """Set CPU frequency limits - Plugin class method"""
         try:
-            if self.cpu_manager:
-                success = self.cpu_manager.set_cpu_frequency_limits(min_freq_khz, max_freq_khz)
-            else:
-                from cpu_manager import get_cpu_manager
-                cpu_manager = get_cpu_manager()
-                success = cpu_manager.set_cpu_frequency_limits(min_freq_khz, max_freq_khz)
+            success = self._cpu.set_cpu_frequency_limits(min_freq_khz, max_freq_khz)
             
             if success:
                 limits_str = []
@@ -7571,12 +8134,7 @@ class Plugin:
     async def reset_cpu_frequency_limits(self) -> bool:
         """Reset CPU frequency limits to hardware defaults - Plugin class method"""
         try:
-            if self.cpu_manager:
-                success = self.cpu_manager.reset_cpu_frequency_limits()
-            else:
-                from cpu_manager import get_cpu_manager
-                cpu_manager = get_cpu_manager()
-                success = cpu_manager.reset_cpu_frequency_limits()
+            success = self._cpu.reset_cpu_frequency_limits()
             
             if success:
                 decky.logger.info("RESET_CPU_FREQUENCY_LIMITS: CPU frequency limits reset to hardware defaults")
@@ -7609,9 +8167,8 @@ class Plugin:
             success = await self.save_profile(profile_with_id)
             decky.logger.info(f"Plugin.set_game_profile: Saved profile for {game_id}, success: {success}")
             return success
-        except Exception as e:
-            decky.logger.error(f"Plugin.set_game_profile failed for {game_id}: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("Plugin.set_game_profile failed for %s", game_id)
             return False
 
     async def get_game_profile(self, game_id: str) -> Optional[Dict[str, Any]]:
@@ -7626,9 +8183,8 @@ class Plugin:
             else:
                 decky.logger.info(f"Plugin.get_game_profile: No profile found for {game_id}")
                 return None
-        except Exception as e:
-            decky.logger.error(f"Plugin.get_game_profile failed for {game_id}: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("Plugin.get_game_profile failed for %s", game_id)
             return None
     
     # Enhanced Sleep/Wake Management API
@@ -7659,20 +8215,33 @@ class Plugin:
         """Get recent sleep/wake events - Plugin class method"""
         try:
             if self.sleep_wake_manager:
-                # Load events from the log file
-                events_file = "/tmp/powerdeck_sleep_wake_events.json"
-                events = []
+                # Load events from the log file, re-parsing only when it changed
+                try:
+                    mtime_ns = os.stat(SLEEP_WAKE_EVENTS_FILE).st_mtime_ns
+                except OSError:
+                    mtime_ns = 0
                 
-                if os.path.exists(events_file):
-                    try:
-                        with open(events_file, 'r') as f:
-                            events = json.load(f)
-                    except (OSError, json.JSONDecodeError):
-                        events = []
+                if mtime_ns != self._sleep_wake_events_cache[0]:
+                    events = []
+                    if mtime_ns:
+                        try:
+                            with open(SLEEP_WAKE_EVENTS_FILE, 'rb') as f:
+                                for line in f:
+                                    try:
+                                        events.append(json_loads(line))
+                                    except ValueError:
+                                        continue  # Torn final line of an in-progress append
+                        except OSError:
+                            events = []
+                    events.sort(key=lambda e: e.get('timestamp', 0))
+                    self._sleep_wake_events_cache = (
+                        mtime_ns, [e.get('timestamp', 0) for e in events], events
+                    )
+                _, timestamps, events = self._sleep_wake_events_cache
                 
                 # Filter events by timeframe
                 cutoff_time = time.time() - (hours * 3600)
-                recent_events = [e for e in events if e.get('timestamp', 0) > cutoff_time]
+                recent_events = events[bisect.bisect_right(timestamps, cutoff_time):]
                 
                 decky.logger.info(f"Retrieved {len(recent_events)} sleep/wake events from last {hours} hours")
                 return recent_events
@@ -7691,52 +8260,124 @@ class Plugin:
                 return True
             else:
                 decky.logger.info("Enhanced sleep/wake manager not available, applying current profile")
-                success = await self.apply_profile(self.current_profile)
+                success = await self.apply_profile(self.current_profile, force=True)
                 return success
         except Exception as e:
             decky.logger.error(f"Failed to force wake state restoration: {e}")
             return False
     
-    async def monitor_system_wake(self):
-        """Fallback wake monitor using suspend counter when enhanced manager unavailable"""
+    async def _reapply_profile_after_wake(self):
+        """Let the hardware settle after resume, then force the current profile back on"""
+        await asyncio.sleep(3)
         try:
-            decky.logger.info("Started fallback wake monitoring (suspend counter)")
-            suspend_stats = "/sys/power/suspend_stats/success"
-            last_count = None
+            success = await self.apply_profile(self.current_profile, force=True)
+            if success:
+                decky.logger.info("Power profile reapplied after wake")
+            else:
+                decky.logger.warning("Failed to reapply profile after wake")
+        except Exception as e:
+            decky.logger.error(f"Error reapplying profile after wake: {e}")
 
-            # Initialize counter
-            try:
-                if os.path.exists(suspend_stats):
-                    with open(suspend_stats, 'r') as f:
-                        last_count = int(f.read().strip())
-            except (ValueError, OSError):
-                pass
+    async def _watch_prepare_for_sleep(self):
+        """Reapply the profile on logind's PrepareForSleep(false) (resume) signal
 
+        Blocks on dbus-monitor's output, so nothing runs between suspends.
+        Returns if the monitor can't be started or exits.
+        """
+        # Clear LD_LIBRARY_PATH to avoid Decky's bundled libs breaking system binaries
+        clean_env = dict(os.environ)
+        clean_env.pop("LD_LIBRARY_PATH", None)
+        try:
+            process = await asyncio.create_subprocess_exec(
+                'dbus-monitor', '--system', LOGIND_PREPARE_FOR_SLEEP_MATCH,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=clean_env
+            )
+        except OSError as e:
+            decky.logger.info(f"dbus-monitor unavailable for wake monitoring: {e}")
+            return
+
+        decky.logger.info("Started fallback wake monitoring (logind PrepareForSleep)")
+        try:
             while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                # The signal's argument follows its header as "   boolean false"
+                if line.split() == [b'boolean', b'false']:
+                    decky.logger.info("Wake detected via logind PrepareForSleep")
+                    await self._reapply_profile_after_wake()
+        finally:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+        decky.logger.warning(f"dbus-monitor exited (rc={process.returncode})")
+
+    async def _watch_power_state(self):
+        """Reapply the profile each time a write to /sys/power/state completes
+
+        For systems without logind. Returns if the file can't be watched.
+        """
+        try:
+            fd = inotify_watch(SYS_POWER_STATE, IN_MODIFY)
+        except (OSError, AttributeError) as e:
+            decky.logger.info(f"inotify unavailable for wake monitoring: {e}")
+            return
+
+        loop = asyncio.get_running_loop()
+        readable = asyncio.Event()
+        loop.add_reader(fd, readable.set)
+        decky.logger.info(f"Started fallback wake monitoring (inotify on {SYS_POWER_STATE})")
+        try:
+            while True:
+                await readable.wait()
+                readable.clear()
                 try:
-                    if os.path.exists(suspend_stats):
-                        with open(suspend_stats, 'r') as f:
-                            current_count = int(f.read().strip())
+                    os.read(fd, 4096)
+                except BlockingIOError:
+                    continue
+                decky.logger.info(f"Wake detected via {SYS_POWER_STATE}")
+                await self._reapply_profile_after_wake()
+        finally:
+            loop.remove_reader(fd)
+            os.close(fd)
 
-                        if last_count is not None and current_count > last_count:
-                            decky.logger.info(f"Wake detected via suspend counter ({last_count} -> {current_count})")
-                            await asyncio.sleep(3)
-                            try:
-                                success = await self.apply_profile(self.current_profile)
-                                if success:
-                                    decky.logger.info("Power profile reapplied after wake")
-                                else:
-                                    decky.logger.warning("Failed to reapply profile after wake")
-                            except Exception as e:
-                                decky.logger.error(f"Error reapplying profile after wake: {e}")
+    async def monitor_system_wake(self):
+        """Fallback wake monitor used when the enhanced manager is unavailable
+
+        Waits for logind's resume signal, or failing that for the suspend
+        write to /sys/power/state to return; polls for time spent suspended
+        only if neither can be watched.
+        """
+        try:
+            await self._watch_prepare_for_sleep()
+            await self._watch_power_state()
 
-                        last_count = current_count
+            decky.logger.info("Started fallback wake monitoring (suspend clock)")
+            # CLOCK_MONOTONIC stops while suspended and CLOCK_BOOTTIME doesn't,
+            # so the gap between them grows by exactly the time spent asleep.
+            # Ticks follow absolute deadlines on the loop's monotonic clock.
+            loop = asyncio.get_running_loop()
+            last_offset = suspended_time()
+            deadline = loop.time()
 
-                    await asyncio.sleep(5)
+            while True:
+                try:
+                    deadline += WAKE_POLL_INTERVAL
+                    await asyncio.sleep(max(0.0, deadline - loop.time()))
+
+                    offset = suspended_time()
+                    if offset - last_offset > WAKE_SUSPEND_THRESHOLD:
+                        decky.logger.info(f"Wake detected after {offset - last_offset:.0f}s suspended")
+                        await self._reapply_profile_after_wake()
+                        deadline = loop.time()
+                    last_offset = offset
 
                 except Exception as e:
                     decky.logger.error(f"Wake monitoring error: {e}")
                     await asyncio.sleep(30)
+                    deadline = loop.time()
 
         except Exception as e:
             decky.logger.error(f"Wake monitoring failed: {e}")
@@ -7744,11 +8385,11 @@ class Plugin:
     # ROG Ally Plugin Class Methods (corresponding to frontend callable functions)
     async def get_rog_ally_device_info(self) -> Dict[str, Any]:
         """Get ROG Ally device information - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_device_info()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_device_info'):
-                info = self.device_controller.get_device_info()
-                decky.logger.info(f"Plugin.get_rog_ally_device_info: {info}")
+            get_device_info = self._device_controller_methods.get('get_device_info')
+            if get_device_info:
+                info = get_device_info()
+                decky.logger.debug("Plugin.get_rog_ally_device_info: %s", info)
                 return info
             else:
                 decky.logger.warning("ROG Ally controller not available")
@@ -7757,13 +8398,14 @@ class Plugin:
             decky.logger.error(f"Plugin.get_rog_ally_device_info failed: {e}")
             return {}
 
+    @cached_reading(1.0)
     async def get_rog_ally_power_limits(self) -> Dict[str, Optional[int]]:
         """Get ROG Ally power limits - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_power_limits()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_power_limits'):
-                limits = self.device_controller.get_power_limits()
-                decky.logger.info(f"Plugin.get_rog_ally_power_limits: {limits}")
+            get_power_limits = self._device_controller_methods.get('get_power_limits')
+            if get_power_limits:
+                limits = get_power_limits()
+                decky.logger.debug("Plugin.get_rog_ally_power_limits: %s", limits)
                 return limits
             else:
                 return {"fast_limit": None, "sustained_limit": None, "stapm_limit": None}
@@ -7771,13 +8413,14 @@ class Plugin:
             decky.logger.error(f"Plugin.get_rog_ally_power_limits failed: {e}")
             return {"fast_limit": None, "sustained_limit": None, "stapm_limit": None}
 
+    @cached_reading(2.0)
     async def get_rog_ally_platform_profile(self) -> Optional[str]:
         """Get ROG Ally platform profile - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_platform_profile()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_platform_profile'):
-                profile = self.device_controller.get_platform_profile()
-                decky.logger.info(f"Plugin.get_rog_ally_platform_profile: {profile}")
+            get_platform_profile = self._device_controller_methods.get('get_platform_profile')
+            if get_platform_profile:
+                profile = get_platform_profile()
+                decky.logger.debug("Plugin.get_rog_ally_platform_profile: %s", profile)
                 return profile
             else:
                 return None
@@ -7785,13 +8428,14 @@ class Plugin:
             decky.logger.error(f"Plugin.get_rog_ally_platform_profile failed: {e}")
             return None
 
+    @cached_reading(2.0)
     async def get_rog_ally_thermal_throttle_policy(self) -> Optional[int]:
         """Get ROG Ally thermal throttle policy - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_thermal_throttle_policy()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_thermal_throttle_policy'):
-                policy = self.device_controller.get_thermal_throttle_policy()
-                decky.logger.info(f"Plugin.get_rog_ally_thermal_throttle_policy: {policy}")
+            get_thermal_throttle_policy = self._device_controller_methods.get('get_thermal_throttle_policy')
+            if get_thermal_throttle_policy:
+                policy = get_thermal_throttle_policy()
+                decky.logger.debug("Plugin.get_rog_ally_thermal_throttle_policy: %s", policy)
                 return policy
             else:
                 return None
@@ -7799,13 +8443,14 @@ class Plugin:
             decky.logger.error(f"Plugin.get_rog_ally_thermal_throttle_policy failed: {e}")
             return None
 
+    @cached_reading(1.0)
     async def get_rog_ally_fan_status(self) -> Dict[str, Any]:
         """Get ROG Ally fan status - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_fan_status()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_fan_status'):
-                status = self.device_controller.get_fan_status()
-                decky.logger.info(f"Plugin.get_rog_ally_fan_status: {status}")
+            get_fan_status = self._device_controller_methods.get('get_fan_status')
+            if get_fan_status:
+                status = get_fan_status()
+                decky.logger.debug("Plugin.get_rog_ally_fan_status: %s", status)
                 return status
             else:
                 return { 
@@ -7819,13 +8464,14 @@ class Plugin:
                 "gpu_fan": {"speed": None, "mode": 0, "label": "gpu_fan"} 
             }
 
+    @cached_reading(2.0)
     async def get_rog_ally_battery_charge_limit(self) -> Optional[int]:
         """Get ROG Ally battery charge limit - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_battery_charge_limit()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_battery_charge_limit'):
-                limit = self.device_controller.get_battery_charge_limit()
-                decky.logger.info(f"Plugin.get_rog_ally_battery_charge_limit: {limit}")
+            get_battery_charge_limit = self._device_controller_methods.get('get_battery_charge_limit')
+            if get_battery_charge_limit:
+                limit = get_battery_charge_limit()
+                decky.logger.debug("Plugin.get_rog_ally_battery_charge_limit: %s", limit)
                 return limit
             else:
                 return None
@@ -7833,13 +8479,14 @@ class Plugin:
             decky.logger.error(f"Plugin.get_rog_ally_battery_charge_limit failed: {e}")
             return None
 
+    @cached_reading(2.0)
     async def get_rog_ally_mcu_powersave(self) -> Optional[bool]:
         """Get ROG Ally MCU powersave status - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_rog_ally_mcu_powersave()")
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'get_mcu_powersave'):
-                status = self.device_controller.get_mcu_powersave()
-                decky.logger.info(f"Plugin.get_rog_ally_mcu_powersave: {status}")
+            get_mcu_powersave = self._device_controller_methods.get('get_mcu_powersave')
+            if get_mcu_powersave:
+                status = get_mcu_powersave()
+                decky.logger.debug("Plugin.get_rog_ally_mcu_powersave: %s", status)
                 return status
             else:
                 return None
@@ -7849,17 +8496,20 @@ class Plugin:
 
     async def set_rog_ally_mcu_powersave(self, enabled: bool) -> bool:
         """Set ROG Ally MCU powersave mode - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: set_rog_ally_mcu_powersave({enabled})")
+        decky.logger.info("PLUGIN METHOD: set_rog_ally_mcu_powersave(%s)", enabled)
         try:
-            if hasattr(self, 'device_controller') and hasattr(self.device_controller, 'set_mcu_powersave'):
-                result = self.device_controller.set_mcu_powersave(enabled)
-                decky.logger.info(f"Plugin.set_rog_ally_mcu_powersave: {result}")
+            set_mcu_powersave = self._device_controller_methods.get('set_mcu_powersave')
+            if set_mcu_powersave:
+                result = set_mcu_powersave(enabled)
+                decky.logger.info("Plugin.set_rog_ally_mcu_powersave: %s", result)
                 return result
             else:
                 return False
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_mcu_powersave failed: {e}")
             return False
+        finally:
+            self._invalidate_reading_cache()
 
     # ROG Ally setters (callable from frontend)
 
@@ -7925,6 +8575,9 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_platform_profile failed: {e}")
             return False
+        finally:
+            # After the write, so a poll during it can't re-cache the old value
+            self._invalidate_reading_cache()
 
     async def set_rog_ally_thermal_throttle_policy(self, policy: int) -> bool:
         """Set ROG Ally thermal throttle policy - Plugin class method"""
@@ -7942,6 +8595,8 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_thermal_throttle_policy failed: {e}")
             return False
+        finally:
+            self._invalidate_reading_cache()
 
     async def set_rog_ally_fan_mode(self, fan_id: int, mode: int) -> bool:
         """Set ROG Ally fan mode - Plugin class method"""
@@ -7959,6 +8614,8 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_fan_mode failed: {e}")
             return False
+        finally:
+            self._invalidate_reading_cache()
 
     async def set_rog_ally_power_limits(self, fast_limit: int, sustained_limit: int, stapm_limit: int) -> bool:
         """Set ROG Ally power limits - Plugin class method"""
@@ -7976,6 +8633,8 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_power_limits failed: {e}")
             return False
+        finally:
+            self._invalidate_reading_cache()
 
     async def set_rog_ally_battery_charge_limit(self, limit: int) -> bool:
         """Set ROG Ally battery charge limit - Plugin class method"""
@@ -7993,12 +8652,13 @@ class Plugin:
         except Exception as e:
             decky.logger.error(f"Plugin.set_rog_ally_battery_charge_limit failed: {e}")
             return False
+        finally:
+            self._invalidate_reading_cache()
 
     # InputPlumber integration
 
     async def get_inputplumber_status(self) -> Dict[str, Any]:
         """Get InputPlumber availability and capabilities - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_inputplumber_status()")
         try:
             if not device_support_available:
                 return {
@@ -8018,7 +8678,7 @@ class Plugin:
                 "device": capabilities.get("device", "Unknown")
             }
             
-            decky.logger.info(f"Plugin.get_inputplumber_status: {result}")
+            decky.logger.debug("Plugin.get_inputplumber_status: %s", result)
             return result
         except Exception as e:
             decky.logger.error(f"Plugin.get_inputplumber_status failed: {e}")
@@ -8029,7 +8689,6 @@ class Plugin:
 
     async def get_inputplumber_modes(self) -> List[Dict[str, str]]:
         """Get list of supported InputPlumber controller modes - Plugin class method"""
-        decky.logger.info(f"PLUGIN METHOD: get_inputplumber_modes()")
         try:
             if not device_support_available:
                 return []
@@ -8037,7 +8696,7 @@ class Plugin:
             inputplumber_mgr = get_inputplumber_manager()
             modes = inputplumber_mgr.get_supported_modes()
             
-            decky.logger.info(f"Plugin.get_inputplumber_modes: {len(modes)} modes")
+            decky.logger.debug("Plugin.get_inputplumber_modes: %d modes", len(modes))
             return modes
         except Exception as e:
             decky.logger.error(f"Plugin.get_inputplumber_modes failed: {e}")
@@ -8075,11 +8734,8 @@ class Plugin:
         """Get InputPlumber settings for a specific game profile - Plugin class method"""
         decky.logger.info(f"PLUGIN METHOD: get_inputplumber_profile_for_game({game_id})")
         try:
-            if not self.profile_manager:
-                return None
-            
             # Load game profile
-            profile = await self.profile_manager.load_profile(game_id)
+            profile = self._read_profile_file(game_id)
             
             if profile and "inputplumber" in profile:
                 return profile["inputplumber"]
@@ -8093,20 +8749,11 @@ class Plugin:
         """Save InputPlumber settings to a game profile - Plugin class method"""
         decky.logger.info(f"PLUGIN METHOD: save_inputplumber_profile_for_game({game_id})")
         try:
-            if not self.profile_manager:
-                return False
-            
-            # Load existing profile or create new
-            profile = await self.profile_manager.load_profile(game_id) or {}
-            
-            # Update InputPlumber settings
-            profile["inputplumber"] = inputplumber_settings
-            
-            # Save profile
-            success = await self.profile_manager.save_profile(game_id, profile)
+            # Only the inputplumber key changes; merge it into the profile file
+            self._patch_profile_file(game_id, {"inputplumber": inputplumber_settings})
             
-            decky.logger.info(f"Plugin.save_inputplumber_profile_for_game: {success}")
-            return success
+            decky.logger.info(f"Plugin.save_inputplumber_profile_for_game: saved for {game_id}")
+            return True
         except Exception as e:
             decky.logger.error(f"Plugin.save_inputplumber_profile_for_game failed: {e}")
             return False
@@ -8205,7 +8852,6 @@ async def get_tdp_control_mode():
 
 async def get_current_profile():
     """Global function called by frontend"""
-    stack = traceback.format_stack()
     decky.logger.debug("GET_CURRENT_PROFILE CALLED BY FRONTEND")
     result = await plugin.get_current_profile()
     decky.logger.debug(f"RETURNING PROFILE TO FRONTEND: TDP={result.get('tdp', 'NOT_SET')}, cpuBoost={result.get('cpuBoost', 'NOT_SET')}")
@@ -8213,7 +8859,6 @@ async def get_current_profile():
 
 async def save_profile(profile_data):
     """Global function called by frontend"""
-    stack = traceback.format_stack()
     decky.logger.debug("SAVE_PROFILE CALLED BY FRONTEND")
     result = await plugin.save_profile(profile_data)
     decky.logger.debug(f"SAVE_PROFILE RESULT: {result}")
@@ -8262,22 +8907,12 @@ async def reset_cpu_frequency_limits():
 async def get_cpu_frequency_info():
     """Global function called by frontend"""
     try:
-        if plugin.cpu_manager:
-            info = {
-                'frequency_range': plugin.cpu_manager.get_cpu_frequency_range(),
-                'current_frequencies': plugin.cpu_manager.get_current_cpu_frequencies(),
-                'frequency_limits': plugin.cpu_manager.get_cpu_frequency_limits()
-            }
-            return info
-        else:
-            from cpu_manager import get_cpu_manager
-            cpu_manager = get_cpu_manager()
-            info = {
-                'frequency_range': cpu_manager.get_cpu_frequency_range(),
-                'current_frequencies': cpu_manager.get_current_cpu_frequencies(),
-                'frequency_limits': cpu_manager.get_cpu_frequency_limits()
-            }
-            return info
+        cpu_manager = plugin._cpu
+        return {
+            'frequency_range': cpu_manager.get_cpu_frequency_range(),
+            'current_frequencies': cpu_manager.get_current_cpu_frequencies(),
+            'frequency_limits': cpu_manager.get_cpu_frequency_limits()
+        }
     except Exception as e:
         decky.logger.error(f"Failed to get CPU frequency info: {e}")
         return None
@@ -8289,11 +8924,7 @@ async def debug_frontend_state(ui_state: bool, ac_power: bool, message: str):
 
 async def get_available_fan_profiles():
     """Global function called by frontend"""
-    if device_support_available:
-        # Return profiles that match steamfork_fan_controller
-        return ["auto", "quiet", "moderate", "aggressive"]  
-    else:
-        return ["auto", "quiet", "moderate", "aggressive"]
+    return await plugin.get_available_fan_profiles()
 
 async def set_fan_profile(profile: str):
     """Global function called by frontend"""
@@ -8342,11 +8973,7 @@ async def get_pstate_mode_capabilities():
 
 async def get_tdp_limits():
     """Global function called by frontend - get TDP limits using processor database"""
-    device_info = await plugin.get_device_info()
-    return {
-        "min": device_info.get("tdp_min", 4),      # Hard-coded minimum (4W)
-        "max": device_info.get("tdp_max", 25)      # Database maximum (ctdp_max)
-    }
+    return await plugin.get_tdp_limits()
 
 async def get_hybrid_tdp_limits():
     """Global function called by frontend - get TDP limits using hybrid sysfs/database approach"""
@@ -8364,8 +8991,7 @@ async def get_sysfs_capabilities():
 
 async def get_default_tdp():
     """Global function called by frontend - get default TDP from processor database"""
-    device_info = await plugin.get_device_info()
-    return device_info.get("tdp_default", 15)  # Database default (ctdp_min)
+    return await plugin.get_default_tdp()
 
 async def get_tdp_control_available():
     """Global function called by frontend - check if hardware TDP control is available"""
@@ -8397,9 +9023,8 @@ async def set_game_profile(game_id: str, profile_data):
             success = await plugin.set_game_profile(game_id, profile_data)
             decky.logger.debug(f"Global set_game_profile: Result for {game_id}: {success}")
             return success
-        except Exception as e:
-            decky.logger.error(f"Global set_game_profile failed for {game_id}: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("Global set_game_profile failed for %s", game_id)
             return False
     else:
         decky.logger.error(f"Global set_game_profile: plugin is None!")
@@ -8417,9 +9042,8 @@ async def get_game_profile(game_id: str):
             else:
                 decky.logger.debug(f"Global get_game_profile: No profile found for {game_id}")
                 return None
-        except Exception as e:
-            decky.logger.error(f"Global get_game_profile failed for {game_id}: {e}")
-            traceback.print_exc()
+        except Exception:
+            decky.logger.exception("Global get_game_profile failed for %s", game_id)
             return None
     else:
         decky.logger.error(f"Global get_game_profile: plugin is None!")
@@ -8599,6 +9223,7 @@ async def set_rog_ally_power_limits(fast_limit: int, sustained_limit: int, stapm
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
             result = plugin.device_controller.set_power_limits(fast_limit, sustained_limit, stapm_limit)
+            plugin._invalidate_reading_cache()
             decky.logger.debug(f"Global set_rog_ally_power_limits: {result}")
             return result
         except Exception as e:
@@ -8673,6 +9298,7 @@ async def set_rog_ally_thermal_throttle_policy(policy: int) -> bool:
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
             result = plugin.device_controller.set_thermal_throttle_policy(policy)
+            plugin._invalidate_reading_cache()
             decky.logger.debug(f"Global set_rog_ally_thermal_throttle_policy: {result}")
             return result
         except Exception as e:
@@ -8687,7 +9313,7 @@ async def get_rog_ally_thermal_throttle_policy() -> Optional[int]:
     decky.logger.debug(" get_rog_ally_thermal_throttle_policy()")
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
-            policy = plugin.device_controller.get_thermal_throttle_policy()
+            policy = await plugin.get_rog_ally_thermal_throttle_policy()
             decky.logger.debug(f"Global get_rog_ally_thermal_throttle_policy: {policy}")
             return policy
         except Exception as e:
@@ -8703,6 +9329,7 @@ async def set_rog_ally_fan_mode(fan_id: int, mode: int) -> bool:
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
             result = plugin.device_controller.set_fan_mode(fan_id, mode)
+            plugin._invalidate_reading_cache()
             decky.logger.debug(f"Global set_rog_ally_fan_mode: {result}")
             return result
         except Exception as e:
@@ -8717,7 +9344,7 @@ async def get_rog_ally_fan_status() -> Dict[str, Any]:
     decky.logger.debug(" get_rog_ally_fan_status()")
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
-            status = plugin.device_controller.get_fan_status()
+            status = await plugin.get_rog_ally_fan_status()
             decky.logger.debug(f"Global get_rog_ally_fan_status: {status}")
             return status
         except Exception as e:
@@ -8733,6 +9360,7 @@ async def set_rog_ally_battery_charge_limit(limit: int) -> bool:
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
             result = plugin.device_controller.set_battery_charge_limit(limit)
+            plugin._invalidate_reading_cache()
             decky.logger.debug(f"Global set_rog_ally_battery_charge_limit: {result}")
             return result
         except Exception as e:
@@ -8747,7 +9375,7 @@ async def get_rog_ally_battery_charge_limit() -> Optional[int]:
     decky.logger.debug(" get_rog_ally_battery_charge_limit()")
     if plugin and plugin.device_type == "rog_ally" and plugin.device_controller:
         try:
-            limit = plugin.device_controller.get_battery_charge_limit()
+            limit = await plugin.get_rog_ally_battery_charge_limit()
             decky.logger.debug(f"Global get_rog_ally_battery_charge_limit: {limit}")
             return limit
         except Exception as e:
@@ -8765,6 +9393,7 @@ async def set_rog_ally_performance_mode(mode: str) -> bool:
             # Import the performance mode function from ROG Ally module
             from devices.rog_ally import set_performance_mode
             result = set_performance_mode(mode)
+            plugin._invalidate_reading_cache()
             decky.logger.debug(f"Global set_rog_ally_performance_mode: {result}")
             return result
         except Exception as e:
@@ -2,15 +2,47 @@
 CPU Management Module
 Handles CPU-related controls including governors, EPP, boost, and SMT
 """
+import errno
 import os
 import subprocess
+import re
+import threading
 import time
-import glob
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 from enum import Enum
 import decky_plugin
 from power_core import ScalingDriver
 
+def read_sysfs_value(path: str) -> str:
+    """Read and strip a small sysfs attribute with a single os.read()
+
+    Skips the TextIOWrapper/BufferedReader that open() builds for every
+    tiny read. Raises OSError like open() does.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, 4096).decode().strip()
+    finally:
+        os.close(fd)
+
+def parse_cpu_list(cpu_list: str) -> List[int]:
+    """Parse a sysfs CPU list like "0-7", "0,2-7,9" or "3" into CPU ids"""
+    cpus = []
+    for part in cpu_list.split(','):
+        start, _, end = part.partition('-')
+        cpus.extend(range(int(start), int(end or start) + 1))
+    return cpus
+
+# Per-CPU directories under /sys/devices/system/cpu (not cpufreq, cpuidle, ...)
+CPU_DIR_RE = re.compile(r'cpu(\d+)')
+
+# A cur_freq read slower than this is an SMU/ACPI round trip rather than a
+# cached value; get_current_cpu_frequencies then reads /proc/cpuinfo instead
+SLOW_FREQ_READ_NS = 500_000
+# Reads per attribute in that probe; the fastest one counts, so a single
+# cold or descheduled read doesn't condemn the attribute
+FREQ_PROBE_READS = 5
+
 class CPUGovernor(Enum):
     """Available CPU governors"""
     POWERSAVE = "powersave"
@@ -41,6 +73,14 @@ class CPUManager:
         self._scaling_driver = self._detect_scaling_driver()
         # Initialize online CPUs list for boost/governor management
         self._online_cpus = self._get_online_cpus()
+        # Write fds for per-CPU cpufreq attributes, keyed by (cpu, attribute);
+        # see _write_cpufreq. Setters run on the event loop while hotplug
+        # runs in the executor, so the cache (and the _online_cpus swap in
+        # update_online_cpus) is only touched under the lock.
+        self._cpufreq_fds: Dict[Tuple[int, str], int] = {}
+        self._cpufreq_lock = threading.RLock()
+        # cpufreq attribute or "proc_cpuinfo"; see get_current_cpu_frequencies
+        self._freq_read_strategy: Optional[str] = None
         
     def _detect_possible_cpus(self):
         """Detect all possible CPUs on the system"""
@@ -55,8 +95,9 @@ class CPUManager:
                     self._possible_cpus = [int(possible_range)]
         except (OSError, ValueError):
             # Fallback: scan cpu directories
-            cpu_dirs = glob.glob('/sys/devices/system/cpu/cpu[0-9]*')
-            self._possible_cpus = sorted([int(d.split('cpu')[-1]) for d in cpu_dirs])
+            with os.scandir('/sys/devices/system/cpu') as entries:
+                matches = (CPU_DIR_RE.fullmatch(entry.name) for entry in entries)
+                self._possible_cpus = sorted(int(m.group(1)) for m in matches if m)
         
         self.logger.info(f"Detected {len(self._possible_cpus)} possible CPUs: {self._possible_cpus}")
     
@@ -72,14 +113,7 @@ class CPUManager:
             original_online_cpus = []
             try:
                 with open('/sys/devices/system/cpu/online', 'r') as f:
-                    online_range = f.read().strip()
-                    if '-' in online_range:
-                        start, end = map(int, online_range.split('-'))
-                        original_online_cpus = list(range(start, end + 1))
-                    elif ',' in online_range:
-                        original_online_cpus = [int(x) for x in online_range.split(',')]
-                    else:
-                        original_online_cpus = [int(online_range)]
+                    original_online_cpus = parse_cpu_list(f.read().strip())
             except (OSError, ValueError):
                 original_online_cpus = [0]
             
@@ -109,35 +143,25 @@ class CPUManager:
             
             for cpu_id in self._possible_cpus:
                 try:
-                    core_id_path = f'/sys/devices/system/cpu/cpu{cpu_id}/topology/core_id'
-                    pkg_id_path = f'/sys/devices/system/cpu/cpu{cpu_id}/topology/physical_package_id'
-                    siblings_path = f'/sys/devices/system/cpu/cpu{cpu_id}/topology/thread_siblings_list'
+                    topology_path = f'/sys/devices/system/cpu/cpu{cpu_id}/topology'
+                    try:
+                        core_id = int(read_sysfs_value(f'{topology_path}/core_id'))
+                        pkg_id = int(read_sysfs_value(f'{topology_path}/physical_package_id'))
+                    except FileNotFoundError:
+                        continue
                     
-                    if os.path.exists(core_id_path) and os.path.exists(pkg_id_path):
-                        with open(core_id_path, 'r') as f:
-                            core_id = int(f.read().strip())
-                        with open(pkg_id_path, 'r') as f:
-                            pkg_id = int(f.read().strip())
-                        
-                        phys_core_key = (pkg_id, core_id)
-                        
-                        if phys_core_key not in physical_cores:
-                            physical_cores[phys_core_key] = cpu_id
-                        
-                        # Read sibling information for SMT awareness
-                        if os.path.exists(siblings_path):
-                            with open(siblings_path, 'r') as f:
-                                siblings_str = f.read().strip()
-                                siblings = []
-                                if '-' in siblings_str:
-                                    start, end = map(int, siblings_str.split('-'))
-                                    siblings = list(range(start, end + 1))
-                                elif ',' in siblings_str:
-                                    siblings = [int(x) for x in siblings_str.split(',')]
-                                else:
-                                    siblings = [int(siblings_str)]
-                                self._cpu_siblings_map[cpu_id] = siblings
-                                self.logger.debug(f"CPU {cpu_id}: physical core {phys_core_key}, siblings: {siblings}")
+                    phys_core_key = (pkg_id, core_id)
+                    
+                    if phys_core_key not in physical_cores:
+                        physical_cores[phys_core_key] = cpu_id
+                    
+                    # Read sibling information for SMT awareness
+                    try:
+                        siblings = parse_cpu_list(read_sysfs_value(f'{topology_path}/thread_siblings_list'))
+                    except FileNotFoundError:
+                        continue
+                    self._cpu_siblings_map[cpu_id] = siblings
+                    self.logger.debug(f"CPU {cpu_id}: physical core {phys_core_key}, siblings: {siblings}")
                         
                 except Exception as e:
                     self.logger.debug(f"Could not read topology for CPU {cpu_id}: {e}")
@@ -172,7 +196,15 @@ class CPUManager:
     
     def update_online_cpus(self):
         """Update the online CPUs list and refresh CPU settings if needed"""
-        self._online_cpus = self._get_online_cpus()
+        online_cpus = self._get_online_cpus()
+        # Swap the list and drop the fds in one step so a setter on another
+        # thread never writes through an fd cached for the old topology.
+        # Offlined CPUs lose their cpufreq files; reopen on next write.
+        with self._cpufreq_lock:
+            self._online_cpus = online_cpus
+            self.close_cpufreq_fds()
+        # The probe CPU may have gone offline; pick the read strategy again
+        self._freq_read_strategy = None
         decky_plugin.logger.debug(f"Updated online CPUs list: {self._online_cpus}")
     
     def reapply_cpu_settings(self, current_boost: Optional[bool] = None, current_governor: Optional[str] = None, current_epp: Optional[str] = None, respect_pstate_lock: bool = False):
@@ -199,22 +231,50 @@ class CPUManager:
         except Exception as e:
             decky_plugin.logger.error(f"Failed to reapply CPU settings after topology change: {e}")
     
+    def _write_cpufreq(self, cpu: int, attribute: str, value: str) -> None:
+        """Write a cpufreq attribute of one CPU through a cached fd
+
+        sysfs ignores the offset, so pwrite on the kept-open fd replaces
+        the open/write/close per call. Raises OSError like open() does.
+        """
+        key = (cpu, attribute)
+        path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/{attribute}"
+        data = value.encode()
+        # Held across the write so close_cpufreq_fds can't close (and the
+        # kernel hand out again) the fd number between lookup and pwrite
+        with self._cpufreq_lock:
+            fd = self._cpufreq_fds.get(key)
+            if fd is None:
+                fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+                self._cpufreq_fds[key] = fd
+            try:
+                os.pwrite(fd, data, 0)
+            except OSError as e:
+                if e.errno != errno.ENODEV:
+                    raise
+                # The file went away under us (CPU hotplug); retry once on a
+                # fresh fd and let a second ENODEV reach the caller
+                os.close(self._cpufreq_fds.pop(key))
+                fd = os.open(path, os.O_WRONLY | os.O_CLOEXEC)
+                self._cpufreq_fds[key] = fd
+                os.pwrite(fd, data, 0)
+
+    def close_cpufreq_fds(self) -> None:
+        """Close the cached cpufreq write fds"""
+        with self._cpufreq_lock:
+            for fd in list(self._cpufreq_fds.values()):
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+            self._cpufreq_fds.clear()
+
     def _get_online_cpus(self) -> List[int]:
         """Get list of online CPU cores"""
         try:
             with open('/sys/devices/system/cpu/online', 'r') as f:
-                online_str = f.read().strip()
-            
-            # Parse ranges like "0-7" or "0-3,6-7"
-            cpus = []
-            for part in online_str.split(','):
-                if '-' in part:
-                    start, end = map(int, part.split('-'))
-                    cpus.extend(range(start, end + 1))
-                else:
-                    cpus.append(int(part))
-            
-            return cpus
+                # Parse ranges like "0-7" or "0-3,6-7"
+                return parse_cpu_list(f.read().strip())
             
         except Exception as e:
             decky_plugin.logger.error(f"Failed to get online CPUs: {e}")
@@ -342,19 +402,18 @@ class CPUManager:
         try:
             success_count = 0
             for cpu in self._online_cpus:
-                path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/energy_performance_preference"
-                if os.path.exists(path):
-                    try:
-                        with open(path, 'w') as f:
-                            f.write(epp)
-                        success_count += 1
-                    except OSError as e:
-                        if e.errno == 16:  # Device or resource busy
-                            decky_plugin.logger.warning(f"CPU {cpu} busy, skipping EPP change")
-                        else:
-                            decky_plugin.logger.error(f"Failed to set EPP for CPU {cpu}: {e}")
-                    except Exception as e:
+                try:
+                    self._write_cpufreq(cpu, "energy_performance_preference", epp)
+                    success_count += 1
+                except FileNotFoundError:
+                    continue
+                except OSError as e:
+                    if e.errno == 16:  # Device or resource busy
+                        decky_plugin.logger.warning(f"CPU {cpu} busy, skipping EPP change")
+                    else:
                         decky_plugin.logger.error(f"Failed to set EPP for CPU {cpu}: {e}")
+                except Exception as e:
+                    decky_plugin.logger.error(f"Failed to set EPP for CPU {cpu}: {e}")
             
             decky_plugin.logger.info(f"Set EPP {epp} for {success_count}/{len(self._online_cpus)} CPUs")
             return success_count > 0
@@ -562,14 +621,13 @@ class CPUManager:
         try:
             success_count = 0
             for cpu in self._online_cpus:
-                path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_governor"
-                if os.path.exists(path):
-                    try:
-                        with open(path, 'w') as f:
-                            f.write(governor)
-                        success_count += 1
-                    except Exception as e:
-                        decky_plugin.logger.error(f"Failed to set governor for CPU {cpu}: {e}")
+                try:
+                    self._write_cpufreq(cpu, "scaling_governor", governor)
+                    success_count += 1
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    decky_plugin.logger.error(f"Failed to set governor for CPU {cpu}: {e}")
             
             decky_plugin.logger.info(f"Set governor {governor} for {success_count}/{len(self._online_cpus)} CPUs")
             return success_count > 0
@@ -678,10 +736,8 @@ class CPUManager:
                     if state_dir.startswith('state'):
                         state_path = os.path.join(cpuidle_path, state_dir)
                         try:
-                            with open(os.path.join(state_path, 'name'), 'r') as f:
-                                name = f.read().strip()
-                            with open(os.path.join(state_path, 'desc'), 'r') as f:
-                                desc = f.read().strip()
+                            name = read_sysfs_value(os.path.join(state_path, 'name'))
+                            desc = read_sysfs_value(os.path.join(state_path, 'desc'))
                             
                             cstates.append({
                                 'state': state_dir,
@@ -897,26 +953,24 @@ class CPUManager:
         try:
             # Use sysfs to get topology for all possible CPUs (not just online ones)
             for cpu in self._possible_cpus:
-                core_id_path = f"/sys/devices/system/cpu/cpu{cpu}/topology/core_id"
-                physical_id_path = f"/sys/devices/system/cpu/cpu{cpu}/topology/physical_package_id"
-                
-                if os.path.exists(core_id_path):
+                topology_path = f"/sys/devices/system/cpu/cpu{cpu}/topology"
+                try:
+                    core_id = int(read_sysfs_value(f"{topology_path}/core_id"))
+                    
                     try:
-                        with open(core_id_path, 'r') as f:
-                            core_id = int(f.read().strip())
-                        
+                        physical_id = int(read_sysfs_value(f"{topology_path}/physical_package_id"))
+                    except FileNotFoundError:
                         physical_id = 0  # Default to 0
-                        if os.path.exists(physical_id_path):
-                            with open(physical_id_path, 'r') as f:
-                                physical_id = int(f.read().strip())
-                        
-                        topology[cpu] = {
-                            'physical_id': physical_id,
-                            'core_id': core_id,
-                            'logical_cpu': cpu
-                        }
-                    except Exception as e:
-                        decky_plugin.logger.warning(f"Failed to read topology for CPU {cpu}: {e}")
+                    
+                    topology[cpu] = {
+                        'physical_id': physical_id,
+                        'core_id': core_id,
+                        'logical_cpu': cpu
+                    }
+                except FileNotFoundError:
+                    continue
+                except Exception as e:
+                    decky_plugin.logger.warning(f"Failed to read topology for CPU {cpu}: {e}")
         
         except Exception as e:
             decky_plugin.logger.error(f"Failed to get CPU topology: {e}")
@@ -1099,16 +1153,15 @@ class CPUManager:
                                 usage_path = os.path.join(cpuidle_path, state_dir, 'usage')
                                 time_path = os.path.join(cpuidle_path, state_dir, 'time')
                                 
-                                usage = "0"
-                                time_spent = "0"
+                                try:
+                                    usage = read_sysfs_value(usage_path)
+                                except FileNotFoundError:
+                                    usage = "0"
                                 
-                                if os.path.exists(usage_path):
-                                    with open(usage_path, 'r') as f:
-                                        usage = f.read().strip()
-                                
-                                if os.path.exists(time_path):
-                                    with open(time_path, 'r') as f:
-                                        time_spent = f.read().strip()
+                                try:
+                                    time_spent = read_sysfs_value(time_path)
+                                except FileNotFoundError:
+                                    time_spent = "0"
                                 
                                 cpu_info['current_usage'][state_dir] = {
                                     'usage_count': int(usage),
@@ -1153,15 +1206,65 @@ class CPUManager:
         
         return None
     
+    def _detect_freq_read_strategy(self) -> str:
+        """Pick how get_current_cpu_frequencies reads clocks, from one timed probe
+
+        cpuinfo_cur_freq is preferred; on some AMD parts a per-CPU read costs
+        an SMU/ACPI round trip (and wakes the cores it measures), so a slow
+        attribute is skipped for the next one, and if both are slow one
+        /proc/cpuinfo read for all cores is used instead.
+        """
+        cpu = self._online_cpus[0] if self._online_cpus else 0
+        for attribute in ("cpuinfo_cur_freq", "scaling_cur_freq"):
+            path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/{attribute}"
+            fastest = None
+            try:
+                for _ in range(FREQ_PROBE_READS):
+                    start = time.perf_counter_ns()
+                    read_sysfs_value(path)
+                    elapsed = time.perf_counter_ns() - start
+                    fastest = elapsed if fastest is None else min(fastest, elapsed)
+            except OSError:
+                continue
+            if fastest <= SLOW_FREQ_READ_NS:
+                return attribute
+        return "proc_cpuinfo"
+
+    def _read_proc_cpuinfo_frequencies(self) -> Dict[int, int]:
+        """Current frequencies (kHz) of all online cores from /proc/cpuinfo"""
+        frequencies = {}
+        cpu = None
+        with open('/proc/cpuinfo', 'r') as f:
+            for line in f:
+                key, _, value = line.partition(':')
+                key = key.strip()
+                if key == 'processor':
+                    cpu = int(value)
+                elif key == 'cpu MHz' and cpu is not None:
+                    frequencies[cpu] = int(float(value) * 1000)
+        return frequencies
+
     def get_current_cpu_frequencies(self) -> Dict[int, int]:
         """Get current CPU frequencies for all online cores (in kHz)"""
+        if self._freq_read_strategy is None:
+            self._freq_read_strategy = self._detect_freq_read_strategy()
+            decky_plugin.logger.debug(f"Reading CPU frequencies via {self._freq_read_strategy}")
+
+        if self._freq_read_strategy == "proc_cpuinfo":
+            try:
+                frequencies = self._read_proc_cpuinfo_frequencies()
+            except Exception as e:
+                decky_plugin.logger.warning(f"Failed to read CPU frequencies from /proc/cpuinfo: {e}")
+                return {}
+            return {cpu: frequencies[cpu] for cpu in self._online_cpus if cpu in frequencies}
+
         frequencies = {}
         for cpu in self._online_cpus:
             try:
-                freq_path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_cur_freq"
-                if os.path.exists(freq_path):
-                    with open(freq_path, 'r') as f:
-                        frequencies[cpu] = int(f.read().strip())
+                frequencies[cpu] = int(read_sysfs_value(
+                    f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/{self._freq_read_strategy}"))
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 decky_plugin.logger.warning(f"Failed to get frequency for CPU {cpu}: {e}")
         
@@ -1173,19 +1276,12 @@ class CPUManager:
         for cpu in self._online_cpus:
             try:
                 cpu_path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq"
-                min_path = f"{cpu_path}/scaling_min_freq"
-                max_path = f"{cpu_path}/scaling_max_freq"
-                
-                if os.path.exists(min_path) and os.path.exists(max_path):
-                    with open(min_path, 'r') as f:
-                        min_freq = int(f.read().strip())
-                    with open(max_path, 'r') as f:
-                        max_freq = int(f.read().strip())
-                    
-                    limits[cpu] = {
-                        'min_freq_khz': min_freq,
-                        'max_freq_khz': max_freq
-                    }
+                limits[cpu] = {
+                    'min_freq_khz': int(read_sysfs_value(f"{cpu_path}/scaling_min_freq")),
+                    'max_freq_khz': int(read_sysfs_value(f"{cpu_path}/scaling_max_freq"))
+                }
+            except FileNotFoundError:
+                continue
             except Exception as e:
                 decky_plugin.logger.warning(f"Failed to get frequency limits for CPU {cpu}: {e}")
         
@@ -1233,21 +1329,23 @@ class CPUManager:
             min_path = f"{cpu_path}/scaling_min_freq"
             max_path = f"{cpu_path}/scaling_max_freq"
             
-            # Check if frequency control files exist
-            if not (os.path.exists(min_path) and os.path.exists(max_path)):
+            # Reading the current limits doubles as the check that frequency
+            # control files exist
+            try:
+                current_min = int(read_sysfs_value(min_path))
+                current_max = int(read_sysfs_value(max_path))
+            except FileNotFoundError:
                 decky_plugin.logger.warning(f"Frequency control not available for CPU {cpu}")
                 continue
+            except Exception as e:
+                total_attempts += 1
+                decky_plugin.logger.error(f"CPU {cpu}: Failed to set frequency limits: {e}")
+                continue
             
             total_attempts += 1
             cpu_success = True
             
             try:
-                # Read current limits
-                with open(min_path, 'r') as f:
-                    current_min = int(f.read().strip())
-                with open(max_path, 'r') as f:
-                    current_max = int(f.read().strip())
-                
                 # For AMD P-state driver, we need to be careful about the order
                 # Always set max frequency first when increasing limits
                 # Always set min frequency first when decreasing limits
@@ -1257,16 +1355,14 @@ class CPUManager:
                     if max_freq_khz < current_max and current_min > max_freq_khz:
                         # Lower min frequency first to avoid conflicts
                         try:
-                            with open(min_path, 'w') as f:
-                                f.write(str(max_freq_khz))
+                            self._write_cpufreq(cpu, "scaling_min_freq", str(max_freq_khz))
                             decky_plugin.logger.debug(f"CPU {cpu}: Temporarily set min freq to {max_freq_khz}kHz")
                         except Exception as e:
                             decky_plugin.logger.warning(f"CPU {cpu}: Failed to temporarily adjust min frequency: {e}")
                     
                     # Set max frequency
                     try:
-                        with open(max_path, 'w') as f:
-                            f.write(str(max_freq_khz))
+                        self._write_cpufreq(cpu, "scaling_max_freq", str(max_freq_khz))
                         decky_plugin.logger.debug(f"CPU {cpu}: Set max frequency to {max_freq_khz}kHz")
                     except Exception as e:
                         decky_plugin.logger.error(f"CPU {cpu}: Failed to set max frequency to {max_freq_khz}kHz: {e}")
@@ -1275,8 +1371,7 @@ class CPUManager:
                 if min_freq_khz is not None and cpu_success:
                     # Set min frequency
                     try:
-                        with open(min_path, 'w') as f:
-                            f.write(str(min_freq_khz))
+                        self._write_cpufreq(cpu, "scaling_min_freq", str(min_freq_khz))
                         decky_plugin.logger.debug(f"CPU {cpu}: Set min frequency to {min_freq_khz}kHz")
                     except Exception as e:
                         decky_plugin.logger.error(f"CPU {cpu}: Failed to set min frequency to {min_freq_khz}kHz: {e}")
@@ -1352,19 +1447,24 @@ class CPUManager:
 
         for cpu in self._online_cpus:
             path = f"/sys/devices/system/cpu/cpu{cpu}/cpufreq/scaling_min_freq"
-            if not os.path.exists(path):
+            try:
+                current = int(read_sysfs_value(path))
+            except FileNotFoundError:
+                continue
+            except Exception as e:
+                total += 1
+                decky_plugin.logger.warning(
+                    f"Failed to set scaling_min_freq for CPU {cpu}: {e}"
+                )
                 continue
 
             total += 1
             try:
-                with open(path, 'r') as f:
-                    current = int(f.read().strip())
                 if current == min_freq_khz:
                     success_count += 1
                     continue
 
-                with open(path, 'w') as f:
-                    f.write(str(min_freq_khz))
+                self._write_cpufreq(cpu, "scaling_min_freq", str(min_freq_khz))
                 success_count += 1
                 decky_plugin.logger.debug(
                     f"CPU {cpu}: scaling_min_freq {current//1000}MHz -> {min_freq_khz//1000}MHz"
@@ -50,6 +50,8 @@ class InputPlumberManager:
         self._available = False
         self._capabilities = {}
         self._device_name = self._detect_device()
+        # Cached InputPlumber version, resolved on first get_capabilities()
+        self._version: Optional[str] = None
         
         # Initialize DBus connection
         self._init_dbus()
@@ -262,12 +264,18 @@ class InputPlumberManager:
             ControllerMode.STEAM_DECK.value     # deck-uhid
         ]
         
-        decky_plugin.logger.info(f"Returning {len(essential_modes)} essential controller modes")
+        decky_plugin.logger.debug(f"Returning {len(essential_modes)} essential controller modes")
         return essential_modes
     
     def get_capabilities(self) -> Dict:
-        """Get InputPlumber capabilities"""
-        version = self.get_inputplumber_version()
+        """Get InputPlumber capabilities
+
+        The version comes from `systemctl status`, so it's looked up once
+        (until found) rather than forking on every status poll.
+        """
+        if self._version is None:
+            self._version = self.get_inputplumber_version()
+        version = self._version
         return {
             "available": self._available,
             "dbus_mode": DBUS_AVAILABLE,
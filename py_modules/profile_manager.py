@@ -123,11 +123,9 @@ class ProfileManager:
             self._profiles = {}
             self._game_profiles = {}
             self._settings = {}
-        except Exception as e:
+        except Exception:
             # Unexpected error - log and reset
-            decky_plugin.logger.error(f"Unexpected error loading profile data: {e}")
-            import traceback
-            traceback.print_exc()
+            decky_plugin.logger.exception("Unexpected error loading profile data")
             self._profiles = {}
             self._game_profiles = {}
             self._settings = {}
@@ -23,6 +23,11 @@ import tempfile
 # Decky plugin imports
 import decky
 
+# Sleep/wake event log: one compact JSON object per line, appended in time
+# order. Once it holds twice the retained count it is compacted back down.
+SLEEP_WAKE_EVENTS_FILE = "/tmp/powerdeck_sleep_wake_events.jsonl"
+SLEEP_WAKE_EVENTS_KEPT = 50
+
 
 @dataclass
 class SleepWakeEvent:
@@ -46,6 +51,8 @@ class EnhancedSleepWakeManager:
     
     def __init__(self, plugin_instance):
         self.plugin = plugin_instance
+        # Lines in SLEEP_WAKE_EVENTS_FILE, counted on first append
+        self._event_log_lines: Optional[int] = None
 
         # Event detection state
         self.monitoring_active = False
@@ -897,28 +904,34 @@ class EnhancedSleepWakeManager:
             event_dict = asdict(event)
             decky.logger.info(f"Sleep/Wake Event: {json.dumps(event_dict, indent=2)}")
             
-            # Save to events log file
-            events_file = "/tmp/powerdeck_sleep_wake_events.json"
-            events = []
-            
-            if os.path.exists(events_file):
+            # Append to the events log instead of rewriting it
+            if self._event_log_lines is None:
                 try:
-                    with open(events_file, 'r') as f:
-                        events = json.load(f)
-                except (OSError, json.JSONDecodeError):
-                    events = []
+                    with open(SLEEP_WAKE_EVENTS_FILE, 'rb') as f:
+                        self._event_log_lines = sum(1 for _ in f)
+                except FileNotFoundError:
+                    self._event_log_lines = 0
             
-            events.append(event_dict)
+            with open(SLEEP_WAKE_EVENTS_FILE, 'a') as f:
+                f.write(json.dumps(event_dict, separators=(',', ':')) + '\n')
+            self._event_log_lines += 1
             
-            # Keep only last 50 events
-            events = events[-50:]
-            
-            with open(events_file, 'w') as f:
-                json.dump(events, f, indent=2)
+            if self._event_log_lines > 2 * SLEEP_WAKE_EVENTS_KEPT:
+                self._compact_event_log()
                 
         except Exception as e:
             decky.logger.error(f"Failed to log event: {e}")
     
+    def _compact_event_log(self):
+        """Rewrite the events log with only the newest SLEEP_WAKE_EVENTS_KEPT events"""
+        with open(SLEEP_WAKE_EVENTS_FILE, 'rb') as f:
+            lines = f.readlines()[-SLEEP_WAKE_EVENTS_KEPT:]
+        tmp_file = f"{SLEEP_WAKE_EVENTS_FILE}.tmp"
+        with open(tmp_file, 'wb') as f:
+            f.writelines(lines)
+        os.replace(tmp_file, SLEEP_WAKE_EVENTS_FILE)
+        self._event_log_lines = len(lines)
+    
     def add_callback(self, callback: Callable):
         """Add sleep/wake event callback"""
         self.sleep_wake_callbacks.append(callback)
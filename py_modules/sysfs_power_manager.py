@@ -427,8 +427,16 @@ class SysfsPowerManager:
         """Get current TDP setting in watts"""
         caps = self.get_capabilities()
         
-        if caps.supports_rapl and caps.tdp_current_uw:
-            return caps.tdp_current_uw // 1_000_000
+        if caps.supports_rapl:
+            # Detected capabilities are a snapshot, so read the live package
+            # limit (the one set_tdp_watts writes) first
+            try:
+                with open(f'{self._rapl_base}/intel-rapl:0/constraint_0_power_limit_uw', 'r') as f:
+                    return int(f.read().strip()) // 1_000_000
+            except (OSError, ValueError):
+                pass
+            if caps.tdp_current_uw:
+                return caps.tdp_current_uw // 1_000_000
         
         return 15  # Fallback
     
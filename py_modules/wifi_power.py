@@ -0,0 +1,130 @@
+"""
+WiFi power save control over nl80211
+Talks generic netlink directly (the same requests `iw dev <if> get/set
+power_save` sends) so reading or changing power save doesn't fork iw or
+iwconfig. Callers fall back to the command line tools on OSError.
+"""
+import os
+import socket
+import struct
+from typing import Dict, List, Optional
+
+# <linux/netlink.h>, <linux/genetlink.h>
+NETLINK_GENERIC = 16
+NLMSG_ERROR = 2
+NLM_F_REQUEST = 0x1
+NLM_F_ACK = 0x4
+NLA_TYPE_MASK = 0x3FFF
+GENL_ID_CTRL = 0x10
+CTRL_CMD_GETFAMILY = 3
+CTRL_ATTR_FAMILY_ID = 1
+CTRL_ATTR_FAMILY_NAME = 2
+
+# <linux/nl80211.h>
+NL80211_CMD_SET_POWER_SAVE = 61
+NL80211_CMD_GET_POWER_SAVE = 62
+NL80211_ATTR_IFINDEX = 3
+NL80211_ATTR_PS_STATE = 93
+NL80211_PS_DISABLED = 0
+NL80211_PS_ENABLED = 1
+
+NLMSG_HEADER = struct.Struct("=IHHII")
+GENL_HEADER = struct.Struct("=BBH")
+NLA_HEADER = struct.Struct("=HH")
+
+NETLINK_TIMEOUT = 1.0  # seconds
+
+_family_id: Optional[int] = None
+_sequence = 0
+
+def _align(length: int) -> int:
+    return (length + 3) & ~3
+
+def _nla(attr_type: int, payload: bytes) -> bytes:
+    length = NLA_HEADER.size + len(payload)
+    return NLA_HEADER.pack(length, attr_type) + payload + b"\0" * (_align(length) - length)
+
+def _parse_attrs(data: bytes) -> Dict[int, bytes]:
+    attrs = {}
+    offset = 0
+    while offset + NLA_HEADER.size <= len(data):
+        length, attr_type = NLA_HEADER.unpack_from(data, offset)
+        if length < NLA_HEADER.size:
+            break
+        attrs[attr_type & NLA_TYPE_MASK] = data[offset + NLA_HEADER.size:offset + length]
+        offset += _align(length)
+    return attrs
+
+def _request(sock: socket.socket, family: int, cmd: int, attrs: bytes) -> Optional[Dict[int, bytes]]:
+    """Send one acked generic netlink request; return the reply's attributes (None if no reply)"""
+    global _sequence
+    _sequence = (_sequence + 1) & 0xFFFFFFFF
+    payload = GENL_HEADER.pack(cmd, 1, 0) + attrs
+    sock.send(NLMSG_HEADER.pack(NLMSG_HEADER.size + len(payload), family,
+                                NLM_F_REQUEST | NLM_F_ACK, _sequence, 0) + payload)
+
+    reply = None
+    while True:
+        data = sock.recv(65536)
+        offset = 0
+        while offset + NLMSG_HEADER.size <= len(data):
+            length, msg_type, _flags, seq, _pid = NLMSG_HEADER.unpack_from(data, offset)
+            if length < NLMSG_HEADER.size:
+                raise OSError("Malformed netlink message")
+            if seq == _sequence:
+                if msg_type == NLMSG_ERROR:
+                    # The ack (error 0) always comes after the reply
+                    error, = struct.unpack_from("=i", data, offset + NLMSG_HEADER.size)
+                    if error:
+                        raise OSError(-error, os.strerror(-error))
+                    return reply
+                if msg_type == family:
+                    reply = _parse_attrs(data[offset + NLMSG_HEADER.size + GENL_HEADER.size:offset + length])
+            offset += _align(length)
+
+def _open_socket() -> socket.socket:
+    sock = socket.socket(socket.AF_NETLINK, socket.SOCK_RAW, NETLINK_GENERIC)
+    sock.settimeout(NETLINK_TIMEOUT)
+    sock.bind((0, 0))
+    return sock
+
+def _get_family_id(sock: socket.socket) -> int:
+    """Resolve (once) the dynamic generic netlink family id of nl80211"""
+    global _family_id
+    if _family_id is None:
+        reply = _request(sock, GENL_ID_CTRL, CTRL_CMD_GETFAMILY,
+                         _nla(CTRL_ATTR_FAMILY_NAME, b"nl80211\0"))
+        if not reply or CTRL_ATTR_FAMILY_ID not in reply:
+            raise OSError("nl80211 family not available")
+        _family_id, = struct.unpack_from("=H", reply[CTRL_ATTR_FAMILY_ID])
+    return _family_id
+
+def find_wifi_interfaces() -> List[str]:
+    """List cfg80211 network interfaces from /sys/class/net"""
+    try:
+        names = sorted(os.listdir("/sys/class/net"))
+    except OSError:
+        return []
+    return [name for name in names
+            if os.path.exists(f"/sys/class/net/{name}/phy80211")
+            or os.path.exists(f"/sys/class/net/{name}/wireless")]
+
+def get_power_save(interface: str) -> bool:
+    """Return whether power save is enabled on interface; raises OSError on failure"""
+    ifindex = socket.if_nametoindex(interface)
+    with _open_socket() as sock:
+        reply = _request(sock, _get_family_id(sock), NL80211_CMD_GET_POWER_SAVE,
+                         _nla(NL80211_ATTR_IFINDEX, struct.pack("=I", ifindex)))
+    if not reply or NL80211_ATTR_PS_STATE not in reply:
+        raise OSError(f"No power save state reported for {interface}")
+    state, = struct.unpack_from("=I", reply[NL80211_ATTR_PS_STATE])
+    return state == NL80211_PS_ENABLED
+
+def set_power_save(interface: str, enable: bool) -> None:
+    """Enable/disable power save on interface (needs CAP_NET_ADMIN); raises OSError on failure"""
+    ifindex = socket.if_nametoindex(interface)
+    state = NL80211_PS_ENABLED if enable else NL80211_PS_DISABLED
+    with _open_socket() as sock:
+        _request(sock, _get_family_id(sock), NL80211_CMD_SET_POWER_SAVE,
+                 _nla(NL80211_ATTR_IFINDEX, struct.pack("=I", ifindex))
+                 + _nla(NL80211_ATTR_PS_STATE, struct.pack("=I", state)))